@@ -0,0 +1,203 @@
+"""
+Resident activation daemon for PasteWheel.
+
+Listens for the trigger selected by the ``input_mode`` setting and pops the
+pre-built, hidden :class:`RadialInterface` up at the cursor:
+
+* "keyboard" — ALT+` (``keyboard`` library hotkey)
+* "mouse"    — middle mouse button (``pynput`` listener).  Holding the
+  button and flicking towards a button selects it through the wheel's
+  marking menu; releasing fires it.
+
+The trigger is registered through :mod:`global_hooks`, so it runs in the
+hook host process when that is started, and on the hook libraries' own
+background threads otherwise.  Either way the callbacks only timestamp the
+trigger and emit a Qt signal; the signal is delivered to the GUI thread
+through a queued connection, where the wheel is shown.
+The time from trigger to the wheel's first paint is recorded in
+:attr:`ActivationDaemon.latency`.
+"""
+import collections
+import time
+from PyQt5.QtCore import QObject, Qt, QTimer, pyqtSignal
+from PyQt5.QtGui import QCursor
+from debug_logger import DebugLogger
+from pastewheel_config import PasteWheelConfig
+from config_events import INPUT_MODE_CHANGED, CONFIG_RELOADED
+import global_hooks
+
+# Set to True to enable debug logging to debug.txt
+DEBUG = False
+
+
+class LatencyStats:
+    """
+    Rolling trigger-to-first-paint latency samples, in milliseconds.
+
+    Args:
+        size: Number of most recent samples kept.
+    """
+
+    # One frame at 60 Hz
+    FRAME_BUDGET_MS = 1000 / 60
+
+    def __init__(self, size=256):
+        self.samples = collections.deque(maxlen=size)
+        self.over_budget = 0
+
+    def add(self, latency_ms):
+        self.samples.append(latency_ms)
+        if latency_ms > self.FRAME_BUDGET_MS:
+            self.over_budget += 1
+
+    def __len__(self):
+        return len(self.samples)
+
+    @property
+    def last(self):
+        return self.samples[-1] if self.samples else None
+
+    def percentile(self, fraction):
+        """Return the latency below which *fraction* (0..1) of samples fall."""
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+        return ordered[index]
+
+    def summary(self):
+        """Return a one-line human readable summary."""
+        if not self.samples:
+            return "no activations"
+        return (
+            f"n={len(self.samples)} last={self.last:.2f}ms "
+            f"p50={self.percentile(0.5):.2f}ms p95={self.percentile(0.95):.2f}ms "
+            f"over {self.FRAME_BUDGET_MS:.1f}ms budget: {self.over_budget}"
+        )
+
+
+class ActivationDaemon(QObject):
+    """
+    Registers the configured global trigger and shows the wheel on it.
+
+    Args:
+        interface: The :class:`RadialInterface` to pop up.  It should be
+                   built (and hidden) up front so activation only has to
+                   move and show it.
+        parent:    Optional QObject parent.
+    """
+
+    KEYBOARD_HOTKEY = "alt+`"
+
+    # Interval at which the cursor is followed during a marking stroke
+    MARKING_POLL_MS = 8
+
+    # Emitted from listener threads with the trigger's perf_counter() time
+    # and routed to the GUI thread through queued connections.
+    _triggered = pyqtSignal(float)
+    _released = pyqtSignal(float)
+
+    def __init__(self, interface, parent=None):
+        super().__init__(parent)
+        self.interface = interface
+        self.input_mode = None
+        self.latency = LatencyStats()
+
+        self._hook = None   # handle returned by global_hooks
+        self._pending_trigger = None   # perf_counter() of an activation awaiting paint
+        self._marking = False
+
+        self._triggered.connect(self._on_triggered, Qt.QueuedConnection)
+        self._released.connect(self._on_released, Qt.QueuedConnection)
+        self.interface.painted.connect(self._on_interface_painted)
+
+        self._marking_timer = QTimer(self)
+        self._marking_timer.setInterval(self.MARKING_POLL_MS)
+        self._marking_timer.timeout.connect(self._follow_marking)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """Register the trigger for the current input mode and follow changes."""
+        config = PasteWheelConfig.shared()
+        config.subscribe(self._on_config_events)
+        self._register(config.get_input_mode())
+
+    def stop(self):
+        """Unregister the trigger."""
+        PasteWheelConfig.shared().unsubscribe(self._on_config_events)
+        self._unregister()
+
+    def _on_config_events(self, events):
+        for event in events:
+            if event.kind in (INPUT_MODE_CHANGED, CONFIG_RELOADED):
+                mode = PasteWheelConfig.shared().get_input_mode()
+                if mode != self.input_mode:
+                    self._register(mode)
+                return
+
+    def _register(self, input_mode):
+        """Install the listener for *input_mode*, replacing any previous one."""
+        self._unregister()
+        self.input_mode = input_mode
+        try:
+            if input_mode == "mouse":
+                def _on_middle_button(pressed):
+                    (self._triggered if pressed else self._released).emit(time.perf_counter())
+
+                self._hook = global_hooks.add_mouse_button("middle", _on_middle_button)
+            else:
+                self._hook = global_hooks.add_hotkey(
+                    self.KEYBOARD_HOTKEY, lambda: self._triggered.emit(time.perf_counter())
+                )
+        except Exception as e:
+            # Hooks may be unavailable (headless session, missing privileges).
+            if DEBUG:
+                DebugLogger.log(f"Cannot register {input_mode} activation trigger: {e}")
+
+    def _unregister(self):
+        if self._hook is not None:
+            try:
+                global_hooks.remove_hook(self._hook)
+            except Exception:
+                pass
+            self._hook = None
+
+    # ------------------------------------------------------------------
+    # GUI-thread handlers
+    # ------------------------------------------------------------------
+
+    def _on_triggered(self, triggered_at):
+        """Trigger pressed: toggle the wheel at the cursor."""
+        if self.interface.isVisible() and not self._marking:
+            self.interface.hide()
+            return
+        position = QCursor.pos()
+        self._pending_trigger = triggered_at
+        self.interface.popup_at(position)
+        if self.input_mode == "mouse":
+            self._marking = True
+            self.interface.begin_marking(self.interface.mapFromGlobal(position))
+            self._marking_timer.start()
+
+    def _on_released(self, released_at):
+        """Trigger released (mouse mode): fire the marking-menu selection."""
+        if not self._marking:
+            return
+        self._marking = False
+        self._marking_timer.stop()
+        self.interface.end_marking(self.interface.mapFromGlobal(QCursor.pos()))
+
+    def _follow_marking(self):
+        self.interface.update_marking(self.interface.mapFromGlobal(QCursor.pos()))
+
+    def _on_interface_painted(self):
+        if self._pending_trigger is None:
+            return
+        latency_ms = (time.perf_counter() - self._pending_trigger) * 1000
+        self._pending_trigger = None
+        self.latency.add(latency_ms)
+        if DEBUG:
+            DebugLogger.log(f"Activation latency {latency_ms:.2f}ms ({self.latency.summary()})")
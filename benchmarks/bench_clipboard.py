@@ -0,0 +1,85 @@
+"""
+Sequential-paste clipboard write benchmark.
+
+Times the clipboard write the Ctrl+V hook performs before replaying the
+paste, from a background thread as the ``keyboard`` hook thread would:
+
+* ``bridge``    — ClipboardBridge hand-off to QApplication.clipboard() on
+                  the GUI thread, with its completion handshake,
+* ``pyperclip`` — pyperclip.copy() (xclip/xsel subprocess on Linux).
+
+Runs on Qt's offscreen platform unless QT_QPA_PLATFORM is set; the
+pyperclip path needs a real clipboard mechanism and is skipped otherwise.
+
+Usage::
+
+    python benchmarks/bench_clipboard.py [--count N]
+"""
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def measure(write, count):
+    """Call write(text) *count* times; return per-call latencies in ms."""
+    samples = []
+    for i in range(count):
+        text = f"sequence step {i}"
+        start = time.perf_counter()
+        write(text)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(name, samples):
+    samples = sorted(samples)
+    print(
+        f"{name:<10} n={len(samples):<5} median {statistics.median(samples):8.3f}ms  "
+        f"p95 {samples[int(0.95 * (len(samples) - 1))]:8.3f}ms  max {samples[-1]:8.3f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--count", type=int, default=500, help="writes per path")
+    args = parser.parse_args()
+
+    from PyQt5.QtCore import QMetaObject, Qt  # noqa: PLC0415
+    from PyQt5.QtWidgets import QApplication  # noqa: PLC0415
+    from radial_interface.clipboard_bridge import ClipboardBridge  # noqa: PLC0415
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    bridge = ClipboardBridge.shared()
+    results = {}
+
+    def hook_thread():
+        try:
+            results["bridge"] = measure(bridge.set_text, args.count)
+            try:
+                import pyperclip  # noqa: PLC0415
+                results["pyperclip"] = measure(pyperclip.copy, min(args.count, 100))
+            except Exception as e:
+                print(f"pyperclip path skipped: {e}")
+        finally:
+            QMetaObject.invokeMethod(app, "quit", Qt.QueuedConnection)
+
+    worker = threading.Thread(target=hook_thread, daemon=True)
+    worker.start()
+    app.exec_()
+    worker.join()
+
+    for name, samples in results.items():
+        report(name, samples)
+    if bridge.fallbacks:
+        print(f"bridge fell back to pyperclip {bridge.fallbacks} times")
+
+
+if __name__ == "__main__":
+    main()
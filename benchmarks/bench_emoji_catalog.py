@@ -0,0 +1,121 @@
+"""
+Emoji picker cold-open benchmark: binary catalog vs. JSON data.
+
+Generates the full emoji catalog (every fully-qualified emoji of the
+installed ``emoji`` package) in a temporary directory twice — as
+``emoji_data.json`` and as the memory-mapped binary catalog — and opens the
+emoji picker in a fresh interpreter for each sample, so nothing is cached
+between samples.  Reports, per format:
+
+* load: ``PasteWheelConfig.load_emoji_data()`` plus building the shared
+  ``EmojiCatalog``, and
+* open: constructing and showing ``EmojiSymbolPicker`` through the end of
+  its first paint (includes load).
+
+Runs on Qt's offscreen platform unless QT_QPA_PLATFORM is set.
+
+Usage::
+
+    python benchmarks/bench_emoji_catalog.py [--repeat N]
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from config_storage import JsonStorageBackend  # noqa: E402
+from pastewheel_config import PasteWheelConfig  # noqa: E402
+
+FORMATS = ("json", "binary")
+
+
+def build_data(directory):
+    """Write the full catalog as JSON and binary files into *directory*."""
+    from build_emoji_catalog import generate_entries  # noqa: PLC0415
+    from emoji_catalog_file import write_catalog  # noqa: PLC0415
+
+    entries = generate_entries()
+    with open(os.path.join(directory, "emoji_data.json"), "w", encoding="utf-8") as file:
+        json.dump({code: {"description": description, "category": category}
+                   for code, _, description, category in entries}, file, ensure_ascii=False, indent=2)
+    write_catalog(os.path.join(directory, "emoji_catalog.bin"), entries)
+    return len(entries)
+
+
+def child(data_format, directory):
+    """Time one cold load and picker open; print the result as JSON."""
+    backend = JsonStorageBackend(os.path.join(directory, "config.json"))
+    backend.write(dict(PasteWheelConfig.DEFAULT_CONFIG), [])
+    PasteWheelConfig._shared_instance = PasteWheelConfig(backend=backend)
+    PasteWheelConfig.EMOJI_DATA_FILE = os.path.join(directory, "emoji_data.json")
+    PasteWheelConfig.EMOJI_CATALOG_FILE = (
+        os.path.join(directory, "emoji_catalog.bin") if data_format == "binary"
+        else os.path.join(directory, "missing.bin")
+    )
+
+    from PyQt5.QtWidgets import QApplication  # noqa: PLC0415
+    app = QApplication.instance() or QApplication(sys.argv)
+    os.chdir(ROOT)
+    from radial_interface_button_settings.emoji_symbol_picker.emoji_catalog import EmojiCatalog  # noqa: PLC0415
+    from radial_interface_button_settings.emoji_symbol_picker.emoji_symbol_picker import (  # noqa: PLC0415
+        EmojiSymbolPicker,
+    )
+
+    start = time.perf_counter()
+    catalog = EmojiCatalog.shared()
+    load_ms = (time.perf_counter() - start) * 1000
+
+    picker = EmojiSymbolPicker()
+    picker.show()
+    # Offscreen windows are only painted on request
+    picker.repaint()
+    app.processEvents()
+    open_ms = (time.perf_counter() - start) * 1000
+    print(json.dumps({"entries": len(catalog), "load_ms": load_ms, "open_ms": open_ms}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=10, help="cold opens per format")
+    parser.add_argument("--child", choices=FORMATS, help=argparse.SUPPRESS)
+    parser.add_argument("--dir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.dir)
+        return
+
+    directory = tempfile.mkdtemp(prefix="pastewheel-bench-")
+    try:
+        count = build_data(directory)
+        for name in ("emoji_data.json", "emoji_catalog.bin"):
+            print(f"{name}: {os.path.getsize(os.path.join(directory, name))} bytes")
+        print(f"{count} emojis, {args.repeat} cold opens per format")
+        for data_format in FORMATS:
+            samples = []
+            for _ in range(args.repeat):
+                output = subprocess.run(
+                    [sys.executable, os.path.abspath(__file__), "--child", data_format, "--dir", directory],
+                    check=True, capture_output=True, text=True,
+                ).stdout
+                samples.append(json.loads(output.strip().splitlines()[-1]))
+            print(
+                f"{data_format:>6}: "
+                f"load median {statistics.median(s['load_ms'] for s in samples):.2f}ms, "
+                f"open median {statistics.median(s['open_ms'] for s in samples):.2f}ms"
+            )
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Paste hot-path benchmark with in-memory clipboard and keystroke backends.
+
+Replaces the system clipboard and keystroke synthesis with the recording
+fakes from :mod:`paste_backends`, then measures:
+
+* click-to-clipboard — latency and throughput of clicking a clipboard
+  button widget until its string is written,
+* hook-to-paste      — latency of a sequential-paste Ctrl+V, from the hook
+  firing on a background thread (as the in-process ``keyboard`` hook does)
+  until the replayed Ctrl+V is sent, for the Qt backend (through the
+  ClipboardBridge) and a thread-safe backend.
+
+Runs on Qt's offscreen platform unless QT_QPA_PLATFORM is set.
+
+Usage::
+
+    python benchmarks/bench_paste.py [--count N] [--steps N]
+"""
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import paste_backends  # noqa: E402
+from config_storage import JsonStorageBackend  # noqa: E402
+from pastewheel_config import PasteWheelConfig  # noqa: E402
+
+
+def report(name, samples):
+    samples = sorted(samples)
+    print(
+        f"{name:<28} n={len(samples):<5} median {statistics.median(samples):8.3f}ms  "
+        f"p95 {samples[int(0.95 * (len(samples) - 1))]:8.3f}ms  max {samples[-1]:8.3f}ms"
+    )
+
+
+def bench_click(app, widget, clipboard, count):
+    """Click *widget* *count* times; return latencies (ms) and clicks/s."""
+    samples = []
+    begin = time.perf_counter()
+    for _ in range(count):
+        before = len(clipboard.writes)
+        start = time.perf_counter()
+        widget.click()
+        samples.append((clipboard.writes[before][0] - start) * 1000)
+    elapsed = time.perf_counter() - begin
+    app.processEvents()
+    return samples, count / elapsed
+
+
+def bench_hook(app, keystrokes, count):
+    """
+    Fire the in-process Ctrl+V replay handler *count* times from a worker
+    thread while the GUI event loop runs; return latencies (ms).
+    """
+    import global_hooks  # noqa: PLC0415
+    from PyQt5.QtCore import QMetaObject, Qt  # noqa: PLC0415
+    from radial_interface.paste_controller import PasteController  # noqa: PLC0415
+
+    handler = global_hooks.replaying("ctrl+v", PasteController.advance)
+    samples = []
+
+    def hook_thread():
+        try:
+            for _ in range(count):
+                before = len(keystrokes.sent)
+                start = time.perf_counter()
+                handler()
+                samples.append((keystrokes.sent[before][0] - start) * 1000)
+        finally:
+            QMetaObject.invokeMethod(app, "quit", Qt.QueuedConnection)
+
+    worker = threading.Thread(target=hook_thread, daemon=True)
+    worker.start()
+    app.exec_()
+    worker.join()
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--count", type=int, default=1000, help="clicks / hook events per measurement")
+    parser.add_argument("--steps", type=int, default=50, help="strings in the sequence button")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="pastewheel-bench-")
+    try:
+        config = dict(PasteWheelConfig.DEFAULT_CONFIG)
+        config["buttons"] = [
+            {"id": "clip_l1_s1", "layer": 1, "label": "📋", "button_type": "clip",
+             "clipboard": ["single string"]},
+            {"id": "clip_l1_s2", "layer": 1, "label": "📑", "button_type": "clip",
+             "clipboard": [f"runbook step {i}" for i in range(args.steps)]},
+        ]
+        backend = JsonStorageBackend(os.path.join(directory, "config.json"))
+        backend.write(config, [])
+        PasteWheelConfig._shared_instance = PasteWheelConfig(backend=backend)
+
+        from PyQt5.QtWidgets import QApplication  # noqa: PLC0415
+        app = QApplication.instance() or QApplication(sys.argv)
+        # Asset paths in RadialInterface are relative to the repository root
+        os.chdir(ROOT)
+
+        from radial_interface.paste_controller import PasteController  # noqa: PLC0415
+        from radial_interface.radial_interface import RadialInterface  # noqa: PLC0415
+        PasteController.INSTALL_HOOKS = False
+        keystrokes = paste_backends.InMemoryKeystrokeBackend()
+        paste_backends.set_keystroke_backend(keystrokes)
+
+        interface = RadialInterface(width=400, height=400)
+        app.processEvents()
+
+        clipboard = paste_backends.InMemoryClipboardBackend()
+        paste_backends.set_clipboard_backend(clipboard)
+        samples, rate = bench_click(app, interface.button_widget_map["clip_l1_s1"], clipboard, args.count)
+        report("click-to-clipboard", samples)
+        print(f"{'':<28} {rate:,.0f} clicks/s")
+
+        # Start the sequence, then drive its Ctrl+V hook
+        interface.button_widget_map["clip_l1_s2"].click()
+        report("hook-to-paste (thread-safe)", bench_hook(app, keystrokes, args.count))
+
+        paste_backends.set_clipboard_backend(paste_backends.QtClipboardBackend())
+        report("hook-to-paste (Qt, bridged)", bench_hook(app, keystrokes, args.count))
+
+        PasteController.cancel()
+        interface.deleteLater()
+        app.processEvents()
+    finally:
+        paste_backends.set_clipboard_backend(None)
+        paste_backends.set_keystroke_backend(None)
+        PasteWheelConfig.shared().flush()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Overlay popup show-to-paint benchmark.
+
+Builds an overlay RadialInterface once (as the activation daemon does),
+then repeatedly hides it and pops it up at varying cursor positions,
+reporting the time from popup_at() to the end of the first paint.
+
+Runs on Qt's offscreen platform unless QT_QPA_PLATFORM is set.
+
+Usage::
+
+    python benchmarks/bench_popup.py [--repeat N] [--render-mode widgets|painter]
+"""
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from config_storage import JsonStorageBackend  # noqa: E402
+from pastewheel_config import PasteWheelConfig  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=200, help="popups to time")
+    parser.add_argument("--render-mode", default="widgets", help="RadialInterface render mode")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="pastewheel-bench-")
+    try:
+        config = dict(PasteWheelConfig.DEFAULT_CONFIG)
+        config["buttons"] = [
+            {"id": f"clip_l1_{i}", "layer": 1, "label": "📋", "button_type": "clip", "clipboard": ["text"]}
+            for i in range(PasteWheelConfig.LAYER_MAX_BUTTONS[1])
+        ]
+        backend = JsonStorageBackend(os.path.join(directory, "config.json"))
+        backend.write(config, [])
+        PasteWheelConfig._shared_instance = PasteWheelConfig(backend=backend)
+
+        from PyQt5.QtCore import QPoint  # noqa: PLC0415
+        from PyQt5.QtWidgets import QApplication  # noqa: PLC0415
+        app = QApplication.instance() or QApplication(sys.argv)
+        # Asset paths in RadialInterface are relative to the repository root
+        os.chdir(ROOT)
+
+        from radial_interface.radial_interface import RadialInterface  # noqa: PLC0415
+        start = time.perf_counter()
+        interface = RadialInterface(width=400, height=400, render_mode=args.render_mode, overlay=True)
+        app.processEvents()
+        print(f"construct (hidden): {(time.perf_counter() - start) * 1000:.2f}ms")
+
+        samples = []
+        for i in range(args.repeat):
+            interface.hide()
+            app.processEvents()
+            interface.popup_at(QPoint(300 + (i % 7) * 40, 300 + (i % 5) * 40))
+            # Offscreen windows are only painted on request
+            interface.repaint()
+            app.processEvents()
+            if interface.last_show_to_paint_ms is not None:
+                samples.append(interface.last_show_to_paint_ms)
+                interface.last_show_to_paint_ms = None
+
+        interface.deleteLater()
+        app.processEvents()
+        if not samples:
+            print("no paints observed")
+            return
+        samples.sort()
+        print(
+            f"show-to-paint over {len(samples)} popups: "
+            f"median {statistics.median(samples):.3f}ms, "
+            f"p95 {samples[int(0.95 * (len(samples) - 1))]:.3f}ms, "
+            f"max {samples[-1]:.3f}ms (frame budget {1000 / 60:.1f}ms)"
+        )
+    finally:
+        PasteWheelConfig.shared().flush()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
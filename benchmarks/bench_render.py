@@ -0,0 +1,139 @@
+"""
+Radial wheel render-mode benchmark.
+
+Builds a maximum-capacity button library in a temporary directory and
+compares the "widgets" and "painter" render modes of RadialInterface:
+
+* construction time of the window (Layer 1 rendered),
+* time to open a Layer-1 and then a Layer-2 expand button,
+* time to repaint the whole wheel with the deepest branch open,
+* time to patch one label,
+
+and the shared glyph atlas' hit rate and memory afterwards.
+
+Runs on Qt's offscreen platform unless QT_QPA_PLATFORM is set.
+
+Usage::
+
+    python benchmarks/bench_render.py [--repeat N]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from config_storage import JsonStorageBackend  # noqa: E402
+from pastewheel_config import PasteWheelConfig  # noqa: E402
+
+
+def build_buttons():
+    """Return a button list at the layer capacity limits."""
+    buttons = []
+    for i in range(PasteWheelConfig.LAYER_MAX_BUTTONS[1]):
+        l1_id = f"exp_l1_s{i}"
+        buttons.append({"id": l1_id, "layer": 1, "label": "📁", "button_type": "exp", "clipboard": []})
+        for j in range(PasteWheelConfig.LAYER_MAX_BUTTONS[2]):
+            l2_id = f"exp_l2_s{i}_{j}"
+            buttons.append({
+                "id": l2_id, "layer": 2, "label": "📂", "button_type": "exp",
+                "parent_id": l1_id, "clipboard": [],
+            })
+            for k in range(PasteWheelConfig.LAYER_MAX_BUTTONS[3]):
+                buttons.append({
+                    "id": f"clip_l3_s{i}_{j}_{k}", "layer": 3, "label": "📋",
+                    "button_type": "clip", "parent_id": l2_id, "clipboard": ["text"],
+                })
+    return buttons
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+
+def toggle(interface, button_id):
+    """Click an expand button the way each render mode would."""
+    if interface.render_mode == "painter":
+        interface._activate_record(interface._record_map[button_id])
+    else:
+        widget = interface.button_widget_map[button_id]
+        widget.click()
+
+
+def bench(mode, app, repeat):
+    from radial_interface.radial_interface import RadialInterface  # noqa: PLC0415
+
+    results = {}
+    interface = None
+    for _ in range(repeat):
+        if interface is not None:
+            interface.deleteLater()
+            app.processEvents()
+
+        start = time.perf_counter()
+        interface = RadialInterface(width=400, height=400, render_mode=mode)
+        interface.show()
+        app.processEvents()
+        results.setdefault("construct", []).append((time.perf_counter() - start) * 1000)
+
+        results.setdefault("open l1", []).append(timed(lambda: (toggle(interface, "exp_l1_s0"), app.processEvents())))
+        results.setdefault("open l2", []).append(timed(lambda: (toggle(interface, "exp_l2_s0_0"), app.processEvents())))
+        results.setdefault("repaint", []).append(timed(interface.repaint))
+
+        config = PasteWheelConfig.shared()
+        results.setdefault("patch label", []).append(timed(lambda: (
+            config.update_button("clip_l3_s0_0_0", {"label": "✏️"}),
+            config.events.flush(),
+            app.processEvents(),
+        )))
+    interface.deleteLater()
+    app.processEvents()
+    return {name: min(values) for name, values in results.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=5, help="runs per mode (best is reported)")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="pastewheel-bench-")
+    try:
+        config = dict(PasteWheelConfig.DEFAULT_CONFIG)
+        config["buttons"] = build_buttons()
+        backend = JsonStorageBackend(os.path.join(directory, "config.json"))
+        backend.write(config, [])
+        PasteWheelConfig._shared_instance = PasteWheelConfig(backend=backend)
+
+        from PyQt5.QtWidgets import QApplication  # noqa: PLC0415
+        app = QApplication.instance() or QApplication(sys.argv)
+        # Asset paths in RadialInterface are relative to the repository root
+        os.chdir(ROOT)
+
+        print(f"{len(config['buttons'])} buttons, best of {args.repeat}\n")
+        rows = {mode: bench(mode, app, args.repeat) for mode in ("widgets", "painter")}
+        names = list(rows["widgets"])
+        print(f"{'mode':<10}" + "".join(f"{name:>14}" for name in names))
+        for mode, result in rows.items():
+            print(f"{mode:<10}" + "".join(f"{result[name]:>12.2f}ms" for name in names))
+
+        from radial_interface.glyph_atlas import GlyphAtlas  # noqa: PLC0415
+        stats = GlyphAtlas.shared().stats()
+        print(
+            f"\nglyph atlas: {stats['hits']} hits, {stats['misses']} misses "
+            f"(hit rate {stats['hit_rate'] or 0:.1%}), {stats['entries']} pixmaps, "
+            f"{stats['bytes'] / 1024:.1f} KiB"
+        )
+    finally:
+        PasteWheelConfig.shared().flush()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Storage backend benchmark.
+
+Builds a maximum-capacity button library (8 layer-1 expand buttons, 16
+layer-2 expand buttons under each, 24 layer-3 clipboard buttons under each
+of those, every clipboard button carrying multi-KB payloads) in a temporary
+directory and compares, for the JSON snapshot, JSON journal and SQLite
+backends:
+
+* cold load time (new PasteWheelConfig reading the stored library), and
+* per-edit cost (one update_button() followed by flush()).
+
+No Qt event loop is created, so every change is written synchronously.
+
+Usage::
+
+    python benchmarks/bench_storage.py [--edits N] [--payload-kb K]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config_storage import JsonStorageBackend, SQLiteStorageBackend  # noqa: E402
+from pastewheel_config import PasteWheelConfig  # noqa: E402
+
+
+def build_library(payload_kb):
+    """Return a full configuration dict at the layer capacity limits."""
+    payload = "x" * (payload_kb * 1024)
+    buttons = []
+    for i in range(PasteWheelConfig.LAYER_MAX_BUTTONS[1]):
+        l1_id = f"exp_l1_s{i}"
+        buttons.append({"id": l1_id, "layer": 1, "label": "📁", "button_type": "exp", "clipboard": []})
+        for j in range(PasteWheelConfig.LAYER_MAX_BUTTONS[2]):
+            l2_id = f"exp_l2_s{i}_{j}"
+            buttons.append({
+                "id": l2_id, "layer": 2, "label": "📂", "button_type": "exp",
+                "parent_id": l1_id, "clipboard": [],
+            })
+            for k in range(PasteWheelConfig.LAYER_MAX_BUTTONS[3]):
+                buttons.append({
+                    "id": f"clip_l3_s{i}_{j}_{k}", "layer": 3, "label": "📋",
+                    "button_type": "clip", "parent_id": l2_id,
+                    "clipboard": [payload, payload[: len(payload) // 2]],
+                })
+    config = dict(PasteWheelConfig.DEFAULT_CONFIG)
+    config["buttons"] = buttons
+    return config
+
+
+def make_backend(name, directory):
+    if name == "sqlite":
+        return SQLiteStorageBackend(os.path.join(directory, "config.sqlite3"))
+    mode = "journal" if name == "json-journal" else "snapshot"
+    return JsonStorageBackend(os.path.join(directory, "config.json"), mode=mode)
+
+
+def bench(name, library, edits):
+    directory = tempfile.mkdtemp(prefix="pastewheel-bench-")
+    try:
+        backend = make_backend(name, directory)
+        seed = dict(library)
+        if name == "json-journal":
+            seed["storage_mode"] = "journal"
+        backend.write(seed, [])
+        # First load moves large payloads into the blob store; time the next.
+        PasteWheelConfig(backend=make_backend(name, directory)).flush()
+
+        start = time.perf_counter()
+        config = PasteWheelConfig(backend=make_backend(name, directory))
+        load_s = time.perf_counter() - start
+
+        ids = [b["id"] for b in library["buttons"] if b["button_type"] == "clip"]
+        before = config.persister.bytes_written
+        start = time.perf_counter()
+        for n in range(edits):
+            config.update_button(ids[n % len(ids)], {"tooltip": f"edit {n}"})
+            config.flush()
+        edit_s = (time.perf_counter() - start) / edits
+        edit_bytes = (config.persister.bytes_written - before) / edits
+
+        size = sum(
+            os.path.getsize(os.path.join(directory, f)) for f in os.listdir(directory)
+        )
+        return load_s, edit_s, edit_bytes, size
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--edits", type=int, default=50, help="edits to time per backend")
+    parser.add_argument("--payload-kb", type=int, default=4, help="size of the first clipboard string")
+    args = parser.parse_args()
+
+    library = build_library(args.payload_kb)
+    print(f"{len(library['buttons'])} buttons, {args.payload_kb} KB payloads, {args.edits} edits\n")
+    print(f"{'backend':<14}{'cold load':>12}{'per edit':>12}{'bytes/edit':>14}{'on disk':>12}")
+    for name in ("json-snapshot", "json-journal", "sqlite"):
+        load_s, edit_s, edit_bytes, size = bench(name, library, args.edits)
+        print(
+            f"{name:<14}{load_s * 1000:>10.1f}ms{edit_s * 1000:>10.2f}ms"
+            f"{edit_bytes:>14,.0f}{size / 1024 / 1024:>10.1f}MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+"""
+Content-addressed blob store for large clipboard payloads.
+
+Clipboard strings longer than :attr:`BlobStore.threshold` bytes are kept out
+of the configuration.  Each one is stored once, under the SHA-256 of its
+UTF-8 encoding, in a blob directory next to the configuration::
+
+    pastewheel_blobs/3f/3f9a...c1.z     (zlib-compressed)
+    pastewheel_blobs/8b/8b02...7e       (stored as-is)
+
+The button's ``clipboard`` list then holds a reference ``{"blob": "<hash>"}``
+in place of the string.  Buttons with identical payloads share one blob, and
+payloads are only read back (through ``mmap``) when a button is clicked or
+edited, so the resident set does not grow with payload size.
+
+Storing a payload only queues it; the configuration's write-behind
+persister writes queued blobs (:meth:`BlobStore.write_pending`) on its
+writer thread just before the configuration that references them, and
+collects blobs that a written snapshot no longer references.
+"""
+import hashlib
+import mmap
+import os
+import threading
+import zlib
+from debug_logger import DebugLogger
+from config_storage import atomic_write_bytes
+
+# Set to True to enable debug logging to debug.txt
+DEBUG = False
+
+
+def is_blob_ref(entry):
+    """Return True if a clipboard entry is a blob reference."""
+    return isinstance(entry, dict) and "blob" in entry
+
+
+def referenced_blobs(buttons, load_payload=None):
+    """
+    Return the set of blob hashes referenced by *buttons*.
+
+    Args:
+        buttons:      Iterable of button dicts.
+        load_payload: Optional callable returning the clipboard list of a
+                      button id, for buttons loaded without one.
+    """
+    live = set()
+    for button in buttons:
+        if "clipboard" in button:
+            clipboard = button["clipboard"]
+        elif load_payload is not None:
+            clipboard = load_payload(button.get("id")) or []
+        else:
+            continue
+        if isinstance(clipboard, list):
+            live.update(entry["blob"] for entry in clipboard if is_blob_ref(entry))
+    return live
+
+
+class BlobStore:
+    """
+    Directory of immutable, deduplicated payload blobs.
+
+    Args:
+        directory: Blob directory (created on first write).
+        threshold: Minimum payload size in bytes that is moved into a blob.
+        compress:  Whether to zlib-compress blobs when that makes them smaller.
+    """
+
+    # Default payload size above which strings are moved into blobs.
+    THRESHOLD = 4096
+
+    # zlib level: favour speed, payloads are read on every click.
+    COMPRESS_LEVEL = 1
+
+    def __init__(self, directory, threshold=THRESHOLD, compress=True):
+        self.directory = directory
+        self.threshold = threshold
+        self.compress = compress
+        self._lock = threading.Lock()
+        self._pending = {}    # digest → payload queued by put()
+        self._written = set() # digests written since the last collect_garbage()
+
+    # ------------------------------------------------------------------
+    # Single blobs
+    # ------------------------------------------------------------------
+
+    def _path(self, digest, compressed):
+        path = os.path.join(self.directory, digest[:2], digest)
+        return path + ".z" if compressed else path
+
+    def put(self, text):
+        """
+        Queue *text* for writing and return its hash.
+
+        Nothing touches the disk here; see :meth:`write_pending`.  Content
+        that already exists is queued too, so a concurrent
+        :meth:`collect_garbage` keeps (or rewrites) it.
+
+        Args:
+            text: Payload string.
+
+        Returns:
+            Hex SHA-256 digest of the UTF-8 encoded payload
+        """
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        with self._lock:
+            self._pending[digest] = text
+        return digest
+
+    def write_pending(self):
+        """
+        Write every queued blob that is not on disk yet.
+
+        Returns:
+            Number of blobs written
+        """
+        with self._lock:
+            pending = list(self._pending.items())
+        written = 0
+        for digest, text in pending:
+            if not self._on_disk(digest):
+                self._write(digest, text.encode("utf-8"))
+                written += 1
+            with self._lock:
+                if self._pending.get(digest) is text:
+                    del self._pending[digest]
+                self._written.add(digest)
+        return written
+
+    def discard_pending(self, live):
+        """
+        Drop queued blobs whose hash is not in *live* (e.g. after the
+        changes that referenced them were rolled back).
+
+        Args:
+            live: Set of hashes still referenced by the configuration.
+        """
+        with self._lock:
+            for digest in [digest for digest in self._pending if digest not in live]:
+                del self._pending[digest]
+
+    def _write(self, digest, data):
+        compressed = False
+        if self.compress:
+            packed = zlib.compress(data, self.COMPRESS_LEVEL)
+            if len(packed) < len(data):
+                data, compressed = packed, True
+
+        path = self._path(digest, compressed)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        atomic_write_bytes(path, data)
+
+    def _on_disk(self, digest):
+        return os.path.exists(self._path(digest, True)) or os.path.exists(self._path(digest, False))
+
+    def contains(self, digest):
+        """Return True if a blob with *digest* exists or is queued."""
+        with self._lock:
+            if digest in self._pending:
+                return True
+        return self._on_disk(digest)
+
+    def get(self, digest):
+        """
+        Read a blob back.
+
+        Args:
+            digest: Hash returned by :meth:`put`.
+
+        Returns:
+            The payload string, or None if the blob is missing or unreadable
+        """
+        with self._lock:
+            text = self._pending.get(digest)
+        if text is not None:
+            return text
+        for compressed in (True, False):
+            try:
+                with open(self._path(digest, compressed), "rb") as file:
+                    if os.fstat(file.fileno()).st_size == 0:
+                        return ""
+                    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                        if compressed:
+                            return zlib.decompress(view).decode("utf-8")
+                        return str(view, "utf-8")
+            except FileNotFoundError:
+                continue
+            except (IOError, OSError, ValueError, zlib.error) as e:
+                if DEBUG:
+                    DebugLogger.log(f"Error reading blob {digest}: {e}")
+                return None
+        if DEBUG:
+            DebugLogger.log(f"Missing blob {digest}")
+        return None
+
+    # ------------------------------------------------------------------
+    # Clipboard lists
+    # ------------------------------------------------------------------
+
+    def externalize(self, clipboard):
+        """
+        Replace large strings in a clipboard list with blob references.
+
+        Args:
+            clipboard: List of clipboard entries.
+
+        Returns:
+            The same list object if nothing was moved, otherwise a new list
+        """
+        result = None
+        for index, entry in enumerate(clipboard):
+            if isinstance(entry, str) and len(entry) >= self.threshold // 4 \
+                    and len(entry.encode("utf-8")) >= self.threshold:
+                if result is None:
+                    result = list(clipboard)
+                result[index] = {"blob": self.put(entry)}
+        return clipboard if result is None else result
+
+    def resolve(self, clipboard):
+        """
+        Return a clipboard list with every blob reference replaced by its
+        payload.  Missing blobs resolve to an empty string.
+        """
+        if not any(is_blob_ref(entry) for entry in clipboard):
+            return clipboard
+        return [
+            (self.get(entry["blob"]) or "") if is_blob_ref(entry) else entry
+            for entry in clipboard
+        ]
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def collect_garbage(self, live):
+        """
+        Delete every blob whose hash is not in *live*.
+
+        Blobs queued by :meth:`put`, or written since the previous
+        collection, are kept as well: they may be referenced by changes
+        newer than the configuration *live* was taken from.
+
+        Args:
+            live: Set of hashes still referenced by the configuration.
+
+        Returns:
+            Number of blobs deleted
+        """
+        removed = 0
+        with self._lock:
+            live = set(live) | self._pending.keys() | self._written
+            self._written = set()
+        if not os.path.isdir(self.directory):
+            return removed
+        for prefix in os.listdir(self.directory):
+            subdirectory = os.path.join(self.directory, prefix)
+            if not os.path.isdir(subdirectory):
+                continue
+            for name in os.listdir(subdirectory):
+                digest = name[:-2] if name.endswith(".z") else name
+                if digest in live or name.endswith(".tmp"):
+                    continue
+                try:
+                    os.unlink(os.path.join(subdirectory, name))
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
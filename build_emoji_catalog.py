@@ -0,0 +1,202 @@
+"""
+Build the binary emoji catalog (see emoji_catalog_file) from the installed
+``emoji`` package.
+
+Every fully-qualified emoji becomes one entry: its English colon code, the
+emoji itself, a description made of its name and aliases, and a picker
+category.  Categories come from Unicode's ``emoji-test.txt`` when it is
+given (its groups are exact); otherwise they are derived from code point
+blocks, which places a handful of emojis in a neighbouring category.
+Skin-tone variants get no category, so they stay out of the picker grid and
+are only found by search.  Entries of ``emoji_data.json`` override the
+generated description and category of the same code, so hand-written
+descriptions are kept.
+
+The committed catalog is built with ``--emoji-test``.
+
+Usage::
+
+    python build_emoji_catalog.py [--emoji-test emoji-test.txt]
+                                  [--overlay emoji_data.json] [--output catalog.bin]
+"""
+import argparse
+import bisect
+import json
+import os
+import sys
+
+from emoji_catalog_file import write_catalog
+
+PICKER_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "radial_interface_button_settings", "emoji_symbol_picker"
+)
+DEFAULT_OUTPUT = os.path.join(PICKER_DIR, "emoji_catalog.bin")
+DEFAULT_OVERLAY = os.path.join(PICKER_DIR, "emoji_data.json")
+
+# emoji-test.txt group → picker category
+GROUP_CATEGORIES = {
+    "Smileys & Emotion": "smiley",
+    "People & Body": "smiley",
+    "Animals & Nature": "nature",
+    "Food & Drink": "food",
+    "Activities": "activities",
+    "Travel & Places": "travel",
+    "Objects": "objects",
+    "Symbols": "symbols",
+    "Flags": "flags",
+}
+
+# (first code point, category) of code point ranges, sorted; an emoji is
+# placed by its first code point.  Used without emoji-test.txt.
+BLOCK_CATEGORIES = (
+    (0x0000, "symbols"),
+    (0x231A, "objects"),      # watch, hourglass, keyboard, clocks
+    (0x23E9, "symbols"),      # media controls
+    (0x23F0, "travel"),       # alarm clock, timers
+    (0x23F4, "symbols"),
+    (0x2600, "travel"),       # sun, cloud, umbrella, snowman, comet
+    (0x2605, "symbols"),
+    (0x2614, "travel"),       # umbrella with rain
+    (0x2615, "food"),         # hot beverage
+    (0x2616, "symbols"),
+    (0x26BD, "activities"),   # soccer ball, baseball
+    (0x26BF, "symbols"),
+    (0x26C4, "travel"),       # snowman, weather
+    (0x26C9, "symbols"),
+    (0x26EA, "travel"),       # church, fountain, tent, ferry
+    (0x26F9, "activities"),   # person bouncing ball
+    (0x26FA, "travel"),
+    (0x2700, "symbols"),
+    (0x1F000, "activities"),  # mahjong, playing cards
+    (0x1F100, "symbols"),
+    (0x1F1E6, "flags"),       # regional indicators
+    (0x1F200, "symbols"),
+    (0x1F300, "travel"),      # sky, weather, globes
+    (0x1F32D, "food"),        # hot dog, taco, burrito, chestnut
+    (0x1F331, "nature"),      # plants
+    (0x1F345, "food"),
+    (0x1F380, "activities"),  # celebrations, sports, arts
+    (0x1F3D4, "travel"),      # buildings
+    (0x1F3F3, "flags"),       # white flag, black flag
+    (0x1F3F5, "objects"),
+    (0x1F400, "nature"),      # animals
+    (0x1F440, "smiley"),      # body parts, people, hearts
+    (0x1F4AA, "objects"),
+    (0x1F500, "symbols"),
+    (0x1F549, "objects"),
+    (0x1F5FA, "travel"),      # map, landmarks
+    (0x1F600, "smiley"),      # faces, gestures
+    (0x1F680, "travel"),      # transport
+    (0x1F6B4, "smiley"),      # people biking, walking
+    (0x1F6B7, "travel"),
+    (0x1F6D0, "symbols"),
+    (0x1F6E0, "travel"),
+    (0x1F700, "symbols"),
+    (0x1F90C, "smiley"),      # faces, hands, people
+    (0x1F93A, "activities"),  # sports
+    (0x1F950, "food"),
+    (0x1F970, "smiley"),
+    (0x1F97A, "objects"),     # clothing
+    (0x1F980, "nature"),      # animals
+    (0x1F9B0, "smiley"),      # hair, body parts, people
+    (0x1F9C0, "food"),
+    (0x1F9CD, "smiley"),
+    (0x1F9E0, "objects"),
+    (0x1FA70, "objects"),
+    (0x1FAB0, "nature"),
+    (0x1FAC0, "smiley"),
+    (0x1FAD0, "food"),
+    (0x1FAE0, "smiley"),
+    (0x1FB00, "symbols"),
+)
+_BLOCK_STARTS = [start for start, _ in BLOCK_CATEGORIES]
+
+# Emoji modifiers Fitzpatrick type-1-2 … type-6
+SKIN_TONES = range(0x1F3FB, 0x1F400)
+
+
+def is_skin_tone_variant(glyph):
+    """Return True if *glyph* is an emoji with a skin tone modifier applied."""
+    return len(glyph) > 1 and any(ord(char) in SKIN_TONES for char in glyph)
+
+
+def block_category(glyph):
+    """Return the picker category of *glyph* by code point block."""
+    if any(0x1F1E6 <= ord(char) <= 0x1F1FF or 0xE0020 <= ord(char) <= 0xE007F for char in glyph):
+        return "flags"
+    return BLOCK_CATEGORIES[bisect.bisect_right(_BLOCK_STARTS, ord(glyph[0])) - 1][1]
+
+
+def read_emoji_test(path):
+    """
+    Return glyph → picker category from Unicode's ``emoji-test.txt``.
+    """
+    categories = {}
+    category = None
+    with open(path, "r", encoding="utf-8") as file:
+        for line in file:
+            if line.startswith("# group:"):
+                category = GROUP_CATEGORIES.get(line.split(":", 1)[1].strip())
+            elif line.strip() and not line.startswith("#") and category is not None:
+                codepoints = line.split(";", 1)[0].split()
+                categories["".join(chr(int(cp, 16)) for cp in codepoints)] = category
+    return categories
+
+
+def generate_entries(group_categories=None, overlay=None):
+    """
+    Return ``(code, glyph, description, category)`` tuples for every
+    fully-qualified emoji of the ``emoji`` package.
+
+    Args:
+        group_categories: Optional glyph → category map (read_emoji_test()).
+        overlay:          Optional dict of code → {"description", "category"}
+                          whose values replace the generated ones.
+    """
+    import emoji as emoji_lib  # noqa: PLC0415
+
+    group_categories = group_categories or {}
+    overlay = overlay or {}
+    fully_qualified = emoji_lib.STATUS["fully_qualified"]
+    entries = []
+    for glyph, info in emoji_lib.EMOJI_DATA.items():
+        if info.get("status") != fully_qualified:
+            continue
+        code = info["en"]
+        names = [code] + [alias for alias in info.get("alias", []) if alias != code]
+        names = [name.strip(":").replace("_", " ") for name in names]
+        description = names[0] + (f" ({', '.join(names[1:])})" if len(names) > 1 else "")
+        if is_skin_tone_variant(glyph):
+            category = ""
+        else:
+            category = group_categories.get(glyph) or block_category(glyph)
+        curated = overlay.get(code, {})
+        entries.append((
+            code, glyph,
+            curated.get("description") or description,
+            curated.get("category") or category,
+        ))
+    return entries
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build PasteWheel's binary emoji catalog")
+    parser.add_argument("--emoji-test", help="Unicode emoji-test.txt for exact categories")
+    parser.add_argument("--overlay", default=DEFAULT_OVERLAY,
+                        help="JSON emoji data whose descriptions and categories take precedence")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="catalog file to write")
+    args = parser.parse_args(argv)
+
+    group_categories = read_emoji_test(args.emoji_test) if args.emoji_test else None
+    overlay = {}
+    if args.overlay and os.path.exists(args.overlay):
+        with open(args.overlay, "r", encoding="utf-8") as file:
+            overlay = json.load(file)
+
+    count = write_catalog(args.output, generate_entries(group_categories, overlay))
+    print(f"Wrote {count} emojis to {args.output} ({os.path.getsize(args.output)} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+class ButtonStore:
+    """
+    Indexed in-memory store for PasteWheel button records.
+
+    Buttons are kept in their original (file) order and indexed by id, by
+    layer, by parent_id and by (layer, button_type).  Every index is an
+    insertion-ordered dict keyed by button id, so lookups are O(1) and
+    listing a bucket is O(result) while still returning buttons in the same
+    order the old linear scans did.
+
+    Indexes are updated incrementally by :meth:`put` and :meth:`remove`;
+    nothing ever rescans the whole list except :meth:`reset` and
+    :meth:`to_list`.
+    """
+
+    def __init__(self, buttons=None):
+        """
+        Args:
+            buttons: Optional iterable of button dicts to load.
+        """
+        self.reset(buttons or [])
+
+    def reset(self, buttons):
+        """
+        Replace the whole store contents and rebuild every index.
+
+        Args:
+            buttons: Iterable of button dicts, in file order.
+        """
+        self._records = {}        # key -> button dict (canonical order)
+        self._by_id = {}          # id -> button dict
+        self._by_layer = {}       # layer -> {key: button dict}
+        self._by_parent = {}      # parent_id -> {key: button dict}
+        self._by_layer_type = {}  # (layer, button_type) -> {key: button dict}
+        self._order = {}          # key -> insertion sequence number
+        self._next_order = 0
+        self._next_anonymous = 0
+
+        for button in buttons:
+            self.put(button)
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def put(self, button):
+        """
+        Insert a button, or replace the existing button with the same id.
+
+        A replaced button keeps its position in every index it stays in.
+        If its layer, parent or type changed it is moved to the new bucket
+        at the position matching its original file order.
+
+        Args:
+            button: Button dict.  Buttons without an ``id`` are kept (so they
+                    survive a read/write round trip) but are not reachable
+                    through :meth:`get`.
+        """
+        button_id = button.get("id")
+        if button_id is None:
+            key = ("__anonymous__", self._next_anonymous)
+            self._next_anonymous += 1
+        else:
+            key = button_id
+
+        previous = self._records.get(key)
+        if previous is None:
+            self._order[key] = self._next_order
+            self._next_order += 1
+
+        self._records[key] = button
+        if button_id is not None:
+            self._by_id[button_id] = button
+
+        if previous is None:
+            for index, bucket_key in self._buckets(button):
+                index.setdefault(bucket_key, {})[key] = button
+            return
+
+        old_buckets = self._buckets(previous)
+        new_buckets = self._buckets(button)
+        for (index, old_key), (_, new_key) in zip(old_buckets, new_buckets):
+            if old_key == new_key:
+                # Same bucket: overwrite in place, keeping its position.
+                index[old_key][key] = button
+            else:
+                self._discard(index, old_key, key)
+                self._insert_ordered(index, new_key, key, button)
+
+    def remove(self, button_id):
+        """
+        Remove a button by id.
+
+        Args:
+            button_id: ID of the button to remove.
+
+        Returns:
+            The removed button dict, or None if no button has that id.
+        """
+        button = self._by_id.pop(button_id, None)
+        if button is None:
+            return None
+        del self._records[button_id]
+        del self._order[button_id]
+        for index, bucket_key in self._buckets(button):
+            self._discard(index, bucket_key, button_id)
+        return button
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def get(self, button_id):
+        """Return the button with *button_id*, or None."""
+        return self._by_id.get(button_id)
+
+    def __contains__(self, button_id):
+        return button_id in self._by_id
+
+    def __len__(self):
+        return len(self._records)
+
+    def has_ids(self):
+        """Return True if at least one stored button has an id."""
+        return bool(self._by_id)
+
+    def by_layer(self, layer):
+        """Return the buttons on *layer* in file order (possibly empty)."""
+        return list(self._by_layer.get(layer, {}).values())
+
+    def by_parent(self, parent_id):
+        """Return the buttons whose ``parent_id`` is *parent_id*, in file order."""
+        return list(self._by_parent.get(parent_id, {}).values())
+
+    def by_layer_type(self, layer, button_type):
+        """Return the buttons of *button_type* on *layer*, in file order."""
+        return list(self._by_layer_type.get((layer, button_type), {}).values())
+
+    def count_layer_type(self, layer, button_type):
+        """Return how many buttons of *button_type* exist on *layer*."""
+        return len(self._by_layer_type.get((layer, button_type), ()))
+
+    def to_list(self):
+        """Return every stored button, in file order."""
+        return list(self._records.values())
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    def _buckets(self, button):
+        return (
+            (self._by_layer, button.get("layer")),
+            (self._by_parent, button.get("parent_id")),
+            (self._by_layer_type, (button.get("layer"), button.get("button_type"))),
+        )
+
+    def _insert_ordered(self, index, bucket_key, key, button):
+        bucket = index.setdefault(bucket_key, {})
+        bucket[key] = button
+        if len(bucket) > 1:
+            # A moved button lands at the end of the dict; restore file order.
+            ordered = sorted(bucket.items(), key=lambda item: self._order[item[0]])
+            bucket.clear()
+            bucket.update(ordered)
+
+    @staticmethod
+    def _discard(index, bucket_key, key):
+        bucket = index.get(bucket_key)
+        if bucket is None:
+            return
+        bucket.pop(key, None)
+        if not bucket:
+            del index[bucket_key]
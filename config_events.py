@@ -0,0 +1,272 @@
+"""
+Fine-grained change events for PasteWheelConfig.
+
+Every mutation of the configuration produces a :class:`ConfigEvent` naming
+what changed.  Subscribers (see :meth:`PasteWheelConfig.subscribe`) receive
+the events of one burst as a list, so a view can patch the affected widgets
+instead of rebuilding everything.
+
+Events raised during one Qt event-loop tick are coalesced and delivered
+together on the next tick, on the GUI thread (a zero-interval timer living
+there, started through a queued call when the event is raised on another
+thread).  Without a QCoreApplication, events are delivered synchronously.  Events raised inside
+a :meth:`PasteWheelConfig.transaction` are held until it commits and dropped
+if it rolls back.
+
+Coalescing rules for events about the same button:
+
+* added + updated    → added
+* added + removed    → nothing
+* updated + updated  → updated (union of the fields)
+* updated + removed  → removed
+* removed + added    → updated (fields unknown)
+
+``theme_changed`` and ``input_mode_changed`` keep only the latest value.
+``config_reloaded`` (a whole-configuration change) discards every event
+queued before it.
+"""
+import threading
+import weakref
+from debug_logger import DebugLogger
+
+# Set to True to enable debug logging to debug.txt
+DEBUG = False
+
+BUTTON_ADDED = "button_added"
+BUTTON_UPDATED = "button_updated"
+BUTTON_REMOVED = "button_removed"
+THEME_CHANGED = "theme_changed"
+INPUT_MODE_CHANGED = "input_mode_changed"
+CONFIG_RELOADED = "config_reloaded"
+
+BUTTON_EVENTS = (BUTTON_ADDED, BUTTON_UPDATED, BUTTON_REMOVED)
+
+
+class ConfigEvent:
+    """
+    One configuration change.
+
+    Attributes:
+        kind:      One of the event kind constants of this module.
+        button_id: Affected button id (button events only, else None).
+        fields:    For ``button_updated``: frozenset of changed field names,
+                   or None if any field may have changed.
+        value:     New value for ``theme_changed`` / ``input_mode_changed``.
+    """
+
+    __slots__ = ("kind", "button_id", "fields", "value")
+
+    def __init__(self, kind, button_id=None, fields=None, value=None):
+        self.kind = kind
+        self.button_id = button_id
+        self.fields = frozenset(fields) if fields is not None else None
+        self.value = value
+
+    def __eq__(self, other):
+        return isinstance(other, ConfigEvent) and (
+            (self.kind, self.button_id, self.fields, self.value)
+            == (other.kind, other.button_id, other.fields, other.value)
+        )
+
+    def __repr__(self):
+        parts = [self.kind]
+        if self.button_id is not None:
+            parts.append(repr(self.button_id))
+        if self.fields is not None:
+            parts.append(f"fields={sorted(self.fields)}")
+        if self.value is not None:
+            parts.append(f"value={self.value!r}")
+        return f"ConfigEvent({', '.join(parts)})"
+
+
+def _event_key(event):
+    if event.kind in BUTTON_EVENTS:
+        return ("button", event.button_id)
+    return (event.kind,)
+
+
+def _merge_events(previous, event):
+    """
+    Combine two events with the same key.
+
+    Returns:
+        Tuple of (keep, merged): *keep* is False if both events cancel out,
+        otherwise *merged* replaces *previous*.
+    """
+    if event.kind not in BUTTON_EVENTS:
+        return True, event
+    before, after = previous.kind, event.kind
+    if before == BUTTON_ADDED and after == BUTTON_UPDATED:
+        return True, previous
+    if before == BUTTON_ADDED and after == BUTTON_REMOVED:
+        return False, None
+    if before == BUTTON_UPDATED and after == BUTTON_UPDATED:
+        if previous.fields is None or event.fields is None:
+            fields = None
+        else:
+            fields = previous.fields | event.fields
+        return True, ConfigEvent(BUTTON_UPDATED, event.button_id, fields)
+    if before == BUTTON_REMOVED and after == BUTTON_ADDED:
+        return True, ConfigEvent(BUTTON_UPDATED, event.button_id)
+    return True, event
+
+
+class ConfigEventDispatcher:
+    """
+    Coalesces configuration events and delivers them to subscribers.
+
+    Bound methods are held through weak references, so a widget that
+    subscribed with one of its methods is dropped automatically once it is
+    garbage collected.
+    """
+
+    def __init__(self):
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._pending = {}      # event key -> ConfigEvent, in arrival order
+        self._scheduled = False
+        self._timer = None
+        self._held = 0          # > 0 while a transaction is open
+        self._held_events = []
+
+    # ------------------------------------------------------------------
+    # Subscriptions
+    # ------------------------------------------------------------------
+
+    def subscribe(self, callback):
+        """
+        Register *callback* to receive lists of :class:`ConfigEvent`.
+
+        Args:
+            callback: Callable taking one argument (the list of events).
+        """
+        if getattr(callback, "__self__", None) is not None:
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda callback=callback: callback  # noqa: E731
+        self._subscribers.append(ref)
+
+    def unsubscribe(self, callback):
+        """
+        Remove *callback*.
+
+        Returns:
+            True if it was subscribed, False otherwise
+        """
+        for ref in self._subscribers:
+            if ref() == callback:
+                self._subscribers.remove(ref)
+                return True
+        return False
+
+    # ------------------------------------------------------------------
+    # Emission
+    # ------------------------------------------------------------------
+
+    def emit(self, event):
+        """Queue *event* for delivery (or hold it while a transaction is open)."""
+        if self._held:
+            self._held_events.append(event)
+            return
+        self._queue(event)
+        self._schedule()
+
+    def hold(self):
+        """Start holding events (a transaction began)."""
+        self._held += 1
+
+    def release(self, deliver=True):
+        """
+        Stop holding events (a transaction ended).
+
+        Args:
+            deliver: False to drop the held events (the transaction rolled back).
+        """
+        self._held -= 1
+        if self._held:
+            return
+        events, self._held_events = self._held_events, []
+        if deliver and events:
+            for event in events:
+                self._queue(event)
+            self._schedule()
+
+    def flush(self):
+        """Deliver every queued event now."""
+        with self._lock:
+            self._scheduled = False
+            if not self._pending:
+                return
+            events = list(self._pending.values())
+            self._pending = {}
+        for ref in list(self._subscribers):
+            callback = ref()
+            if callback is None:
+                self._subscribers.remove(ref)
+                continue
+            try:
+                callback(events)
+            except Exception as e:
+                # One broken subscriber must not starve the others.
+                if DEBUG:
+                    DebugLogger.log(f"Config event subscriber {callback!r} failed: {e}")
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _queue(self, event):
+        with self._lock:
+            if event.kind == CONFIG_RELOADED:
+                self._pending = {}
+            key = _event_key(event)
+            previous = self._pending.pop(key, None)
+            if previous is not None:
+                keep, event = _merge_events(previous, event)
+                if not keep:
+                    return
+            self._pending[key] = event
+
+    def _schedule(self):
+        with self._lock:
+            if self._scheduled or not self._pending:
+                return
+            timer = self._ensure_timer()
+            if timer is not None:
+                self._scheduled = True
+        if timer is None:
+            self.flush()
+            return
+
+        from PyQt5.QtCore import QMetaObject, QThread, Qt  # noqa: PLC0415
+
+        if QThread.currentThread() is timer.thread():
+            timer.start()
+        else:
+            # A thread without an event loop would never run the timer
+            QMetaObject.invokeMethod(timer, "start", Qt.QueuedConnection)
+
+    def _ensure_timer(self):
+        """
+        Return the delivery QTimer, or None if no Qt event loop exists.
+
+        The timer lives on the application's (GUI) thread, so subscribers
+        are always called there.
+        """
+        if self._timer is not None:
+            return self._timer
+        try:
+            from PyQt5.QtCore import QCoreApplication, QTimer  # noqa: PLC0415
+        except ImportError:
+            return None
+        app = QCoreApplication.instance()
+        if app is None:
+            return None
+
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.flush)
+        if self._timer.thread() is not app.thread():
+            self._timer.moveToThread(app.thread())
+        return self._timer
@@ -0,0 +1,262 @@
+"""
+Append-only change journal for pastewheel_config.json.
+
+In journaled storage mode, each button upsert, field patch, delete and
+setting change is appended to ``<config>.journal`` as one compact JSON line
+instead of rewriting the whole configuration.  On load the journal is
+replayed over the JSON snapshot; once it grows past a size threshold the
+persister writes a fresh snapshot and deletes the journal.
+
+Record formats::
+
+    {"op": "put",   "button": {...}}           insert or replace a button
+    {"op": "patch", "id": "...", "fields": {...}}  update selected fields
+    {"op": "del",   "id": "..."}               remove a button
+    {"op": "set",   "key": "...", "value": ...}    set a top-level setting
+
+Every snapshot is written with a new generation number (GENERATION_KEY)
+and every journal line carries the generation of the snapshot it extends
+("gen").  Replay skips lines of any other generation, so a journal left
+behind by a crash between writing a snapshot and deleting the journal is
+never applied over the newer snapshot.
+"""
+import json
+import os
+from debug_logger import DebugLogger
+
+# Set to True to enable debug logging to debug.txt
+DEBUG = False
+
+
+# Top-level snapshot key holding the snapshot's generation number
+GENERATION_KEY = "journal_generation"
+
+
+def journal_path_for(config_path):
+    """Return the journal file path that belongs to *config_path*."""
+    return config_path + ".journal"
+
+
+def record_key(record):
+    """
+    Return the coalescing key of a change record.
+
+    Two records with the same key describe the same button or setting.
+    """
+    op = record["op"]
+    if op == "put":
+        return ("button", record["button"].get("id"))
+    if op == "set":
+        return ("setting", record["key"])
+    return ("button", record["id"])
+
+
+def merge_records(previous, record):
+    """
+    Combine two consecutive records for the same key into one, if possible.
+
+    Args:
+        previous: The earlier record.
+        record:   The later record for the same key.
+
+    Returns:
+        The merged record, or None if the two cannot be merged and must both
+        be kept (e.g. a delete followed by a re-insert).
+    """
+    op = record["op"]
+    previous_op = previous["op"]
+    if op == "put" and previous_op in ("put", "patch"):
+        return record
+    if op == "set" and previous_op == "set":
+        return record
+    if op == "patch" and previous_op == "put":
+        button = dict(previous["button"])
+        button.update(record["fields"])
+        return {"op": "put", "button": button}
+    if op == "patch" and previous_op == "patch":
+        fields = dict(previous["fields"])
+        fields.update(record["fields"])
+        return {"op": "patch", "id": record["id"], "fields": fields}
+    return None
+
+
+class ChangeBuffer:
+    """
+    Ordered buffer of change records that coalesces repeated edits.
+
+    Consecutive mergeable records for the same button or setting are folded
+    into one (see :func:`merge_records`); everything else keeps its order.
+    """
+
+    def __init__(self):
+        self._records = []
+        self._last_index = {}  # key -> index of the latest record for that key
+
+    def add(self, record):
+        key = record_key(record)
+        index = self._last_index.get(key)
+        if index is not None:
+            merged = merge_records(self._records[index], record)
+            if merged is not None:
+                self._records[index] = merged
+                return
+        self._last_index[key] = len(self._records)
+        self._records.append(record)
+
+    def extend(self, records):
+        for record in records:
+            self.add(record)
+
+    def take(self):
+        """Return the buffered records and empty the buffer."""
+        records = self._records
+        self._records = []
+        self._last_index = {}
+        return records
+
+    def __bool__(self):
+        return bool(self._records)
+
+
+def apply_record(config, buttons, positions, record):
+    """
+    Apply one change record to a configuration being replayed.
+
+    Args:
+        config:    Top-level settings dict (without "buttons").
+        buttons:   List of button dicts, mutated in place.
+        positions: Dict of button id -> index in *buttons*.
+        record:    Change record to apply.
+    """
+    op = record.get("op")
+    if op == "set":
+        config[record["key"]] = record["value"]
+    elif op == "put":
+        button = record["button"]
+        index = positions.get(button.get("id"))
+        if index is None:
+            positions[button.get("id")] = len(buttons)
+            buttons.append(button)
+        else:
+            buttons[index] = button
+    elif op == "patch":
+        index = positions.get(record["id"])
+        if index is not None:
+            button = dict(buttons[index])
+            button.update(record["fields"])
+            buttons[index] = button
+    elif op == "del":
+        index = positions.pop(record["id"], None)
+        if index is not None:
+            buttons[index] = None
+
+
+class ConfigJournal:
+    """
+    JSON-lines change journal stored next to a configuration file.
+
+    Args:
+        path: Journal file path (see :func:`journal_path_for`).
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def size(self):
+        """Return the journal size in bytes (0 if it does not exist)."""
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    @staticmethod
+    def encode(records, generation=None):
+        """
+        Encode *records* as compact JSON lines, tagged with *generation*
+        unless it is None.
+        """
+        if generation is not None:
+            records = (dict(record, gen=generation) for record in records)
+        return b"".join(
+            json.dumps(record, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n"
+            for record in records
+        )
+
+    def append(self, records, generation=None):
+        """
+        Durably append *records* to the journal.
+
+        Args:
+            records:    List of change records.
+            generation: Generation of the snapshot the records extend.
+
+        Returns:
+            Number of bytes appended
+        """
+        data = self.encode(records, generation)
+        if not data:
+            return 0
+        with open(self.path, "ab") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        return len(data)
+
+    def remove(self):
+        """Delete the journal file if it exists."""
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+    def replay(self, config, generation=None):
+        """
+        Apply every journal record to *config*.
+
+        A truncated or corrupt trailing line (e.g. from a crash mid-append)
+        ends the replay; everything before it is applied.  Records of
+        another generation than the snapshot's are skipped.
+
+        Args:
+            config:     Full configuration dict (with "buttons"), as read
+                        from the snapshot file, without GENERATION_KEY.
+            generation: Generation of that snapshot (None for snapshots
+                        written before generations existed).
+
+        Returns:
+            Tuple of (new configuration dict, number of records applied)
+        """
+        if not self.exists():
+            return config, 0
+
+        settings = dict(config)
+        buttons = list(settings.pop("buttons", None) or [])
+        positions = {b.get("id"): i for i, b in enumerate(buttons) if b.get("id") is not None}
+        applied = 0
+        try:
+            with open(self.path, "rb") as file:
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        if DEBUG:
+                            DebugLogger.log(f"Stopping journal replay at corrupt record {applied + 1}")
+                        break
+                    if record.get("gen") != generation:
+                        continue
+                    apply_record(settings, buttons, positions, record)
+                    applied += 1
+        except IOError as e:
+            if DEBUG:
+                DebugLogger.log(f"Error reading config journal: {e}")
+
+        kept = [b for b in buttons if b is not None]
+        result = {}
+        for key in config:
+            result[key] = kept if key == "buttons" else settings.pop(key)
+        result.setdefault("buttons", kept)
+        result.update(settings)
+        return result, applied
@@ -0,0 +1,279 @@
+"""
+Write-behind persistence for PasteWheelConfig.
+
+Mutations mark the configuration dirty instead of rewriting the file.  When
+a Qt event loop is running, dirty state is coalesced for COALESCE_MS on the
+GUI thread, then handed to a background writer thread that performs the
+actual disk I/O through a :class:`~config_storage.StorageBackend`.  Without
+a QCoreApplication (scripts, tests) every change is written through
+synchronously.
+
+Changes arrive as change records (see :mod:`config_journal`).  Incremental
+backends (the JSON backend in "journal" mode, SQLite) persist just those
+records, so a small edit writes bytes proportional to the edited button;
+other backends receive a full snapshot.  When a backend asks for compaction,
+a snapshot is sent along with the records.
+
+Call :meth:`ConfigPersister.flush` to force pending state to disk.
+:func:`flush_all` flushes every live persister; it is connected to
+``QApplication.aboutToQuit`` and registered with atexit once for the
+module, which only holds weak references to the persisters.
+"""
+import atexit
+import collections
+import threading
+import weakref
+from debug_logger import DebugLogger
+from config_journal import ChangeBuffer
+
+# Set to True to enable debug logging to debug.txt
+DEBUG = False
+
+# Persisters flushed at exit; weak so configurations can be collected
+_live_persisters = weakref.WeakSet()
+_quit_hooked = False
+
+
+def flush_all():
+    """Flush every live ConfigPersister (see ConfigPersister.flush)."""
+    for persister in list(_live_persisters):
+        persister.flush()
+
+
+atexit.register(flush_all)
+
+
+class ConfigPersister:
+    """
+    Coalescing write-behind writer for one storage backend.
+
+    Args:
+        backend:     :class:`~config_storage.StorageBackend` that performs the I/O.
+        snapshot:    Callable returning the current configuration as a plain
+                     dict.  Called on the thread that marked the state dirty;
+                     it must return a structure that is not mutated afterwards
+                     (PasteWheelConfig replaces button dicts instead of
+                     editing them, so a shallow copy is enough).
+        on_written:  Optional callable invoked with the written snapshot (or
+                     None) after each write, while the persister still
+                     reports itself busy.
+        prepare:     Optional callable invoked before each write, on the
+                     thread that performs it (e.g. to write the payload
+                     blobs the configuration is about to reference).
+        on_error:    Optional callable invoked with the exception of a
+                     failed write, on the thread that performed it.  Failures
+                     are also counted in :attr:`write_failures` and kept in
+                     :attr:`last_error`.
+
+    The writer thread only runs while jobs are queued and exits once the
+    queue is empty, so it never keeps the persister (or its configuration)
+    alive.
+    """
+
+    # Coalescing window for bursts of edits, in milliseconds.
+    COALESCE_MS = 250
+
+    def __init__(self, backend, snapshot, on_written=None, prepare=None, on_error=None):
+        self.backend = backend
+        self._snapshot = snapshot
+        self._on_written = on_written
+        self._prepare = prepare
+        self._on_error = on_error
+
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._jobs = collections.deque()
+        self._in_flight = False
+        self._writer_running = False
+        self._timer = None
+
+        # Dirty state accumulated on the GUI thread
+        self._dirty = False
+        self._needs_snapshot = False
+        self._changes = ChangeBuffer()
+
+        # Write statistics
+        self.write_count = 0
+        self.bytes_written = 0
+        self.write_failures = 0
+        self.last_error = None
+
+        _live_persisters.add(self)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def mark_dirty(self, records=None):
+        """
+        Record that the configuration changed.
+
+        Schedules a coalesced background write when a Qt event loop is
+        available, otherwise writes synchronously.
+
+        Args:
+            records: Change records describing the change (see
+                     :mod:`config_journal`), or None when the change cannot be
+                     described that way and a full snapshot is needed.
+        """
+        self._dirty = True
+        if records is None or not self.backend.incremental:
+            self._needs_snapshot = True
+        else:
+            self._changes.extend(records)
+
+        timer = self._ensure_timer()
+        if timer is None:
+            self.flush()
+        elif not timer.isActive():
+            self._start_timer(timer)
+
+    def flush(self):
+        """
+        Write any pending state to disk now and wait for it to land.
+
+        Safe to call at any time; a no-op when nothing is dirty or pending.
+        """
+        if self._timer is not None:
+            self._timer.stop()
+        self._enqueue_dirty()
+
+        with self._lock:
+            if self._writer_running:
+                # The writer drains the queue before it exits
+                while self._jobs or self._in_flight:
+                    self._idle.wait()
+                return
+        while True:
+            with self._lock:
+                if not self._jobs:
+                    break
+                job = self._jobs.popleft()
+            self._run_job(job)
+
+    def is_busy(self):
+        """Return True while changes are dirty, queued or being written."""
+        with self._lock:
+            return self._dirty or bool(self._jobs) or self._in_flight
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _ensure_timer(self):
+        """
+        Return the coalescing QTimer, or None if no Qt event loop exists.
+
+        The timer lives on the application's (GUI) thread whichever thread
+        first marks the configuration dirty, so the coalesced snapshot is
+        always taken there.
+        """
+        global _quit_hooked
+        if self._timer is not None:
+            return self._timer
+        try:
+            from PyQt5.QtCore import QCoreApplication, QTimer  # noqa: PLC0415
+        except ImportError:
+            return None
+        app = QCoreApplication.instance()
+        if app is None:
+            return None
+
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_timeout)
+        if self._timer.thread() is not app.thread():
+            self._timer.moveToThread(app.thread())
+        if not _quit_hooked:
+            app.aboutToQuit.connect(flush_all)
+            _quit_hooked = True
+        return self._timer
+
+    def _start_timer(self, timer):
+        """Start *timer*, from its own thread (QTimer cannot be started from another)."""
+        from PyQt5.QtCore import QMetaObject, QThread, Qt, Q_ARG  # noqa: PLC0415
+
+        if QThread.currentThread() is timer.thread():
+            timer.start(self.COALESCE_MS)
+        else:
+            QMetaObject.invokeMethod(timer, "start", Qt.QueuedConnection, Q_ARG(int, self.COALESCE_MS))
+
+    def _enqueue_dirty(self):
+        """
+        Turn the accumulated dirty state into a writer job.
+
+        Runs on the thread that owns the configuration, so the snapshot is
+        consistent with the change records queued before it.
+
+        Returns:
+            True if a job was queued
+        """
+        if not self._dirty:
+            return False
+        self._dirty = False
+
+        incremental = self.backend.incremental
+        records = self._changes.take()
+        needs_snapshot = self._needs_snapshot or not incremental
+        if records and self.backend.needs_compaction():
+            needs_snapshot = True
+        self._needs_snapshot = False
+
+        snapshot = self._snapshot() if needs_snapshot else None
+        with self._lock:
+            if snapshot is not None and not incremental:
+                # An older full snapshot still waiting in the queue is obsolete.
+                self._jobs = collections.deque(job for job in self._jobs if job[1])
+            self._jobs.append((snapshot, records or []))
+        return True
+
+    def _on_timeout(self):
+        """Coalescing window elapsed: hand the dirty state to the writer thread."""
+        if self._enqueue_dirty():
+            self._ensure_writer()
+
+    def _ensure_writer(self):
+        """Start the writer thread unless it is already draining the queue."""
+        with self._lock:
+            if self._writer_running:
+                return
+            self._writer_running = True
+        threading.Thread(
+            target=self._writer_loop, name="PasteWheelConfigWriter", daemon=True
+        ).start()
+
+    def _writer_loop(self):
+        """Write queued jobs until the queue is empty, then exit."""
+        while True:
+            with self._lock:
+                if not self._jobs:
+                    self._writer_running = False
+                    self._idle.notify_all()
+                    return
+                job = self._jobs.popleft()
+                self._in_flight = True
+            try:
+                self._run_job(job)
+            finally:
+                with self._lock:
+                    self._in_flight = False
+
+    def _run_job(self, job):
+        """Perform one write through the backend."""
+        snapshot, records = job
+        with self._io_lock:
+            try:
+                if self._prepare is not None:
+                    self._prepare()
+                self.bytes_written += self.backend.write(snapshot, records)
+                self.write_count += 1
+                if self._on_written is not None:
+                    self._on_written(snapshot)
+            except (IOError, OSError, TypeError, ValueError) as e:
+                self.write_failures += 1
+                self.last_error = e
+                if DEBUG:
+                    DebugLogger.log(f"Error writing config file: {e}")
+                if self._on_error is not None:
+                    self._on_error(e)
@@ -0,0 +1,544 @@
+"""
+Storage backends for PasteWheelConfig.
+
+A backend owns the on-disk representation of the configuration.  It loads
+the full configuration dict, applies change records (see
+:mod:`config_journal`) and full snapshots handed over by the write-behind
+:class:`~config_persistence.ConfigPersister`, and can optionally load
+clipboard payloads lazily.
+
+* :class:`JsonStorageBackend` — the default; ``pastewheel_config.json``,
+  optionally with an append-only change journal ("journal" storage mode).
+* :class:`SQLiteStorageBackend` — one row per button with indexed id, layer,
+  parent_id and button_type columns.  Button metadata is loaded at startup;
+  clipboard payloads stay in the database until a button needs them.
+"""
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from config_journal import GENERATION_KEY, ConfigJournal, journal_path_for
+
+STORAGE_MODES = ("snapshot", "journal")
+
+
+def atomic_write_bytes(path, data):
+    """
+    Replace *path* with *data* so readers never observe a partial file.
+
+    The bytes are written to a temporary file in the same directory, flushed
+    and fsync()ed, then renamed over *path*.
+
+    Args:
+        path: Destination file path.
+        data: Bytes to write.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(
+        dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _file_signature(path):
+    """Return (mtime_ns, size, inode) for *path*, or None if it is missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+class StorageBackend:
+    """
+    Interface implemented by every configuration storage backend.
+
+    Methods that touch the disk may be called from the persister's writer
+    thread (:meth:`write`) and from the GUI thread (:meth:`load`,
+    :meth:`load_payload`, :meth:`signature`), so implementations must be safe
+    to use from both.
+    """
+
+    # True if buttons returned by load() may lack their "clipboard" payload,
+    # which must then be fetched with load_payload().
+    lazy_payloads = False
+
+    # True if write() can persist change records without a full snapshot.
+    incremental = False
+
+    def exists(self):
+        """Return True if stored configuration exists."""
+        raise NotImplementedError
+
+    def signature(self):
+        """
+        Return a value that changes whenever the stored data changes, or None
+        if nothing is stored.  Used to detect edits by other processes.
+        """
+        raise NotImplementedError
+
+    def load(self):
+        """
+        Load the stored configuration.
+
+        Returns:
+            Full configuration dict including a "buttons" list
+
+        Raises:
+            ValueError: If the stored data is corrupt
+            IOError: If the data cannot be read
+        """
+        raise NotImplementedError
+
+    def write(self, snapshot, records):
+        """
+        Persist one writer job.
+
+        Args:
+            snapshot: Full configuration dict to store, or None.
+            records:  List of change records to apply before the snapshot.
+
+        Returns:
+            Number of bytes handed to the operating system (best effort)
+        """
+        raise NotImplementedError
+
+    def needs_compaction(self):
+        """Return True if the next write should include a full snapshot."""
+        return False
+
+    def load_payload(self, button_id):
+        """
+        Return the stored clipboard list for *button_id*, or None.
+        Only needed by backends with ``lazy_payloads``.
+        """
+        return None
+
+    def set_mode(self, mode):
+        """
+        Select a storage mode (see STORAGE_MODES).  Backends without modes
+        accept and ignore it.
+
+        Raises:
+            ValueError: If mode is not a known storage mode
+        """
+        if mode not in STORAGE_MODES:
+            raise ValueError(f"Storage mode must be one of {STORAGE_MODES}")
+
+
+class JsonStorageBackend(StorageBackend):
+    """
+    Configuration stored as one JSON document, optionally with a change
+    journal next to it.
+
+    In "snapshot" mode every write replaces the whole file atomically.  In
+    "journal" mode change records are appended to ``<path>.journal`` and a
+    snapshot is only written once the journal passes COMPACT_BYTES.  The
+    file stores the snapshot's generation under GENERATION_KEY (see
+    :mod:`config_journal`); :meth:`load` removes it from the returned dict.
+
+    Args:
+        path: JSON configuration file path.
+        mode: "snapshot" or "journal".
+    """
+
+    # Journal size after which a compacting snapshot is written.
+    COMPACT_BYTES = 1024 * 1024
+
+    def __init__(self, path, mode="snapshot"):
+        self.path = path
+        self.journal = ConfigJournal(journal_path_for(path))
+        self.mode = "snapshot"
+        self.set_mode(mode)
+        self._journal_bytes = self.journal.size()
+        # Generation of the snapshot on disk, valid while the file still has
+        # _generation_signature (another process may replace it)
+        self._generation = None
+        self._generation_signature = None
+
+    @property
+    def incremental(self):
+        return self.mode == "journal"
+
+    def set_mode(self, mode):
+        super().set_mode(mode)
+        self.mode = mode
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def signature(self):
+        config_signature = _file_signature(self.path)
+        if config_signature is None:
+            return None
+        return (config_signature, _file_signature(self.journal.path))
+
+    def load(self):
+        with open(self.path, 'r') as file:
+            config = json.load(file)
+        generation = config.pop(GENERATION_KEY, None)
+        self._remember_generation(generation)
+        # Apply changes recorded in journaled storage mode
+        config, _ = self.journal.replay(config, generation)
+        return config
+
+    def needs_compaction(self):
+        return self._journal_bytes >= self.COMPACT_BYTES
+
+    def write(self, snapshot, records):
+        """
+        Replace the file with *snapshot* (which already contains the effects
+        of *records*) under a new generation and delete the journal, or,
+        without a snapshot, append *records* to the journal tagged with the
+        current generation.  A crash at any point leaves a snapshot whose
+        journal replays to the latest durable state: journal lines of an
+        older snapshot are skipped.
+        """
+        if snapshot is None:
+            if not records:
+                return 0
+            appended = self.journal.append(records, self._current_generation())
+            self._journal_bytes += appended
+            return appended
+
+        generation = (self._current_generation() or 0) + 1
+        document = dict(snapshot)
+        document[GENERATION_KEY] = generation
+        data = json.dumps(document, indent=4).encode("utf-8")
+        atomic_write_bytes(self.path, data)
+        self._remember_generation(generation)
+        if self._journal_bytes or self.journal.exists():
+            self.journal.remove()
+            self._journal_bytes = 0
+        return len(data)
+
+    def _remember_generation(self, generation):
+        self._generation = generation
+        self._generation_signature = _file_signature(self.path)
+
+    def _current_generation(self):
+        """
+        Return the generation of the snapshot on disk, re-reading it if the
+        file changed since it was last loaded or written.
+        """
+        if _file_signature(self.path) != self._generation_signature:
+            try:
+                with open(self.path, 'r') as file:
+                    self._remember_generation(json.load(file).get(GENERATION_KEY))
+            except (IOError, ValueError):
+                pass
+        return self._generation
+
+
+class SQLiteStorageBackend(StorageBackend):
+    """
+    Configuration stored in an SQLite database.
+
+    Each button is one row.  ``id``, ``layer``, ``parent_id`` and
+    ``button_type`` are indexed columns; the rest of the button metadata is
+    kept verbatim as JSON in ``meta`` and the clipboard payload in its own
+    ``clipboard`` column, which :meth:`load` skips.  Top-level settings live
+    in a key/value table.
+
+    Every thread gets its own connection; the database runs in WAL mode so
+    GUI-thread payload reads never wait for the writer thread's commits.
+
+    Args:
+        path: Database file path.
+    """
+
+    lazy_payloads = True
+    incremental = True
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS settings (
+            key   TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            position INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS buttons (
+            id          TEXT PRIMARY KEY,
+            position    INTEGER NOT NULL,
+            layer       INTEGER,
+            parent_id   TEXT,
+            button_type TEXT,
+            meta        TEXT NOT NULL,
+            clipboard   TEXT
+        );
+        CREATE INDEX IF NOT EXISTS buttons_position ON buttons (position);
+        CREATE INDEX IF NOT EXISTS buttons_layer ON buttons (layer, button_type);
+        CREATE INDEX IF NOT EXISTS buttons_parent ON buttons (parent_id);
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._position_lock = threading.Lock()
+        self._next_position = None
+
+    # ------------------------------------------------------------------
+    # Connections
+    # ------------------------------------------------------------------
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(self.SCHEMA)
+            self._local.connection = connection
+        return connection
+
+    def close(self):
+        """Close the calling thread's connection, if open."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    # ------------------------------------------------------------------
+    # StorageBackend
+    # ------------------------------------------------------------------
+
+    def exists(self):
+        if not os.path.exists(self.path):
+            return False
+        try:
+            row = self._connection().execute("SELECT COUNT(*) FROM settings").fetchone()
+        except sqlite3.Error:
+            return True  # Let load() report the corruption
+        return row[0] > 0
+
+    def signature(self):
+        main = _file_signature(self.path)
+        if main is None:
+            return None
+        return (main, _file_signature(self.path + "-wal"))
+
+    def load(self):
+        try:
+            connection = self._connection()
+            settings = connection.execute(
+                "SELECT key, value FROM settings ORDER BY position"
+            ).fetchall()
+            rows = connection.execute(
+                "SELECT meta FROM buttons ORDER BY position"
+            ).fetchall()
+            max_position = connection.execute("SELECT MAX(position) FROM buttons").fetchone()[0]
+        except sqlite3.Error as e:
+            raise IOError(f"Cannot read {self.path}: {e}") from e
+
+        with self._position_lock:
+            self._next_position = (max_position if max_position is not None else -1) + 1
+
+        config = {}
+        for key, value in settings:
+            config[key] = json.loads(value)
+        config["buttons"] = [json.loads(meta) for (meta,) in rows]
+        return config
+
+    def load_payload(self, button_id):
+        try:
+            row = self._connection().execute(
+                "SELECT clipboard FROM buttons WHERE id = ?", (button_id,)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None or row[0] is None:
+            return None
+        return json.loads(row[0])
+
+    def write(self, snapshot, records):
+        written = 0
+        try:
+            connection = self._connection()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                for record in records or ():
+                    written += self._apply_record(connection, record)
+                if snapshot is not None:
+                    written += self._write_snapshot(connection, snapshot)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        except sqlite3.Error as e:
+            raise IOError(f"Cannot write {self.path}: {e}") from e
+        return written
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def _allocate_position(self, connection):
+        with self._position_lock:
+            if self._next_position is None:
+                max_position = connection.execute("SELECT MAX(position) FROM buttons").fetchone()[0]
+                self._next_position = (max_position if max_position is not None else -1) + 1
+            position = self._next_position
+            self._next_position += 1
+            return position
+
+    def _upsert_button(self, connection, button, position=None):
+        meta_dict = {k: v for k, v in button.items() if k != "clipboard"}
+        meta = json.dumps(meta_dict, ensure_ascii=False)
+        columns = (
+            button.get("id"), button.get("layer"), button.get("parent_id"),
+            button.get("button_type"), meta,
+        )
+        has_payload = "clipboard" in button
+        payload = json.dumps(button["clipboard"], ensure_ascii=False) if has_payload else None
+
+        exists = connection.execute(
+            "SELECT 1 FROM buttons WHERE id = ?", (button.get("id"),)
+        ).fetchone() is not None
+        if exists:
+            connection.execute(
+                "UPDATE buttons SET layer = ?, parent_id = ?, button_type = ?, meta = ?"
+                + (", clipboard = ?" if has_payload else "")
+                + (", position = ?" if position is not None else "")
+                + " WHERE id = ?",
+                columns[1:] + ((payload,) if has_payload else ())
+                + ((position,) if position is not None else ()) + (columns[0],),
+            )
+        else:
+            if position is None:
+                position = self._allocate_position(connection)
+            connection.execute(
+                "INSERT INTO buttons (id, position, layer, parent_id, button_type, meta, clipboard)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (columns[0], position) + columns[1:] + (payload,),
+            )
+        return len(meta) + (len(payload) if payload else 0)
+
+    def _apply_record(self, connection, record):
+        op = record.get("op")
+        if op == "put":
+            return self._upsert_button(connection, record["button"])
+        if op == "patch":
+            row = connection.execute(
+                "SELECT meta FROM buttons WHERE id = ?", (record["id"],)
+            ).fetchone()
+            if row is None:
+                return 0
+            button = json.loads(row[0])
+            button.update(record["fields"])
+            return self._upsert_button(connection, button)
+        if op == "del":
+            connection.execute("DELETE FROM buttons WHERE id = ?", (record["id"],))
+            return 0
+        if op == "set":
+            value = json.dumps(record["value"], ensure_ascii=False)
+            connection.execute(
+                "INSERT INTO settings (key, value, position) VALUES (?, ?,"
+                " (SELECT COALESCE(MAX(position), -1) + 1 FROM settings))"
+                " ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (record["key"], value),
+            )
+            return len(value)
+        return 0
+
+    def _write_snapshot(self, connection, snapshot):
+        """
+        Make the database match *snapshot*.  Buttons without a "clipboard"
+        key keep their stored payload.
+        """
+        written = 0
+        connection.execute("DELETE FROM settings")
+        position = 0
+        for key, value in snapshot.items():
+            if key == "buttons":
+                continue
+            encoded = json.dumps(value, ensure_ascii=False)
+            connection.execute(
+                "INSERT INTO settings (key, value, position) VALUES (?, ?, ?)",
+                (key, encoded, position),
+            )
+            position += 1
+            written += len(encoded)
+
+        buttons = [b for b in snapshot.get("buttons", []) if b.get("id") is not None]
+        connection.execute("CREATE TEMP TABLE IF NOT EXISTS keep_ids (id TEXT PRIMARY KEY)")
+        connection.execute("DELETE FROM keep_ids")
+        connection.executemany("INSERT OR IGNORE INTO keep_ids (id) VALUES (?)", [(b["id"],) for b in buttons])
+        connection.execute("DELETE FROM buttons WHERE id NOT IN (SELECT id FROM keep_ids)")
+        for index, button in enumerate(buttons):
+            written += self._upsert_button(connection, button, position=index)
+        with self._position_lock:
+            self._next_position = len(buttons)
+        return written
+
+    # ------------------------------------------------------------------
+    # Import / export
+    # ------------------------------------------------------------------
+
+    def import_json(self, json_path):
+        """
+        Replace the database contents with a JSON configuration file (its
+        change journal, if any, is applied first).
+
+        Args:
+            json_path: Path of a pastewheel_config.json-format file.
+
+        Returns:
+            Number of buttons imported
+        """
+        config = JsonStorageBackend(json_path).load()
+        self.write(config, None)
+        return len(config.get("buttons", []))
+
+    def export_json(self, json_path):
+        """
+        Write the database contents, payloads included, as a
+        pastewheel_config.json-format file.
+
+        Args:
+            json_path: Destination path.
+
+        Returns:
+            Number of buttons exported
+        """
+        config = self.load()
+        connection = self._connection()
+        payloads = dict(connection.execute("SELECT id, clipboard FROM buttons").fetchall())
+        for button in config["buttons"]:
+            payload = payloads.get(button.get("id"))
+            if payload is not None:
+                button["clipboard"] = json.loads(payload)
+        atomic_write_bytes(json_path, json.dumps(config, indent=4).encode("utf-8"))
+        return len(config["buttons"])
+
+
+def create_backend(name, path, mode="snapshot"):
+    """
+    Build a storage backend by name.
+
+    Args:
+        name: "json" or "sqlite".
+        path: File path for the backend.
+        mode: Storage mode for the JSON backend.
+
+    Returns:
+        StorageBackend instance
+
+    Raises:
+        ValueError: If name is not a known backend
+    """
+    if name == "json":
+        return JsonStorageBackend(path, mode=mode)
+    if name == "sqlite":
+        return SQLiteStorageBackend(path)
+    raise ValueError("Storage backend must be either 'json' or 'sqlite'")
@@ -0,0 +1,214 @@
+"""
+Compact binary emoji catalog, read through ``mmap``.
+
+``build_emoji_catalog.py`` writes the file once; PasteWheel maps it instead
+of parsing ``emoji_data.json``, so opening the picker does not build a dict
+of a few thousand entries or emojize every code.
+
+Layout (little-endian, every section 4-byte aligned)::
+
+    header      "<4sHHI"   magic b"PWEC", version, reserved, entry count N
+    offsets     u32[3N+1]  string table offsets; entry i's code, glyph and
+                           description are strings 3i, 3i+1 and 3i+2
+    order       u32[N]     entry indexes sorted by code
+    ranks       u32[N]     position of each entry in ``order``
+    categories  u8[N]      index into CATEGORY_IDS (len(CATEGORY_IDS) = other),
+                           padded to 4 bytes
+    strings     UTF-8 string table
+
+Entries are stored grouped by category and sorted by code inside each
+category, which is the order :class:`EmojiCatalog` keeps them in.
+"""
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Mapping
+
+MAGIC = b"PWEC"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI")
+
+# Category ids in display order; the file stores indexes into this tuple
+CATEGORY_IDS = ("smiley", "nature", "food", "activities", "travel", "objects", "symbols", "flags")
+
+# Category index of entries whose category is missing or unknown
+OTHER_CATEGORY = len(CATEGORY_IDS)
+
+
+def category_index(category):
+    """Return the stored index of category id *category* (OTHER_CATEGORY if unknown)."""
+    try:
+        return CATEGORY_IDS.index((category or "").strip().lower())
+    except ValueError:
+        return OTHER_CATEGORY
+
+
+def _pad(data):
+    return data + b"\0" * (-len(data) % 4)
+
+
+def _u32(values):
+    """Little-endian bytes of a u32 sequence."""
+    data = array('I', values)
+    if sys.byteorder != "little":
+        data.byteswap()
+    return data.tobytes()
+
+
+def write_catalog(path, entries):
+    """
+    Write a catalog file.
+
+    Args:
+        path:    Output file.
+        entries: Iterable of ``(code, glyph, description, category)`` tuples;
+                 *category* is a category id.
+
+    Returns:
+        Number of entries written
+    """
+    rows = sorted(
+        ((category_index(category), code, glyph, description or "")
+         for code, glyph, description, category in entries),
+        key=lambda row: (row[0], row[1]),
+    )
+    count = len(rows)
+
+    strings = bytearray()
+    offsets = [0]
+    for _, code, glyph, description in rows:
+        for text in (code, glyph, description):
+            strings += text.encode("utf-8")
+            offsets.append(len(strings))
+
+    order = sorted(range(count), key=lambda i: rows[i][1])
+    ranks = [0] * count
+    for rank, index in enumerate(order):
+        ranks[index] = rank
+
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, 0, count))
+        file.write(_u32(offsets))
+        file.write(_u32(order))
+        file.write(_u32(ranks))
+        file.write(_pad(bytes(row[0] for row in rows)))
+        file.write(bytes(strings))
+    return count
+
+
+class StringColumn:
+    """
+    One string field of every entry, decoded from the map on access.
+
+    Supports ``len()`` and indexing like the lists of a dict-built catalog.
+    """
+
+    def __init__(self, catalog, field):
+        self._catalog = catalog
+        self._field = field
+
+    def __len__(self):
+        return len(self._catalog)
+
+    def __getitem__(self, index):
+        if not -len(self) <= index < len(self):
+            raise IndexError("catalog index out of range")
+        return self._catalog.string(3 * (index % len(self)) + self._field)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self._catalog.string(3 * index + self._field)
+
+
+class MappedEmojiCatalog(Mapping):
+    """
+    Read-only view of a catalog file.
+
+    As a mapping it has the shape ``emoji_data.json`` has (colon code →
+    ``{"description", "category"}``), looked up by binary search over the
+    code order, so code that used the JSON dict keeps working.  The
+    columns (:attr:`codes`, :attr:`glyphs`, :attr:`descriptions`,
+    :attr:`categories`, :attr:`order`, :attr:`ranks`) are views into the map.
+
+    Args:
+        path: Catalog file written by :func:`write_catalog`.
+
+    Raises:
+        OSError:    If the file cannot be opened or mapped.
+        ValueError: If it is not a catalog file of this version.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._map)
+        if len(view) < HEADER.size:
+            raise ValueError(f"Not an emoji catalog: {path}")
+        magic, version, _, count = HEADER.unpack_from(view)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not an emoji catalog (version {VERSION}): {path}")
+
+        position = HEADER.size
+        sections = []
+        for length in (3 * count + 1, count, count):
+            sections.append(self._u32_view(view, position, length))
+            position += 4 * length
+        self._offsets, self.order, self.ranks = sections
+        self.categories = view[position:position + count]
+        position += count + (-count % 4)
+        self._strings = view[position:]
+        if len(self._strings) < self._offsets[-1]:
+            raise ValueError(f"Truncated emoji catalog: {path}")
+
+        self._count = count
+        self.codes = StringColumn(self, 0)
+        self.glyphs = StringColumn(self, 1)
+        self.descriptions = StringColumn(self, 2)
+
+    @staticmethod
+    def _u32_view(view, position, length):
+        section = view[position:position + 4 * length]
+        if sys.byteorder == "little":
+            return section.cast('I')
+        values = array('I', section.tobytes())
+        values.byteswap()
+        return values
+
+    def string(self, index):
+        """Return string *index* of the string table."""
+        return str(self._strings[self._offsets[index]:self._offsets[index + 1]], "utf-8")
+
+    def index_of(self, code):
+        """Return the entry index of *code*, or None."""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            candidate = self.codes[self.order[middle]]
+            if candidate < code:
+                low = middle + 1
+            elif candidate > code:
+                high = middle
+            else:
+                return self.order[middle]
+        return None
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        for index in self.order:
+            yield self.codes[index]
+
+    def __contains__(self, code):
+        return isinstance(code, str) and self.index_of(code) is not None
+
+    def __getitem__(self, code):
+        index = self.index_of(code) if isinstance(code, str) else None
+        if index is None:
+            raise KeyError(code)
+        category = self.categories[index]
+        return {
+            "description": self.descriptions[index],
+            "category": CATEGORY_IDS[category] if category < OTHER_CATEGORY else "",
+        }
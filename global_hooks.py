@@ -0,0 +1,370 @@
+"""
+Global input hooks for PasteWheel.
+
+Everything that hooks system-wide input goes through this module: the
+sequential paste Ctrl+V hook and its skip/back hotkeys, and the activation
+trigger (hotkey or mouse button).
+
+When :func:`start_host` has been called, the hooks live in the helper
+process of :mod:`hook_host` and their callbacks run on the GUI thread.
+Otherwise they are installed in-process with the ``keyboard`` / ``pynput``
+libraries, and their callbacks run on those libraries' threads.  Callers
+must therefore keep callbacks thread-agnostic (emit a queued signal, or
+touch only thread-safe state).
+"""
+import itertools
+import json
+import os
+import sys
+import time
+from PyQt5.QtCore import QObject, QProcess, pyqtSignal
+from debug_logger import DebugLogger
+import paste_backends
+
+# Set to True to enable debug logging to debug.txt
+DEBUG = False
+
+HOOK_HOST_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "hook_host.py")
+
+
+class HookHostClient(QObject):
+    """
+    GUI side of the :mod:`hook_host` pipe.
+
+    Hook events arrive through QProcess on the GUI thread; replay hotkeys are
+    answered right after their callback returns.  A replay hotkey read after
+    the helper's watchdog released its keystroke (a "timeout" for its seq is
+    already buffered, or less than :attr:`LATE_MARGIN_MS` is left before its
+    deadline) is dropped without running the callback, so a late answer
+    never moves the sequential paste past a string that was not pasted.
+    Unparseable lines are skipped.  If the helper dies it is restarted (up
+    to :attr:`MAX_RESTARTS` times) and its hooks re-registered.
+
+    Args:
+        deadline_ms: Watchdog deadline passed to the helper.
+        parent:      Optional QObject parent.
+    """
+
+    START_TIMEOUT_MS = 3000
+    MAX_RESTARTS = 3
+    # Time a replay callback needs before the helper's deadline
+    LATE_MARGIN_MS = 5
+
+    # Emitted when the helper reports new latency histograms (see hook_host)
+    stats_changed = pyqtSignal(dict)
+
+    def __init__(self, deadline_ms=50, parent=None):
+        super().__init__(parent)
+        self.deadline_ms = deadline_ms
+        self.latency_stats = {}
+        self.timeouts = 0
+        self.late_events = 0
+        self._registrations = {}   # name → (register request, callback)
+        self._names = itertools.count(1)
+        self._buffer = b""
+        self._restarts = 0
+        self._stopping = False
+        self._process = None
+
+    def start(self):
+        """
+        Launch the helper and wait until it is ready.
+
+        Returns:
+            True if the helper runs and can hook input, False otherwise
+        """
+        process = QProcess(self)
+        process.setProcessChannelMode(QProcess.SeparateChannels)
+        process.start(sys.executable, [HOOK_HOST_SCRIPT, "--deadline-ms", str(self.deadline_ms)])
+        if not process.waitForStarted(self.START_TIMEOUT_MS):
+            process.deleteLater()
+            return False
+        while b"\n" not in self._buffer:
+            if not process.waitForReadyRead(self.START_TIMEOUT_MS):
+                process.kill()
+                process.deleteLater()
+                return False
+            self._buffer += bytes(process.readAllStandardOutput())
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        try:
+            ready = json.loads(line).get("event") == "ready"
+        except ValueError:
+            ready = False
+        if not ready:
+            if DEBUG:
+                DebugLogger.log(f"Hook host failed to start: {line.decode('utf-8', 'replace')}")
+            process.waitForFinished(self.START_TIMEOUT_MS)
+            process.deleteLater()
+            return False
+
+        self._process = process
+        process.readyReadStandardOutput.connect(self._on_ready_read)
+        process.finished.connect(self._on_finished)
+        for request, _ in self._registrations.values():
+            self._send(request)
+        if self._buffer:
+            self._on_ready_read()
+        return True
+
+    def stop(self):
+        """Close the pipe; the helper removes its hooks and exits."""
+        self._stopping = True
+        if self._process is not None:
+            self._process.closeWriteChannel()
+            if not self._process.waitForFinished(1000):
+                self._process.kill()
+            self._process = None
+
+    def owns(self, handle):
+        return handle in self._registrations
+
+    def add_hotkey(self, hotkey, callback, suppress=False, replay=False):
+        """Register a hotkey in the helper; returns its handle."""
+        return self._register(
+            {"hotkey": hotkey, "suppress": suppress, "replay": replay}, callback
+        )
+
+    def add_mouse_button(self, button, callback):
+        """
+        Watch a mouse button ("left", "middle", "right", …) in the helper;
+        *callback(pressed)* gets True on press and False on release.
+        Returns its handle.
+        """
+        return self._register({"mouse": button}, callback)
+
+    def remove(self, handle):
+        if self._registrations.pop(handle, None) is not None:
+            self._send({"op": "unregister", "name": handle})
+
+    def request_stats(self):
+        """Ask the helper for its histograms; answered via :attr:`stats_changed`."""
+        self._send({"op": "stats"})
+
+    def fetch_stats(self, timeout_ms=500):
+        """
+        Ask the helper for its histograms and wait for the answer.
+
+        Events arriving meanwhile are dispatched as usual.
+
+        Returns:
+            The new statistics, or None if the helper did not answer
+            within *timeout_ms*
+        """
+        received = []
+
+        def on_stats(stats):
+            received.append(stats)
+
+        self.stats_changed.connect(on_stats)
+        try:
+            self.request_stats()
+            deadline = time.monotonic() + timeout_ms / 1000
+            while not received:
+                remaining = int((deadline - time.monotonic()) * 1000)
+                process = self._process
+                if remaining <= 0 or process is None or not process.waitForReadyRead(remaining):
+                    break
+                if self._process is process:
+                    self._on_ready_read()
+        finally:
+            self.stats_changed.disconnect(on_stats)
+        return received[0] if received else None
+
+    def _register(self, fields, callback):
+        name = f"hook{next(self._names)}"
+        request = dict(fields, op="register", name=name)
+        self._registrations[name] = (request, callback)
+        self._send(request)
+        return name
+
+    def _send(self, message):
+        if self._process is not None:
+            self._process.write((json.dumps(message) + "\n").encode("utf-8"))
+
+    def _on_ready_read(self):
+        self._buffer += bytes(self._process.readAllStandardOutput())
+        *lines, self._buffer = self._buffer.split(b"\n")
+        messages = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                message = json.loads(line)
+            except ValueError:
+                message = None
+            if not isinstance(message, dict):
+                if DEBUG:
+                    DebugLogger.log(f"Skipping malformed hook host line: {line[:200]!r}")
+                continue
+            messages.append(message)
+        timed_out = {message.get("seq") for message in messages if message.get("event") == "timeout"}
+        for message in messages:
+            try:
+                self._dispatch(message, timed_out)
+            except (KeyError, TypeError, ValueError) as e:
+                if DEBUG:
+                    DebugLogger.log(f"Skipping malformed hook host event {message!r}: {e}")
+
+    def _is_late(self, message, timed_out):
+        """Return True if the helper has given up (or is about to) on a replay hotkey."""
+        if message["seq"] in timed_out:
+            return True
+        deadline = message.get("deadline")
+        return deadline is not None and time.monotonic() > deadline - self.LATE_MARGIN_MS / 1000
+
+    def _dispatch(self, message, timed_out=()):
+        event = message.get("event")
+        if event == "hotkey":
+            request, callback = self._registrations.get(message["name"], (None, None))
+            replay = request is not None and request.get("replay")
+            if replay and self._is_late(message, timed_out):
+                # The keystroke went out with the old clipboard; acting on
+                # it now would desynchronize the sequence.
+                self.late_events += 1
+                if DEBUG:
+                    DebugLogger.log(f"Dropping late hotkey {message['name']} (seq {message['seq']})")
+                return
+            try:
+                if callback is not None:
+                    callback()
+            finally:
+                if replay:
+                    self._send({"op": "reply", "seq": message["seq"]})
+        elif event == "mouse":
+            _, callback = self._registrations.get(message["name"], (None, None))
+            if callback is not None:
+                callback(message["pressed"])
+        elif event == "stats":
+            self.latency_stats = message
+            self.stats_changed.emit(message)
+        elif event == "timeout":
+            self.timeouts += 1
+            if DEBUG:
+                DebugLogger.log(f"Hook {message['name']} missed its deadline (seq {message['seq']})")
+        elif event == "error" and DEBUG:
+            DebugLogger.log(f"Hook host error: {message.get('error')}")
+
+    def _on_finished(self, exit_code, exit_status):
+        if self._process is not None:
+            # Parented to this client; would otherwise live as long as it
+            self._process.deleteLater()
+        self._process = None
+        self._buffer = b""
+        if self._stopping:
+            return
+        if DEBUG:
+            DebugLogger.log(f"Hook host exited with code {exit_code}")
+        if self._restarts < self.MAX_RESTARTS:
+            self._restarts += 1
+            self.start()
+
+
+_host = None
+
+
+def start_host(deadline_ms=50):
+    """
+    Move global hooks into a helper process.
+
+    Hooks registered before this call stay in-process.
+
+    Returns:
+        The running :class:`HookHostClient`, or None if the helper could
+        not be started (hooks then stay in-process)
+    """
+    global _host
+    if _host is None:
+        client = HookHostClient(deadline_ms)
+        if client.start():
+            _host = client
+    return _host
+
+
+def stop_host():
+    global _host
+    if _host is not None:
+        _host.stop()
+        _host = None
+
+
+def host():
+    """Return the running :class:`HookHostClient`, or None."""
+    return _host
+
+
+def add_hotkey(hotkey, callback, suppress=False, replay=False):
+    """
+    Register a global hotkey.
+
+    Args:
+        hotkey:   ``keyboard`` hotkey string, e.g. "ctrl+v".
+        callback: Called with no arguments when the hotkey fires.
+        suppress: Keep the keystroke from reaching the focused application.
+        replay:   With *suppress*: send the keystroke on after *callback*
+                  returned (out-of-process: or after the watchdog deadline).
+
+    Returns:
+        Handle for :func:`remove_hook`
+
+    Raises:
+        Whatever the ``keyboard`` library raises when hooks are unavailable
+        (in-process only).
+    """
+    if _host is not None:
+        return _host.add_hotkey(hotkey, callback, suppress, replay)
+
+    import keyboard as kb  # noqa: PLC0415
+    if replay:
+        return kb.add_hotkey(hotkey, replaying(hotkey, callback), suppress=suppress)
+    return kb.add_hotkey(hotkey, callback, suppress=suppress)
+
+
+def replaying(hotkey, callback):
+    """
+    Return an in-process hook handler that calls *callback* and then
+    sends *hotkey* on through the current keystroke backend.
+    """
+    def _handler():
+        try:
+            callback()
+        finally:
+            paste_backends.keystrokes().send(hotkey)
+    return _handler
+
+
+def add_mouse_button(button, callback):
+    """
+    Watch a mouse button globally.
+
+    Args:
+        button:   pynput button name ("left", "middle", "right", …).
+        callback: Called with True on press and False on release.
+
+    Returns:
+        Handle for :func:`remove_hook`
+    """
+    if _host is not None:
+        return _host.add_mouse_button(button, callback)
+
+    from pynput import mouse  # noqa: PLC0415
+    watched = getattr(mouse.Button, button)
+
+    def _on_click(x, y, pressed_button, pressed):
+        if pressed_button == watched:
+            callback(pressed)
+
+    listener = mouse.Listener(on_click=_on_click)
+    listener.daemon = True
+    listener.start()
+    return listener
+
+
+def remove_hook(handle):
+    """Remove a hook returned by :func:`add_hotkey` or :func:`add_mouse_button`."""
+    if _host is not None and _host.owns(handle):
+        _host.remove(handle)
+    elif hasattr(handle, "stop"):
+        handle.stop()
+    else:
+        import keyboard as kb  # noqa: PLC0415
+        kb.remove_hotkey(handle)
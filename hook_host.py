@@ -0,0 +1,277 @@
+"""
+Out-of-process host for PasteWheel's global input hooks.
+
+Global keyboard hooks installed in the GUI process share its GIL and its
+main thread: a long re-render, a config write or a spell-check pass stalls
+every suppressed Ctrl+V on the whole system.  This helper owns the hooks
+instead and talks to the GUI over its stdin/stdout pipe, one JSON object per
+line.  It imports only the standard library and the hook libraries.
+
+GUI → host::
+
+    {"op": "register", "name": "h1", "hotkey": "ctrl+v", "suppress": true, "replay": true}
+    {"op": "register", "name": "h2", "mouse": "middle"}
+    {"op": "unregister", "name": "h1"}
+    {"op": "reply", "seq": 17}
+    {"op": "stats"}
+
+Host → GUI::
+
+    {"event": "ready"}
+    {"event": "hotkey", "name": "h1", "seq": 17, "deadline": 81234.567}
+    {"event": "mouse", "name": "h2", "pressed": true}
+    {"event": "timeout", "name": "h1", "seq": 17}
+    {"event": "stats", "hooks": {"h1": {"hotkey": ..., "buckets": {...}, ...}}}
+
+A *replay* hotkey is suppressed, reported to the GUI and, once the GUI
+answers with ``reply``, sent on to the focused application (the sequential
+paste writes the clipboard before answering).  A watchdog bounds the wait:
+if no reply arrives within the deadline, the keystroke is released anyway,
+so a stalled GUI degrades to an ordinary paste instead of a stuck key.
+Replay hotkey events carry that deadline on the system-wide
+``time.monotonic()`` clock; the GUI skips events it reads too late (their
+keystroke already went out with the old clipboard), and a reply whose seq
+is no longer awaited is ignored.
+
+Malformed request lines are answered with an "error" event and skipped.
+
+The host exits, removing its hooks, when the GUI closes the pipe.
+
+Usage::
+
+    python hook_host.py [--deadline-ms MS] [--stats-interval S]
+"""
+import argparse
+import json
+import sys
+import threading
+import time
+
+# Upper bounds (ms) of the latency histogram buckets; slower answers are
+# counted in "inf"
+BUCKETS_MS = (0.25, 0.5, 1, 2, 4, 8, 16, 32, 64, 128)
+
+
+class LatencyHistogram:
+    """
+    Counts of hook-to-reply latencies in logarithmic buckets.
+    """
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.timeouts = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, latency_ms):
+        index = 0
+        while index < len(BUCKETS_MS) and latency_ms > BUCKETS_MS[index]:
+            index += 1
+        self.counts[index] += 1
+        self.total_ms += latency_ms
+        self.max_ms = max(self.max_ms, latency_ms)
+
+    def to_dict(self):
+        answered = sum(self.counts)
+        buckets = {f"<={bound}": count for bound, count in zip(BUCKETS_MS, self.counts)}
+        buckets["inf"] = self.counts[-1]
+        return {
+            "buckets": buckets,
+            "answered": answered,
+            "timeouts": self.timeouts,
+            "mean_ms": self.total_ms / answered if answered else None,
+            "max_ms": self.max_ms,
+        }
+
+
+class HookHost:
+    """
+    Installs hooks on request and relays them over the pipe.
+
+    Args:
+        deadline_ms:    How long a replay hotkey waits for the GUI's reply.
+        stats_interval: Seconds between unsolicited "stats" events (only sent
+                        when something changed); 0 disables them.
+        output:         Text stream events are written to.
+    """
+
+    def __init__(self, deadline_ms=50, stats_interval=5.0, output=None):
+        self.deadline = deadline_ms / 1000
+        self.stats_interval = stats_interval
+        self.output = output or sys.stdout
+        self._output_lock = threading.Lock()
+        self._hooks = {}        # name → (description, handle, remove callable)
+        self._histograms = {}   # name → LatencyHistogram
+        self._seq = 0
+        self._waiting_seq = None
+        self._reply = threading.Event()
+        self._stats_dirty = False
+        self._closed = threading.Event()
+
+    # ------------------------------------------------------------------
+    # Pipe
+    # ------------------------------------------------------------------
+
+    def send(self, message):
+        line = json.dumps(message) + "\n"
+        with self._output_lock:
+            try:
+                self.output.write(line)
+                self.output.flush()
+            except (OSError, ValueError):
+                # GUI gone; run() notices the closed pipe
+                pass
+
+    def run(self, stream=None):
+        """Serve requests from *stream* (stdin) until it is closed."""
+        stream = stream or sys.stdin
+        if self.stats_interval:
+            threading.Thread(target=self._stats_loop, daemon=True).start()
+        self.send({"event": "ready"})
+        try:
+            for line in stream:
+                if line.strip():
+                    self.handle(line)
+        finally:
+            self._closed.set()
+            self.unregister_all()
+
+    def handle(self, line):
+        """Apply one request line from the GUI."""
+        try:
+            request = json.loads(line)
+            op = request["op"]
+            if op == "reply":
+                # Replies that arrive after the watchdog fired are stale
+                waiting = self._waiting_seq
+                if waiting is not None and request["seq"] == waiting:
+                    self._reply.set()
+            elif op == "register":
+                self.register(request)
+            elif op == "unregister":
+                self.unregister(request["name"])
+            elif op == "stats":
+                self.send(self.stats())
+            else:
+                raise ValueError(f"Unknown op: {op!r}")
+        except (ValueError, KeyError, TypeError) as e:
+            # Malformed line (bad JSON, not an object, missing field)
+            self.send({"event": "error", "error": f"{type(e).__name__}: {e}"})
+
+    # ------------------------------------------------------------------
+    # Hooks
+    # ------------------------------------------------------------------
+
+    def register(self, request):
+        """
+        Install the hook described by a "register" request.
+
+        Raises:
+            ValueError: If the request names neither a hotkey nor a mouse button.
+        """
+        name = request["name"]
+        self.unregister(name)
+        if "hotkey" in request:
+            import keyboard as kb  # noqa: PLC0415
+            hotkey = request["hotkey"]
+            replay = bool(request.get("replay"))
+            handle = kb.add_hotkey(
+                hotkey, self._on_hotkey, args=(name, hotkey, replay),
+                suppress=bool(request.get("suppress")),
+            )
+            self._hooks[name] = (hotkey, handle, kb.remove_hotkey)
+        elif "mouse" in request:
+            from pynput import mouse  # noqa: PLC0415
+            button = getattr(mouse.Button, request["mouse"])
+
+            def _on_click(x, y, pressed_button, pressed):
+                if pressed_button == button:
+                    self.send({"event": "mouse", "name": name, "pressed": pressed})
+
+            listener = mouse.Listener(on_click=_on_click)
+            listener.daemon = True
+            listener.start()
+            self._hooks[name] = (f"mouse:{request['mouse']}", listener, lambda h: h.stop())
+        else:
+            raise ValueError("register needs 'hotkey' or 'mouse'")
+
+    def unregister(self, name):
+        entry = self._hooks.pop(name, None)
+        if entry is not None:
+            _, handle, remove = entry
+            try:
+                remove(handle)
+            except Exception:
+                pass
+
+    def unregister_all(self):
+        for name in list(self._hooks):
+            self.unregister(name)
+
+    def _on_hotkey(self, name, hotkey, replay):
+        """Runs on the keyboard library's hook thread."""
+        self._seq += 1
+        seq = self._seq
+        if not replay:
+            self.send({"event": "hotkey", "name": name, "seq": seq})
+            return
+
+        self._waiting_seq = seq
+        self._reply.clear()
+        start = time.perf_counter()
+        self.send({"event": "hotkey", "name": name, "seq": seq, "deadline": time.monotonic() + self.deadline})
+        answered = self._reply.wait(self.deadline)
+        self._waiting_seq = None
+
+        histogram = self._histograms.setdefault(name, LatencyHistogram())
+        if answered:
+            histogram.add((time.perf_counter() - start) * 1000)
+        else:
+            # Watchdog: release the keystroke without the GUI
+            histogram.timeouts += 1
+            self.send({"event": "timeout", "name": name, "seq": seq})
+        self._stats_dirty = True
+
+        import keyboard as kb  # noqa: PLC0415
+        kb.press_and_release(hotkey)
+
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+
+    def stats(self):
+        """Return the "stats" event with every hook's latency histogram."""
+        hooks = {}
+        for name, histogram in list(self._histograms.items()):
+            entry = histogram.to_dict()
+            if name in self._hooks:
+                entry["hotkey"] = self._hooks[name][0]
+            hooks[name] = entry
+        self._stats_dirty = False
+        return {"event": "stats", "deadline_ms": self.deadline * 1000, "hooks": hooks}
+
+    def _stats_loop(self):
+        while not self._closed.wait(self.stats_interval):
+            if self._stats_dirty:
+                self.send(self.stats())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PasteWheel global input hook host")
+    parser.add_argument("--deadline-ms", type=float, default=50,
+                        help="how long a replayed hotkey waits for the GUI")
+    parser.add_argument("--stats-interval", type=float, default=5.0,
+                        help="seconds between latency histogram updates (0 = on request only)")
+    args = parser.parse_args(argv)
+    host = HookHost(args.deadline_ms, args.stats_interval)
+    try:
+        import keyboard  # noqa: F401, PLC0415
+    except Exception as e:
+        host.send({"event": "error", "error": f"keyboard hooks unavailable: {e}"})
+        return 1
+    host.run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,92 @@
+import argparse
 import sys
-from PyQt5.QtWidgets import QApplication
-from radial_interface.radial_interface import RadialInterface
+from single_instance import NO_REPLY, SingleInstanceServer, instance_running, send_command
+
+COMMANDS = ("show", "settings", "reload")
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="PasteWheel radial clipboard menu")
+    parser.add_argument(
+        "command", nargs="?", choices=COMMANDS, default="show",
+        help="what to do; forwarded to the running instance if there is one (default: show)",
+    )
+    parser.add_argument(
+        "--daemon", action="store_true",
+        help="stay resident and show the wheel at the cursor on the configured trigger "
+             "(ALT+` in keyboard mode, middle button in mouse mode)",
+    )
+    return parser.parse_known_args(argv[1:])[0]
+
+
+def register_commands(server, radial_interface, daemon_mode):
+    """Handle commands forwarded by later launches."""
+    from PyQt5.QtGui import QCursor  # noqa: PLC0415
+    from pastewheel_config import PasteWheelConfig  # noqa: PLC0415
+
+    def show_wheel(request):
+        if daemon_mode:
+            radial_interface.popup_at(QCursor.pos())
+        else:
+            radial_interface.show()
+            radial_interface.raise_()
+            radial_interface.activateWindow()
+
+    def open_settings(request):
+        radial_interface.on_settings_btn_clicked()
+
+    def reload_config(request):
+        PasteWheelConfig.shared().reload()
+
+    server.register("show", show_wheel)
+    server.register("settings", open_settings)
+    server.register("reload", reload_config)
 
 
 if __name__ == '__main__':
+    args = parse_args(sys.argv)
+
+    # A running instance takes the command; exit before importing the UI.
+    reply = send_command(args.command)
+    if reply == NO_REPLY:
+        print("PasteWheel is running but not responding", file=sys.stderr)
+        sys.exit(1)
+    if reply is not None:
+        sys.exit(0)
+
+    from PyQt5.QtWidgets import QApplication
+    from radial_interface.radial_interface import RadialInterface
+    from pastewheel_cli import register_cli_commands
+
     app = QApplication(sys.argv)
-    radial_interface = RadialInterface(width=400, height=400)
-    radial_interface.show()
+    # Take the socket before building anything; commands that arrive
+    # meanwhile wait for the event loop, which starts after registration.
+    server = SingleInstanceServer()
+    if not server.listen() and instance_running():
+        # Lost the race against another launch: hand it the command instead
+        reply = send_command(args.command)
+        sys.exit(0 if reply not in (None, NO_REPLY) else 1)
+
+    # Global hooks run in a helper process so a busy GUI cannot stall
+    # system-wide input; they stay in-process if it cannot be started.
+    import global_hooks
+    global_hooks.start_host()
+    app.aboutToQuit.connect(global_hooks.stop_host)
+    radial_interface = RadialInterface(width=400, height=400, overlay=args.daemon)
+    register_commands(server, radial_interface, args.daemon)
+    register_cli_commands(server, radial_interface)
+
+    if args.daemon:
+        from activation_daemon import ActivationDaemon
+
+        # The wheel is built once and stays hidden between activations.
+        app.setQuitOnLastWindowClosed(False)
+        daemon = ActivationDaemon(radial_interface)
+        daemon.start()
+        if args.command == "settings":
+            radial_interface.on_settings_btn_clicked()
+    elif args.command == "settings":
+        radial_interface.on_settings_btn_clicked()
+    else:
+        radial_interface.show()
     sys.exit(app.exec_())
@@ -0,0 +1,241 @@
+"""
+Pluggable clipboard and keystroke backends for the paste path.
+
+Every clipboard write made by a paste (a button click, or a step of a
+sequential paste) goes through the current :class:`ClipboardBackend`, and
+every synthesized keystroke (the replayed Ctrl+V) through the current
+:class:`KeystrokeBackend`:
+
+* :class:`QtClipboardBackend`        — ``QApplication.clipboard()`` (default);
+  GUI thread only, other threads go through
+  :class:`~radial_interface.clipboard_bridge.ClipboardBridge`.
+* :class:`PyperclipClipboardBackend` — ``pyperclip`` (any thread).
+* :class:`X11ClipboardBackend`       — owns the X11 CLIPBOARD selection from
+  a persistent python-xlib connection (any thread).
+* :class:`KeyboardKeystrokeBackend`  — ``keyboard.press_and_release`` (default).
+* :class:`InMemoryClipboardBackend` / :class:`InMemoryKeystrokeBackend` —
+  record what was written or sent, with ``time.perf_counter()`` timestamps,
+  so the paste path can be measured headlessly
+  (``QT_QPA_PLATFORM=offscreen``).
+
+Select backends with :func:`set_clipboard_backend` and
+:func:`set_keystroke_backend`.
+"""
+import threading
+import time
+
+
+class ClipboardBackend:
+    """Writes text to the system clipboard."""
+
+    # Whether set_text() may be called from any thread
+    thread_safe = False
+
+    def set_text(self, text):
+        raise NotImplementedError
+
+    def text(self):
+        """Return the clipboard text, or None if unknown."""
+        raise NotImplementedError
+
+
+class KeystrokeBackend:
+    """Synthesizes keystrokes in the focused application."""
+
+    def send(self, hotkey):
+        """Press and release *hotkey* (``keyboard`` syntax, e.g. "ctrl+v")."""
+        raise NotImplementedError
+
+
+# ----------------------------------------------------------------------
+# Clipboard backends
+# ----------------------------------------------------------------------
+
+class QtClipboardBackend(ClipboardBackend):
+    """``QApplication.clipboard()``; call from the GUI thread."""
+
+    def set_text(self, text):
+        from PyQt5.QtWidgets import QApplication  # noqa: PLC0415
+        QApplication.clipboard().setText(text)
+
+    def text(self):
+        from PyQt5.QtWidgets import QApplication  # noqa: PLC0415
+        return QApplication.clipboard().text()
+
+
+class PyperclipClipboardBackend(ClipboardBackend):
+    """``pyperclip``; spawns xclip/xsel per call on Linux."""
+
+    thread_safe = True
+
+    def set_text(self, text):
+        import pyperclip  # noqa: PLC0415
+        pyperclip.copy(text)
+
+    def text(self):
+        import pyperclip  # noqa: PLC0415
+        return pyperclip.paste()
+
+
+class X11ClipboardBackend(ClipboardBackend):
+    """
+    Owns the X11 CLIPBOARD selection and serves it to other clients.
+
+    One X connection and an unmapped window are created up front; a
+    writer only stores the bytes and claims ownership, and a daemon thread
+    answers SelectionRequest events, so no process is started per write.
+
+    Requires python-xlib.
+
+    Args:
+        display_name: X display (defaults to $DISPLAY).
+
+    Raises:
+        ImportError: If python-xlib is not installed.
+    """
+
+    thread_safe = True
+
+    def __init__(self, display_name=None):
+        import Xlib.threaded  # noqa: F401, PLC0415 - makes the connection thread-safe
+        from Xlib import X, Xatom, display  # noqa: PLC0415
+
+        self._X = X
+        self._display = display.Display(display_name)
+        self._window = self._display.screen().root.create_window(0, 0, 1, 1, 0, X.CopyFromParent)
+        self._clipboard = self._display.intern_atom("CLIPBOARD")
+        self._targets = self._display.intern_atom("TARGETS")
+        self._utf8 = self._display.intern_atom("UTF8_STRING")
+        self._string = Xatom.STRING
+        self._atom = Xatom.ATOM
+        self._data = None
+        self._lock = threading.Lock()
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def set_text(self, text):
+        with self._lock:
+            self._data = text.encode("utf-8")
+        self._window.set_selection_owner(self._clipboard, self._X.CurrentTime)
+        self._display.flush()
+
+    def text(self):
+        with self._lock:
+            return None if self._data is None else self._data.decode("utf-8")
+
+    def _serve(self):
+        X = self._X
+        while True:
+            event = self._display.next_event()
+            if event.type == X.SelectionClear:
+                with self._lock:
+                    self._data = None
+            elif event.type == X.SelectionRequest:
+                self._answer(event)
+
+    def _answer(self, request):
+        from Xlib.protocol import event as xevent  # noqa: PLC0415
+
+        with self._lock:
+            data = self._data
+        prop = request.property or request.target
+        if data is None:
+            prop = 0
+        elif request.target == self._targets:
+            request.requestor.change_property(
+                prop, self._atom, 32, [self._targets, self._utf8, self._string]
+            )
+        elif request.target in (self._utf8, self._string):
+            request.requestor.change_property(prop, request.target, 8, data)
+        else:
+            prop = 0
+        notify = xevent.SelectionNotify(
+            time=request.time, requestor=request.requestor, selection=request.selection,
+            target=request.target, property=prop,
+        )
+        request.requestor.send_event(notify)
+        self._display.flush()
+
+
+class InMemoryClipboardBackend(ClipboardBackend):
+    """
+    Keeps the clipboard in memory and records every write.
+
+    Attributes:
+        writes: List of ``(perf_counter(), text)`` tuples.
+    """
+
+    thread_safe = True
+
+    def __init__(self):
+        self.writes = []
+        self._text = None
+
+    def set_text(self, text):
+        self._text = text
+        self.writes.append((time.perf_counter(), text))
+
+    def text(self):
+        return self._text
+
+
+# ----------------------------------------------------------------------
+# Keystroke backends
+# ----------------------------------------------------------------------
+
+class KeyboardKeystrokeBackend(KeystrokeBackend):
+    """The ``keyboard`` library."""
+
+    def send(self, hotkey):
+        import keyboard as kb  # noqa: PLC0415
+        kb.press_and_release(hotkey)
+
+
+class InMemoryKeystrokeBackend(KeystrokeBackend):
+    """
+    Records keystrokes instead of sending them.
+
+    Attributes:
+        sent: List of ``(perf_counter(), hotkey)`` tuples.
+    """
+
+    def __init__(self):
+        self.sent = []
+
+    def send(self, hotkey):
+        self.sent.append((time.perf_counter(), hotkey))
+
+
+# ----------------------------------------------------------------------
+# Current backends
+# ----------------------------------------------------------------------
+
+_clipboard = None
+_keystrokes = None
+
+
+def clipboard():
+    """Return the current clipboard backend (Qt unless set otherwise)."""
+    global _clipboard
+    if _clipboard is None:
+        _clipboard = QtClipboardBackend()
+    return _clipboard
+
+
+def keystrokes():
+    """Return the current keystroke backend (``keyboard`` unless set otherwise)."""
+    global _keystrokes
+    if _keystrokes is None:
+        _keystrokes = KeyboardKeystrokeBackend()
+    return _keystrokes
+
+
+def set_clipboard_backend(backend):
+    """Use *backend* for clipboard writes (None restores the default)."""
+    global _clipboard
+    _clipboard = backend
+
+
+def set_keystroke_backend(backend):
+    """Use *backend* for synthesized keystrokes (None restores the default)."""
+    global _keystrokes
+    _keystrokes = backend
@@ -0,0 +1,256 @@
+"""
+Command-line control of a running PasteWheel instance.
+
+Commands are sent to the resident process over its local socket (see
+:mod:`single_instance`), which answers from its in-memory configuration and
+writes the clipboard itself, exactly as a click on the wheel would::
+
+    python pastewheel_cli.py paste clip_l2_s3
+    python pastewheel_cli.py list --layer 2
+    python pastewheel_cli.py set-payload clip_l2_s3 -       # payload from stdin
+    python pastewheel_cli.py set-payload clip_l2_s3 "step 1" "step 2" "step 3" --mode stop
+    python pastewheel_cli.py reload
+    python pastewheel_cli.py batch commands.txt             # or - for stdin
+
+A batch file holds one command per line, either in the same syntax as the
+command line (``paste clip_l2_s3``) or as a JSON request object.  All of
+its requests are written on one connection before the replies are read.
+
+Exit status: 0 on success, 1 if any command failed, 2 if no PasteWheel
+instance is running.
+"""
+import argparse
+import json
+import shlex
+import sys
+from single_instance import InstanceClient
+
+# ----------------------------------------------------------------------
+# Server side: handlers registered by the running instance
+# ----------------------------------------------------------------------
+
+def register_cli_commands(server, radial_interface):
+    """
+    Register the "paste", "list", "set-payload", "hook-stats" and
+    "glyph-stats" commands on *server*.
+
+    Args:
+        server:           :class:`single_instance.SingleInstanceServer`.
+        radial_interface: The instance's :class:`RadialInterface`.
+    """
+    from pastewheel_config import PasteWheelConfig  # noqa: PLC0415
+    from radial_interface.paste_controller import PasteController, SEQUENCE_MODES  # noqa: PLC0415
+
+    def clip_button(button_id):
+        button = PasteWheelConfig.shared().get_button(button_id)
+        if button is None:
+            raise KeyError(f"Unknown button: {button_id}")
+        if button.get("button_type", "clip") != "clip":
+            raise ValueError(f"Button {button_id} is not a clipboard button")
+        return button
+
+    def paste(request):
+        button_id = request["id"]
+        clip_button(button_id)
+        widget = radial_interface.button_widget_map.get(button_id)
+        if widget is not None:
+            # The same path as clicking the button
+            widget._write_to_clipboard()
+        else:
+            # Not materialized (collapsed branch or painter render mode)
+            button = PasteWheelConfig.shared().get_button(button_id)
+            PasteController.paste(
+                button_id, PasteWheelConfig.shared().get_button_clipboard(button_id),
+                mode=button.get("sequence_mode"),
+            )
+        position = PasteController.position()
+        return {"sequence": None if position is None else {"index": position[1], "count": position[2]}}
+
+    def list_buttons(request):
+        config = PasteWheelConfig.shared()
+        layer = request.get("layer")
+        parent_id = request.get("parent_id")
+        if parent_id is not None:
+            buttons = config.get_child_buttons_by_parent(parent_id)
+        elif layer is not None:
+            buttons = config.get_buttons_by_layer(int(layer)) or []
+        else:
+            buttons = [b for n in (1, 2, 3) for b in config.get_buttons_by_layer(n) or []]
+        if layer is not None:
+            buttons = [b for b in buttons if b.get("layer") == int(layer)]
+        return {"buttons": [
+            {
+                "id": b.get("id"),
+                "layer": b.get("layer"),
+                "label": b.get("label", ""),
+                "button_type": b.get("button_type", "clip"),
+                "parent_id": b.get("parent_id"),
+            }
+            for b in buttons
+        ]}
+
+    def set_payload(request):
+        button_id = request["id"]
+        clipboard = request["clipboard"]
+        if not isinstance(clipboard, list) or not all(isinstance(s, str) for s in clipboard):
+            raise ValueError("clipboard must be a list of strings")
+        mode = request.get("mode")
+        if mode is not None and mode not in SEQUENCE_MODES:
+            raise ValueError(f"Sequence mode must be one of {SEQUENCE_MODES}")
+        button = dict(clip_button(button_id))
+        button["clipboard"] = clipboard
+        if mode is not None:
+            button["sequence_mode"] = mode
+        # The same path as saving from the button settings window
+        PasteWheelConfig.shared().add_button(button)
+
+    def hook_stats(request):
+        import global_hooks  # noqa: PLC0415
+        client = global_hooks.host()
+        if client is None:
+            raise ValueError("Global hooks run in-process; no hook host statistics")
+        stats = client.fetch_stats()
+        return {
+            # Without an answer, the last snapshot received is sent as stale
+            "stats": stats if stats is not None else client.latency_stats,
+            "stale": stats is None,
+            "watchdog_timeouts": client.timeouts, "late_events": client.late_events,
+        }
+
+    def glyph_stats(request):
+        from radial_interface.glyph_atlas import GlyphAtlas  # noqa: PLC0415
+        return {"stats": GlyphAtlas.shared().stats()}
+
+    server.register("paste", paste)
+    server.register("list", list_buttons)
+    server.register("set-payload", set_payload)
+    server.register("hook-stats", hook_stats)
+    server.register("glyph-stats", glyph_stats)
+
+
+# ----------------------------------------------------------------------
+# Client side
+# ----------------------------------------------------------------------
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="pastewheel", description="Control a running PasteWheel instance."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    paste = commands.add_parser("paste", help="write a clipboard button's payload to the clipboard")
+    paste.add_argument("id", help="button id")
+
+    list_ = commands.add_parser("list", help="list buttons")
+    list_.add_argument("--layer", type=int, choices=(1, 2, 3), help="only buttons on this layer")
+    list_.add_argument("--parent", dest="parent_id", help="only children of this expand button")
+    list_.add_argument("--json", action="store_true", help="print JSON instead of a table")
+
+    set_payload = commands.add_parser("set-payload", help="replace a clipboard button's payload")
+    set_payload.add_argument("id", help="button id")
+    set_payload.add_argument(
+        "strings", nargs="+",
+        help="payload strings, pasted in order when there are several; - reads one from stdin",
+    )
+    set_payload.add_argument(
+        "--mode", choices=("cycle", "stop", "pingpong"),
+        help="order of a multi-string sequence (default: keep the button's mode)",
+    )
+
+    commands.add_parser("reload", help="re-read the configuration file")
+    commands.add_parser(
+        "hook-stats", help="print the hook host's latency histograms (JSON)"
+    )
+    commands.add_parser(
+        "glyph-stats", help="print the label pixmap cache's hit rate and memory (JSON)"
+    )
+    commands.add_parser("show", help="show the wheel")
+    commands.add_parser("settings", help="open the settings window")
+
+    batch = commands.add_parser("batch", help="run one command per line over a single connection")
+    batch.add_argument("file", help="command file, or - for stdin")
+    return parser
+
+
+def to_request(args, stdin=None):
+    """Convert parsed arguments to a protocol request dict."""
+    request = {"command": args.command}
+    if args.command == "paste":
+        request["id"] = args.id
+    elif args.command == "list":
+        if args.layer is not None:
+            request["layer"] = args.layer
+        if args.parent_id is not None:
+            request["parent_id"] = args.parent_id
+    elif args.command == "set-payload":
+        stdin = stdin or sys.stdin
+        request["id"] = args.id
+        request["clipboard"] = [stdin.read() if s == "-" else s for s in args.strings]
+        if args.mode is not None:
+            request["mode"] = args.mode
+    return request
+
+
+def parse_batch_line(parser, line):
+    """Turn one batch line into a request dict, or None for blank/comment lines."""
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    if line.startswith("{"):
+        return json.loads(line)
+    return to_request(parser.parse_args(shlex.split(line)))
+
+
+def print_reply(request, reply, as_json=False):
+    """Print one reply; return True if it reports success."""
+    if not reply.get("ok"):
+        print(f"{request.get('command')}: {reply.get('error', 'failed')}", file=sys.stderr)
+        return False
+    if as_json:
+        print(json.dumps(reply, ensure_ascii=False))
+    elif "buttons" in reply:
+        for button in reply["buttons"]:
+            print(
+                f"{button['id']}\t{button['layer']}\t{button['button_type']}\t"
+                f"{button.get('parent_id') or '-'}\t{button['label']}"
+            )
+    return True
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "batch":
+        stream = sys.stdin if args.file == "-" else open(args.file, encoding="utf-8")
+        with stream:
+            try:
+                requests = [r for r in (parse_batch_line(parser, line) for line in stream) if r is not None]
+            except (ValueError, SystemExit) as e:
+                # argparse exits on a bad command line after printing its usage
+                print(f"Invalid batch line: {e}", file=sys.stderr)
+                return 1
+    else:
+        requests = [to_request(args)]
+
+    client = InstanceClient()
+    if not client.connect():
+        print("PasteWheel is not running", file=sys.stderr)
+        return 2
+    try:
+        replies = client.request_many(requests)
+    except IOError as e:
+        print(str(e), file=sys.stderr)
+        return 1
+    finally:
+        client.close()
+
+    as_json = args.command in ("batch", "hook-stats", "glyph-stats") or getattr(args, "json", False)
+    ok = True
+    for request, reply in zip(requests, replies):
+        ok = print_reply(request, reply, as_json) and ok
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,17 @@
 import json
 import os
+import time
+from contextlib import contextmanager
 from debug_logger import DebugLogger
+from button_store import ButtonStore
+from blob_store import BlobStore, referenced_blobs
+from config_events import (
+    ConfigEvent, ConfigEventDispatcher, BUTTON_ADDED, BUTTON_UPDATED, BUTTON_REMOVED,
+    THEME_CHANGED, INPUT_MODE_CHANGED, CONFIG_RELOADED,
+)
+from config_persistence import ConfigPersister
+from config_storage import STORAGE_MODES, create_backend
+from emoji_catalog_file import MappedEmojiCatalog
 
 # Set to True to enable debug logging to debug.txt
 DEBUG = False
@@ -10,33 +21,237 @@ class PasteWheelConfig:
     """Configuration manager for PasteWheel application."""
 
     CONFIG_FILE = "pastewheel_config.json"
+    SQLITE_FILE = "pastewheel_config.sqlite3"
+    # Large clipboard payloads live here, next to the configuration file
+    # (see blob_store).
+    BLOB_DIR = "pastewheel_blobs"
     EMOJI_DATA_FILE = "radial_interface_button_settings/emoji_symbol_picker/emoji_data.json"
+    # Full catalog written by build_emoji_catalog.py; memory-mapped and
+    # preferred over EMOJI_DATA_FILE when present (see emoji_catalog_file)
+    EMOJI_CATALOG_FILE = "radial_interface_button_settings/emoji_symbol_picker/emoji_catalog.bin"
     EMOJI_CACHE = None  # Class-level cache for emoji data
 
+    # Process-wide instance returned by shared()
+    _shared_instance = None
+
+    # Number of times any instance has parsed CONFIG_FILE from disk.
+    # Tests can assert on this to verify hot paths do not re-read the file.
+    disk_reads = 0
+
+    # Minimum number of seconds between two stat() calls made by
+    # reload_if_changed(), so tight UI loops never touch the filesystem.
+    STAT_CHECK_INTERVAL = 0.5
+
+    # Storage backend used by instances created without an explicit one:
+    # "json" (CONFIG_FILE) or "sqlite" (SQLITE_FILE).  See config_storage.
+    STORAGE_BACKEND = "json"
+
+    # Default JSON storage mode: "snapshot" rewrites the whole file,
+    # "journal" appends per-button change records (see config_journal).
+    # A "storage_mode" key in the file overrides this.
+    STORAGE_MODE = "snapshot"
+
+    # Maximum number of buttons on Layer 1, and per parent expand button on
+    # Layers 2 and 3 (8 + 8×16 + 128×24 buttons in total).
+    LAYER_MAX_BUTTONS = {1: 8, 2: 16, 3: 24}
+
     DEFAULT_CONFIG = {
         "theme": "light",
         "buttons": [],
         "input_mode": "keyboard"
     }
     
-    def __init__(self):
-        """Initialize PasteWheelConfig and load existing configuration."""
-        self.config = self.read()
+    def __init__(self, backend=None, blobs=None):
+        """
+        Initialize PasteWheelConfig and load existing configuration.
+
+        Args:
+            backend: Optional :class:`~config_storage.StorageBackend`.  Defaults
+                     to the backend named by STORAGE_BACKEND.
+            blobs:   Optional :class:`~blob_store.BlobStore` for large
+                     clipboard payloads.  Defaults to BLOB_DIR next to the
+                     backend's file.
+        """
+        if backend is None:
+            path = self.SQLITE_FILE if self.STORAGE_BACKEND == "sqlite" else self.CONFIG_FILE
+            backend = create_backend(self.STORAGE_BACKEND, path, mode=self.STORAGE_MODE)
+        if blobs is None:
+            blobs = BlobStore(os.path.join(os.path.dirname(os.path.abspath(backend.path)), self.BLOB_DIR))
+        self.backend = backend
+        self.blobs = blobs
+        self.store = ButtonStore()
+        self._file_signature = None
+        self._last_stat_check = 0.0
+        self._transaction_depth = 0
+        self._transaction_records = []
+        self._transaction_touched = set()
+        self.events = ConfigEventDispatcher()
+        self.persister = ConfigPersister(
+            self.backend, self.to_dict,
+            on_written=self._on_file_written, prepare=self.blobs.write_pending,
+        )
+        if self._set_config(self.read()):
+            self._commit(None)
+
+    @classmethod
+    def shared(cls):
+        """
+        Return the process-wide PasteWheelConfig instance.
+
+        The instance is created on first use.  Later calls only re-read
+        CONFIG_FILE when its mtime, size or inode changed since the last read
+        or write (see :meth:`reload_if_changed`), so handlers can call this
+        freely on hot paths instead of constructing a new PasteWheelConfig.
+
+        Returns:
+            The shared PasteWheelConfig instance
+        """
+        if cls._shared_instance is None:
+            cls._shared_instance = cls()
+        else:
+            cls._shared_instance.reload_if_changed()
+        return cls._shared_instance
+
+    @classmethod
+    def reset_shared(cls):
+        """Drop the process-wide instance so the next shared() call re-reads the file."""
+        cls._shared_instance = None
+
+    def _stat_signature(self):
+        """
+        Return the backend's change signature (file mtime/size/inode), or
+        None if nothing is stored yet.
+        """
+        return self.backend.signature()
+
+    def reload_if_changed(self, force_check=False):
+        """
+        Re-read the stored configuration if it was changed by someone else.
+
+        The file is only stat()ed once every STAT_CHECK_INTERVAL seconds
+        unless *force_check* is True, and only parsed when its signature
+        differs from the one recorded at the last read or write.
+
+        Args:
+            force_check: Skip the STAT_CHECK_INTERVAL throttle.
+
+        Returns:
+            True if the configuration was reloaded, False otherwise
+        """
+        now = time.monotonic()
+        if not force_check and now - self._last_stat_check < self.STAT_CHECK_INTERVAL:
+            return False
+        self._last_stat_check = now
+
+        # While our own changes are pending the file is expected to differ;
+        # reloading now would discard them.
+        if self.persister.is_busy():
+            return False
+        if self._stat_signature() == self._file_signature:
+            return False
+        self.reload()
+        return True
+
+    def reload(self):
+        """Unconditionally re-read CONFIG_FILE into this instance."""
+        if self._set_config(self.read()):
+            self._commit(None)
+        self.events.emit(ConfigEvent(CONFIG_RELOADED))
+
+    def subscribe(self, callback):
+        """
+        Subscribe to configuration change events.
+
+        *callback* is called with a list of :class:`~config_events.ConfigEvent`
+        describing one coalesced burst of changes (see :mod:`config_events`).
+        Bound methods are held weakly.
+
+        Args:
+            callback: Callable taking the list of events
+        """
+        self.events.subscribe(callback)
+
+    def unsubscribe(self, callback):
+        """
+        Remove a callback registered with :meth:`subscribe`.
+
+        Returns:
+            True if it was subscribed, False otherwise
+        """
+        return self.events.unsubscribe(callback)
+
+    def _set_config(self, config):
+        """
+        Adopt *config* as the current configuration.
+
+        The ``buttons`` list is moved into :attr:`store` (an indexed
+        :class:`ButtonStore`); ``self.config`` keeps every other key.  Use
+        :meth:`to_dict` to get the full serialisable configuration back.
+
+        Large clipboard payloads still inlined in *config* are moved into
+        :attr:`blobs`.
+
+        Returns:
+            True if payloads were moved and the configuration should be
+            written back
+        """
+        config = dict(config)
+        # Remember where "buttons" sat so to_dict() keeps the file's key order.
+        keys = list(config)
+        self._buttons_position = keys.index("buttons") if "buttons" in keys else len(keys)
+        buttons = config.pop("buttons", None) or []
+        externalized = [self._externalize_payload(button) for button in buttons]
+        migrated = any(new is not old for new, old in zip(externalized, buttons))
+        self.store.reset(externalized)
+        self.config = config
+
+        mode = config.get("storage_mode", self.STORAGE_MODE)
+        self.backend.set_mode(mode if mode in STORAGE_MODES else "snapshot")
+        return migrated
+
+    def _externalize_payload(self, button):
+        """
+        Return *button* with large clipboard strings replaced by blob
+        references (a copy if anything changed, otherwise *button* itself).
+        """
+        clipboard = button.get("clipboard")
+        if not isinstance(clipboard, list):
+            return button
+        externalized = self.blobs.externalize(clipboard)
+        if externalized is clipboard:
+            return button
+        button = dict(button)
+        button["clipboard"] = externalized
+        return button
+
+    def to_dict(self):
+        """
+        Return the full configuration as a plain dict, ``buttons`` included.
+
+        Returns:
+            Dictionary suitable for ``json.dump``
+        """
+        items = list(self.config.items())
+        items.insert(self._buttons_position, ("buttons", self.store.to_list()))
+        return dict(items)
     
     def read(self):
         """
-        Read configuration from pastewheel_config.json file.
-        If file doesn't exist, create it with default configuration.
-        
+        Read configuration from the storage backend (pastewheel_config.json
+        by default).  If nothing is stored yet, create it with the default
+        configuration.
+
         Returns:
             Dictionary containing configuration
         """
-        if os.path.exists(self.CONFIG_FILE):
+        if self.backend.exists():
+            # Record the signature before reading so a concurrent change made
+            # while parsing is still picked up by the next reload_if_changed().
+            self._file_signature = self._stat_signature()
+            PasteWheelConfig.disk_reads += 1
             try:
-                with open(self.CONFIG_FILE, 'r') as file:
-                    config = json.load(file)
-                    return config
-            except (json.JSONDecodeError, IOError) as e:
+                return self.backend.load()
+            except (ValueError, IOError) as e:
                 if DEBUG:
                     DebugLogger.log(f"Error reading config file: {e}. Using defaults.")
                 return self.DEFAULT_CONFIG.copy()
@@ -47,21 +262,64 @@ class PasteWheelConfig:
     
     def write(self, config=None):
         """
-        Write configuration to pastewheel_config.json file.
-        
+        Persist the configuration to pastewheel_config.json.
+
+        The write is handed to :attr:`persister` (a write-behind
+        :class:`ConfigPersister`): bursts of changes are coalesced and the
+        file is replaced atomically.  Call :meth:`flush` to force pending
+        changes to disk.
+
         Args:
-            config: Dictionary to write. If None, uses current self.config
+            config: Dictionary to adopt and write. If None, writes the current
+                    configuration (see :meth:`to_dict`)
         """
-        if config is None:
-            config = self.config
-        
-        try:
-            with open(self.CONFIG_FILE, 'w') as file:
-                json.dump(config, file, indent=4)
-            self.config = config
-        except IOError as e:
-            if DEBUG:
-                DebugLogger.log(f"Error writing config file: {e}")
+        if config is not None:
+            self._set_config(config)
+            self.events.emit(ConfigEvent(CONFIG_RELOADED))
+        self._commit(None)
+
+    def _commit(self, records):
+        """
+        Hand a change to the persister, or hold it until the current
+        transaction commits.
+
+        Args:
+            records: List of change records (see :mod:`config_journal`)
+                     describing the change, or None if only a full snapshot
+                     can describe it.
+        """
+        if self._transaction_depth:
+            if records is None or self._transaction_records is None:
+                self._transaction_records = None
+            else:
+                self._transaction_records.extend(records)
+            return
+        self.persister.mark_dirty(records)
+
+    def flush(self):
+        """Block until every pending configuration change is on disk."""
+        self.persister.flush()
+
+    @property
+    def last_write_error(self):
+        """
+        The exception of the most recent failed configuration write, or None.
+        ``persister.write_failures`` counts failures.
+        """
+        return self.persister.last_error
+
+    def _on_file_written(self, snapshot):
+        """
+        Record the signature of our own write so it is not re-read, and
+        delete payload blobs a written full snapshot no longer references.
+
+        Runs on the persister's writer thread.  Backends with lazy payloads
+        write snapshots without every clipboard list, so their blobs are
+        only collected by :meth:`collect_blobs`.
+        """
+        self._file_signature = self._stat_signature()
+        if snapshot is not None and not self.backend.lazy_payloads:
+            self.blobs.collect_garbage(referenced_blobs(snapshot.get("buttons", ())))
     
     def get_theme(self):
         """
@@ -86,7 +344,8 @@ class PasteWheelConfig:
             raise ValueError("Theme must be either 'light' or 'dark'")
 
         self.config["theme"] = theme
-        self.write()
+        self._commit([{"op": "set", "key": "theme", "value": theme}])
+        self.events.emit(ConfigEvent(THEME_CHANGED, value=theme))
 
     def get_input_mode(self):
         """
@@ -111,7 +370,8 @@ class PasteWheelConfig:
             raise ValueError("Input mode must be either 'keyboard' or 'mouse'")
 
         self.config["input_mode"] = input_mode
-        self.write()
+        self._commit([{"op": "set", "key": "input_mode", "value": input_mode}])
+        self.events.emit(ConfigEvent(INPUT_MODE_CHANGED, value=input_mode))
 
     def get(self, key, default=None):
         """
@@ -124,6 +384,8 @@ class PasteWheelConfig:
         Returns:
             Configuration value or default
         """
+        if key == "buttons":
+            return self.store.to_list()
         return self.config.get(key, default)
     
     def set(self, key, value):
@@ -134,8 +396,23 @@ class PasteWheelConfig:
             key: Configuration key
             value: Configuration value
         """
+        if key == "buttons":
+            self.store.reset([self._externalize_payload(b) for b in value or []])
+            self._commit(None)
+            self.events.emit(ConfigEvent(CONFIG_RELOADED))
+            return
+        if key == "storage_mode":
+            # Validates the mode; a full snapshot then folds in any journal.
+            self.backend.set_mode(value)
+            self.config[key] = value
+            self._commit(None)
+            return
         self.config[key] = value
-        self.write()
+        self._commit([{"op": "set", "key": key, "value": value}])
+        if key == "theme":
+            self.events.emit(ConfigEvent(THEME_CHANGED, value=value))
+        elif key == "input_mode":
+            self.events.emit(ConfigEvent(INPUT_MODE_CHANGED, value=value))
     
     def get_button(self, button_id):
         """
@@ -147,13 +424,43 @@ class PasteWheelConfig:
         Returns:
             Dictionary containing button data, or None if not found
         """
-        buttons = self.config.get("buttons", [])
-        for button in buttons:
-            if button.get("id") == button_id:
-                return button
-        return None
-    
-    
+        return self.store.get(button_id)
+
+    def get_button_clipboard(self, button_id):
+        """
+        Get the clipboard payload of a button.
+
+        Backends with lazy payloads (SQLite) load buttons without their
+        "clipboard" list; it is fetched here on first use instead.  Blob
+        references are resolved to their strings, so callers should not keep
+        the result around longer than they need it.
+
+        Args:
+            button_id: The ID of the button
+
+        Returns:
+            List of clipboard strings (empty if the button or payload is missing)
+        """
+        button = self.store.get(button_id)
+        if button is None:
+            return []
+        if "clipboard" in button:
+            clipboard = button["clipboard"]
+        else:
+            clipboard = self.backend.load_payload(button_id) or []
+        return self.blobs.resolve(clipboard)
+
+    def collect_blobs(self):
+        """
+        Delete payload blobs no longer referenced by any button.
+
+        Returns:
+            Number of blobs deleted
+        """
+        self.flush()
+        return self.blobs.collect_garbage(referenced_blobs(self.store.to_list(), self.backend.load_payload))
+
+
     def add_button(self, button_data):
         """
         Add a button to configuration and write to file.
@@ -164,21 +471,56 @@ class PasteWheelConfig:
         if "id" not in button_data:
             raise ValueError("Button data must contain 'id' key")
         
-        buttons = self.config.get("buttons", [])
-        
-        # Check if button with same ID already exists
-        for i, button in enumerate(buttons):
-            if button.get("id") == button_data.get("id"):
-                # Update existing button
-                buttons[i] = button_data
-                self.config["buttons"] = buttons
-                self.write()
-                return
-        
-        # Add new button
-        buttons.append(button_data)
-        self.config["buttons"] = buttons
-        self.write()
+        button_data = self._externalize_payload(button_data)
+        previous = self.store.get(button_data["id"])
+        # Insert, or update the existing button with the same ID in place
+        self.store.put(button_data)
+        self._touch(button_data["id"])
+        self._commit([{"op": "put", "button": button_data}])
+        if previous is None:
+            self.events.emit(ConfigEvent(BUTTON_ADDED, button_data["id"]))
+        else:
+            changed = {
+                key for key in previous.keys() | button_data.keys()
+                if previous.get(key) != button_data.get(key)
+            }
+            if changed:
+                self.events.emit(ConfigEvent(BUTTON_UPDATED, button_data["id"], changed))
+
+    def update_button(self, button_id, fields):
+        """
+        Update selected fields of an existing button and write to file.
+
+        The stored dict is replaced by an updated copy rather than edited in
+        place, so snapshots taken by transactions and the write-behind
+        persister stay consistent.
+
+        Args:
+            button_id: The ID of the button to update
+            fields: Dictionary of field names to new values
+
+        Returns:
+            True if the button was updated, False if not found
+
+        Raises:
+            ValueError: If fields tries to change the button's 'id'
+        """
+        if fields.get("id", button_id) != button_id:
+            raise ValueError("Button 'id' cannot be changed by update_button")
+
+        button = self.store.get(button_id)
+        if button is None:
+            return False
+        if isinstance(fields.get("clipboard"), list):
+            fields = dict(fields)
+            fields["clipboard"] = self.blobs.externalize(fields["clipboard"])
+        updated = dict(button)
+        updated.update(fields)
+        self.store.put(updated)
+        self._touch(button_id)
+        self._commit([{"op": "patch", "id": button_id, "fields": dict(fields)}])
+        self.events.emit(ConfigEvent(BUTTON_UPDATED, button_id, set(fields)))
+        return True
     
     def remove_button(self, button_id):
         """
@@ -190,15 +532,183 @@ class PasteWheelConfig:
         Returns:
             True if button was removed, False if not found
         """
-        buttons = self.config.get("buttons", [])
-        initial_count = len(buttons)
-        buttons = [b for b in buttons if b.get("id") != button_id]
-        
-        if len(buttons) < initial_count:
-            self.config["buttons"] = buttons
-            self.write()
+        if self.store.remove(button_id) is not None:
+            self._touch(button_id)
+            self._commit([{"op": "del", "id": button_id}])
+            self.events.emit(ConfigEvent(BUTTON_REMOVED, button_id))
             return True
         return False
+
+    def remove_button_tree(self, button_id):
+        """
+        Remove a button together with all of its descendants in one write.
+
+        Deleting an expand button this way also deletes its child buttons
+        (and, for a Layer-1 expand button, their children), so no button is
+        left pointing at a missing parent.
+
+        Args:
+            button_id: The ID of the root button to remove
+
+        Returns:
+            Number of buttons removed (0 if button_id was not found)
+        """
+        if button_id not in self.store:
+            return 0
+
+        # Depth-first, children before parents
+        order = []
+        stack = [button_id]
+        while stack:
+            current = stack.pop()
+            order.append(current)
+            stack.extend(child["id"] for child in self.store.by_parent(current) if "id" in child)
+
+        with self.transaction():
+            for current in reversed(order):
+                self.remove_button(current)
+        return len(order)
+
+    # Transactions
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group many button changes into one validated, atomic update.
+
+        Inside the block, ``add_button``, ``update_button``, ``remove_button``
+        and ``set`` only change the in-memory configuration.  When the block
+        exits normally, layer capacities and parent links of the touched
+        buttons are checked once, the file is written once and the change
+        events raised inside the block are delivered together.  If the block
+        raises, or validation fails, every change made inside it is rolled
+        back, its events are dropped and the exception propagates.
+
+        Nested transactions join the outermost one; rollback and the write
+        happen only when the outermost block exits.
+
+        Usage::
+
+            with config.transaction():
+                for button in imported_buttons:
+                    config.add_button(button)
+
+        Yields:
+            This PasteWheelConfig instance
+
+        Raises:
+            ValueError: If the changes violate layer capacities or parent links
+        """
+        if self._transaction_depth:
+            self._transaction_depth += 1
+            try:
+                yield self
+            finally:
+                self._transaction_depth -= 1
+            return
+
+        saved_config = dict(self.config)
+        saved_buttons = self.store.to_list()
+        saved_position = self._buttons_position
+        self._transaction_depth = 1
+        self._transaction_records = []
+        self._transaction_touched = set()
+        self.events.hold()
+        try:
+            yield self
+            self.validate_buttons(self._transaction_touched)
+        except BaseException:
+            self.config = saved_config
+            self.store.reset(saved_buttons)
+            self._buttons_position = saved_position
+            # Payloads queued by the rolled-back changes are never written
+            self.blobs.discard_pending(referenced_blobs(saved_buttons))
+            self.events.release(deliver=False)
+            raise
+        finally:
+            self._transaction_depth = 0
+            self._transaction_touched = set()
+            records = self._transaction_records
+            self._transaction_records = []
+
+        if records is None or records:
+            self._commit(records)
+        self.events.release()
+
+    # Alias: ``with config.batch(): ...``
+    batch = transaction
+
+    def _touch(self, button_id):
+        """Record *button_id* as changed by the current transaction, if any."""
+        if self._transaction_depth:
+            self._transaction_touched.add(button_id)
+
+    def validate_buttons(self, button_ids=None):
+        """
+        Check layer capacities and parent links.
+
+        Rules:
+          - Layer 1 holds at most LAYER_MAX_BUTTONS[1] buttons.
+          - Every Layer 2/3 button names an existing expand-type parent on
+            the layer directly above it.
+          - Each parent holds at most LAYER_MAX_BUTTONS[layer] children.
+          - No remaining button points at a removed parent.
+
+        Args:
+            button_ids: IDs to check (buttons that no longer exist are checked
+                        for orphaned children).  None checks every button.
+
+        Raises:
+            ValueError: Describing every violation found
+        """
+        if button_ids is None:
+            button_ids = [b["id"] for b in self.store.to_list() if "id" in b]
+
+        errors = []
+        checked_parents = set()
+        for button_id in button_ids:
+            button = self.store.get(button_id)
+            if button is None:
+                if self.store.by_parent(button_id):
+                    errors.append(f"Button '{button_id}' was removed but still has child buttons")
+                continue
+
+            layer = button.get("layer")
+            parent_id = button.get("parent_id")
+            if layer == 1:
+                if "__layer1__" not in checked_parents:
+                    checked_parents.add("__layer1__")
+                    count = len(self.store.by_layer(1))
+                    if count > self.LAYER_MAX_BUTTONS[1]:
+                        errors.append(
+                            f"Layer 1 can contain maximum {self.LAYER_MAX_BUTTONS[1]} buttons, got {count}"
+                        )
+            elif layer in (2, 3):
+                parent = self.store.get(parent_id) if parent_id is not None else None
+                if parent is None:
+                    errors.append(f"Button '{button_id}' on layer {layer} has no valid parent_id")
+                    continue
+                if parent.get("button_type") != "exp" or parent.get("layer") != layer - 1:
+                    errors.append(
+                        f"Parent '{parent_id}' of button '{button_id}' must be an expand "
+                        f"button on layer {layer - 1}"
+                    )
+                if parent_id not in checked_parents:
+                    checked_parents.add(parent_id)
+                    count = len(self.store.by_parent(parent_id))
+                    limit = self.LAYER_MAX_BUTTONS[layer]
+                    if count > limit:
+                        errors.append(
+                            f"Parent '{parent_id}' can contain maximum {limit} buttons, got {count}"
+                        )
+            else:
+                errors.append(f"Button '{button_id}' has invalid layer {layer!r}")
+
+            if button.get("button_type") != "exp" and self.store.by_parent(button_id):
+                errors.append(f"Button '{button_id}' has child buttons but is not an expand button")
+
+        if errors:
+            raise ValueError("; ".join(errors))
     
     def get_buttons_by_layer(self, layer):
         """
@@ -210,11 +720,8 @@ class PasteWheelConfig:
         Returns:
             List of button dictionaries found in the layer, or None if no buttons found
         """
-        all_buttons = self.config.get("buttons", [])
-        
-        # Filter buttons by layer
-        layer_buttons = [b for b in all_buttons if b.get("layer") == layer]
-        
+        layer_buttons = self.store.by_layer(layer)
+
         # Return list if buttons found, otherwise None
         if layer_buttons:
             return layer_buttons
@@ -227,14 +734,7 @@ class PasteWheelConfig:
         Returns:
             True if any buttons with 'id' key exist, False otherwise
         """
-        all_buttons = self.config.get("buttons", [])
-
-        # Check if any button has an 'id' key with a value
-        for button in all_buttons:
-            if button.get("id") is not None:
-                return True
-
-        return False
+        return self.store.has_ids()
 
     def has_expand_button_in_layer(self, layer):
         """
@@ -251,10 +751,7 @@ class PasteWheelConfig:
             True if the layer contains at least one button with button_type == 'exp',
             False otherwise
         """
-        layer_buttons = self.get_buttons_by_layer(layer)
-        if not layer_buttons:
-            return False
-        return any(b.get("button_type") == "exp" for b in layer_buttons)
+        return self.store.count_layer_type(layer, "exp") > 0
 
     def get_expand_buttons_by_layer(self, layer):
         """
@@ -266,8 +763,7 @@ class PasteWheelConfig:
         Returns:
             List of expand button dicts in that layer, or [] if none found.
         """
-        layer_buttons = self.get_buttons_by_layer(layer) or []
-        return [b for b in layer_buttons if b.get("button_type") == "exp"]
+        return self.store.by_layer_type(layer, "exp")
 
     def get_child_buttons_by_parent(self, parent_id):
         """
@@ -279,23 +775,34 @@ class PasteWheelConfig:
         Returns:
             List of child button dicts, or [] if none found.
         """
-        all_buttons = self.config.get("buttons", [])
-        return [b for b in all_buttons if b.get("parent_id") == parent_id]
+        return self.store.by_parent(parent_id)
 
     # Emoji Data Management Methods
 
     @classmethod
     def load_emoji_data(cls):
         """
-        Load emoji data from emoji_data.json file with caching.
+        Load emoji data with caching.
         Only loads once and caches the result for future access.
 
+        The binary catalog (EMOJI_CATALOG_FILE) is memory-mapped when it
+        exists; otherwise emoji_data.json is parsed.
+
         Returns:
-            Dictionary containing emoji data
+            Mapping of emoji codes to {"description", "category"}: a
+            MappedEmojiCatalog or a dictionary
         """
         if cls.EMOJI_CACHE is not None:
             return cls.EMOJI_CACHE
 
+        if os.path.exists(cls.EMOJI_CATALOG_FILE):
+            try:
+                cls.EMOJI_CACHE = MappedEmojiCatalog(cls.EMOJI_CATALOG_FILE)
+                return cls.EMOJI_CACHE
+            except (OSError, ValueError) as e:
+                if DEBUG:
+                    DebugLogger.log(f"Error mapping emoji catalog, using JSON data: {e}")
+
         if os.path.exists(cls.EMOJI_DATA_FILE):
             try:
                 with open(cls.EMOJI_DATA_FILE, 'r', encoding='utf-8') as file:
@@ -317,7 +824,7 @@ class PasteWheelConfig:
         Get all emoji data from the emoji database.
 
         Returns:
-            Dictionary containing all emoji data, with emoji codes as keys
+            Mapping containing all emoji data, with emoji codes as keys
         """
         return cls.load_emoji_data()
 
@@ -0,0 +1,73 @@
+from radial_interface.radial_interface_button_widget import RadialInterfaceButtonWidget
+
+
+class ButtonWidgetPool:
+    """
+    Bounded free list of :class:`RadialInterfaceButtonWidget` instances.
+
+    Layer 2 and Layer 3 widgets are only created while their parent expand
+    button is on.  When a branch collapses its widgets are released here,
+    hidden, and handed out again (rebound to other buttons) the next time a
+    branch opens, so opening and closing branches does not keep creating and
+    destroying QPushButtons with their timers, effects and stylesheets.
+
+    Args:
+        parent:     QWidget that owns every widget (the RadialInterface).
+        on_created: Callable invoked once with each newly created widget,
+                    e.g. to connect its signals.
+        max_size:   Maximum number of idle widgets kept; extra released
+                    widgets are destroyed.
+    """
+
+    # One full Layer-2 ring plus one full Layer-3 ring, plus slack.
+    MAX_SIZE = 48
+
+    def __init__(self, parent, on_created=None, max_size=MAX_SIZE):
+        self._parent = parent
+        self._on_created = on_created
+        self.max_size = max_size
+        self._free = []
+
+        # Statistics
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, button_data):
+        """
+        Return a hidden widget showing *button_data*.
+
+        Args:
+            button_data: Button dict from config.
+
+        Returns:
+            A RadialInterfaceButtonWidget, reused from the pool if possible
+        """
+        if self._free:
+            widget = self._free.pop()
+            widget.rebind(button_data)
+            self.reused += 1
+            return widget
+
+        widget = RadialInterfaceButtonWidget(button_data, parent=self._parent)
+        widget.hide()
+        self.created += 1
+        if self._on_created is not None:
+            self._on_created(widget)
+        return widget
+
+    def release(self, widget):
+        """Hide *widget* and keep it for reuse, or destroy it if the pool is full."""
+        widget.hide()
+        if len(self._free) < self.max_size:
+            self._free.append(widget)
+        else:
+            widget.deleteLater()
+
+    def clear(self):
+        """Destroy every idle widget."""
+        for widget in self._free:
+            widget.deleteLater()
+        self._free = []
+
+    def __len__(self):
+        return len(self._free)
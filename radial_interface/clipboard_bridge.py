@@ -0,0 +1,91 @@
+import threading
+
+from PyQt5.QtCore import QObject, QThread, Qt, pyqtSignal
+
+import paste_backends
+
+
+class ClipboardBridge(QObject):
+    """
+    Low-latency clipboard writes from background threads.
+
+    ``pyperclip.copy()`` spawns xclip/xsel on Linux for every call, which is
+    far too slow inside a suppressing keyboard hook that holds the user's
+    Ctrl+V until it returns.  The bridge instead hands the string to the GUI
+    thread, which writes it with the current
+    :func:`paste_backends.clipboard` backend (``QApplication.clipboard()``,
+    which already owns the selection, by default), and waits for a
+    completion handshake before the caller synthesizes the paste.
+
+    The hand-off reuses one argument-less queued signal and one
+    ``threading.Event``: no subprocess and no thread per write.  If the GUI
+    thread does not answer within :attr:`TIMEOUT_S` (e.g. it is stuck in a
+    long operation), the write falls back to pyperclip so the paste still
+    happens.
+
+    Create it on the GUI thread (see :meth:`shared`).
+    """
+
+    TIMEOUT_S = 0.25
+
+    _shared_instance = None
+
+    _write_requested = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pending = None
+        self._done = threading.Event()
+        self._lock = threading.Lock()         # one write in flight at a time
+        self._state_lock = threading.Lock()   # guards _pending
+        self.fallbacks = 0   # writes that timed out and went through pyperclip
+        self._write_requested.connect(self._on_write_requested, Qt.QueuedConnection)
+
+    @classmethod
+    def shared(cls):
+        """
+        Return the process-wide bridge, creating it on first use.  The first
+        call must come from the GUI thread.
+        """
+        if cls._shared_instance is None:
+            cls._shared_instance = ClipboardBridge()
+        return cls._shared_instance
+
+    def set_text(self, text):
+        """
+        Write *text* to the clipboard and return once it is there.
+
+        Safe to call from any thread.
+
+        Returns:
+            True if the GUI thread wrote it, False if pyperclip was used
+        """
+        if QThread.currentThread() is self.thread():
+            paste_backends.clipboard().set_text(text)
+            return True
+        with self._lock:
+            self._pending = text
+            self._done.clear()
+            self._write_requested.emit()
+            if self._done.wait(self.TIMEOUT_S):
+                return True
+            # Withdraw the request, unless the GUI thread already took it
+            with self._state_lock:
+                taken = self._pending is None
+                self._pending = None
+            if taken:
+                self._done.wait()
+                return True
+        self.fallbacks += 1
+        paste_backends.PyperclipClipboardBackend().set_text(text)
+        return False
+
+    def _on_write_requested(self):
+        with self._state_lock:
+            text = self._pending
+            self._pending = None
+        if text is None:
+            # Withdrawn after a timeout; the caller used pyperclip
+            return
+        paste_backends.clipboard().set_text(text)
+        self._done.set()
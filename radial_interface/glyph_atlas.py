@@ -0,0 +1,145 @@
+import math
+from collections import OrderedDict
+
+from PyQt5.QtCore import QPointF, QRectF, Qt
+from PyQt5.QtGui import QColor, QFont, QFontMetrics, QPainter, QPixmap
+
+
+class GlyphAtlas:
+    """
+    Process-wide cache of rasterized labels.
+
+    Shaping color emoji is expensive, and the same few hundred labels are
+    drawn over and over by the wheel buttons and the emoji picker.  Each
+    (text, pixel size, device pixel ratio, color) is rendered once into a
+    transparent QPixmap at device resolution; later draws only blit it.
+    Pixmaps are evicted least recently used first once their total size
+    exceeds :attr:`max_bytes`.
+
+    Counters (:meth:`stats`) report hits, misses, evictions and memory.
+
+    Args:
+        max_bytes: Memory budget of the cached pixmaps (4 bytes per device pixel).
+    """
+
+    MAX_BYTES = 16 * 1024 * 1024
+
+    _shared_instance = None
+
+    def __init__(self, max_bytes=MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._pixmaps = OrderedDict()   # key → (QPixmap, bytes)
+        self._fonts = {}
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def shared(cls):
+        """Return the process-wide atlas, creating it on first use."""
+        if cls._shared_instance is None:
+            cls._shared_instance = cls()
+        return cls._shared_instance
+
+    def pixmap(self, text, pixel_size, ratio, color):
+        """
+        Return the cached pixmap of *text*, rasterizing it on a miss.
+
+        Args:
+            text:       Label text (emoji or plain text).
+            pixel_size: Font pixel size.
+            ratio:      Device pixel ratio of the target.
+            color:      Text color (QColor or color name).
+
+        Returns:
+            QPixmap with its device pixel ratio set to *ratio*
+        """
+        color = QColor(color)
+        key = (text, pixel_size, round(ratio, 2), color.rgba())
+        entry = self._pixmaps.get(key)
+        if entry is not None:
+            self._pixmaps.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        pixmap = self._rasterize(text, pixel_size, ratio, color)
+        size = pixmap.width() * pixmap.height() * 4
+        self._pixmaps[key] = (pixmap, size)
+        self.bytes += size
+        while self.bytes > self.max_bytes and len(self._pixmaps) > 1:
+            _, (_, evicted) = self._pixmaps.popitem(last=False)
+            self.bytes -= evicted
+            self.evictions += 1
+        return pixmap
+
+    def draw(self, painter, rect, text, pixel_size, color):
+        """
+        Draw *text* centered in *rect* with *painter*, from the cache.
+
+        Args:
+            painter:    Active QPainter.
+            rect:       Target QRect or QRectF (logical pixels).
+            text:       Label text.
+            pixel_size: Font pixel size.
+            color:      Text color (QColor or color name).
+        """
+        ratio = painter.device().devicePixelRatioF()
+        pixmap = self.pixmap(text, pixel_size, ratio, color)
+        width = pixmap.width() / ratio
+        height = pixmap.height() / ratio
+        painter.drawPixmap(
+            QPointF(rect.x() + (rect.width() - width) / 2, rect.y() + (rect.height() - height) / 2),
+            pixmap,
+        )
+
+    def clear(self):
+        """Drop every cached pixmap (counters are kept)."""
+        self._pixmaps.clear()
+        self.bytes = 0
+
+    def stats(self):
+        """
+        Return the cache counters.
+
+        Returns:
+            Dict with hits, misses, evictions, hit_rate (None before the
+            first lookup), entries, bytes and max_bytes
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else None,
+            "entries": len(self._pixmaps),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def _font(self, pixel_size):
+        font = self._fonts.get(pixel_size)
+        if font is None:
+            font = QFont()
+            font.setPixelSize(pixel_size)
+            self._fonts[pixel_size] = font
+        return font
+
+    def _rasterize(self, text, pixel_size, ratio, color):
+        font = self._font(pixel_size)
+        metrics = QFontMetrics(font)
+        # One pixel of slack on each side: color emoji often overhang their advance
+        width = max(metrics.horizontalAdvance(text), 1) + 2
+        height = metrics.height() + 2
+        pixmap = QPixmap(math.ceil(width * ratio), math.ceil(height * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        painter.setFont(font)
+        painter.setPen(color)
+        painter.drawText(QRectF(0, 0, width, height), Qt.AlignCenter, text)
+        painter.end()
+        return pixmap
@@ -0,0 +1,272 @@
+import threading
+import weakref
+
+import global_hooks
+import paste_backends
+from radial_interface.clipboard_bridge import ClipboardBridge
+
+
+# How a sequence moves after each paste:
+#   "cycle"    — 1 → 2 → … → n → 1 → …
+#   "stop"     — 1 → 2 → … → n, then keeps pasting n
+#   "pingpong" — 1 → 2 → … → n → n-1 → … → 1 → 2 → …
+SEQUENCE_MODES = ("cycle", "stop", "pingpong")
+DEFAULT_SEQUENCE_MODE = "cycle"
+
+
+class PasteController:
+    """
+    Writes clipboard-button payloads to the OS clipboard.
+
+    Shared by both wheel render modes (button widgets and the single-widget
+    painter), so a click behaves the same whichever draws the button.
+
+    * 0 strings → no-op.
+    * 1 string  → written to the clipboard.
+    * 2 or more → *sequential paste mode*: string 1 is written immediately
+      and a system-wide, suppressing Ctrl+V hook is registered.  Each Ctrl+V
+      writes the string at the sequence cursor via :meth:`advance`, moves
+      the cursor according to the button's ``sequence_mode`` (see
+      :data:`SEQUENCE_MODES`) and then replays the real paste.  ``_seq_index``
+      is the index written by the next Ctrl+V.  :data:`SKIP_HOTKEY` and
+      :data:`BACK_HOTKEY` move the cursor without pasting.
+
+    Only one sequence runs at a time; any new paste (or :meth:`cancel`)
+    removes the hooks.  The strings are held here as a tuple while the hooks
+    are active, so the ``keyboard`` library's hook thread never touches the
+    configuration or any widget, and each step is a few integer operations
+    on class attributes — no lookups that grow with the sequence length and
+    no new containers.
+
+    Widgets follow the cursor through :meth:`position`; :meth:`subscribe`
+    callbacks are told (on the GUI thread) when a sequence starts or ends.
+    """
+
+    SKIP_HOTKEY = "ctrl+alt+right"
+    BACK_HOTKEY = "ctrl+alt+left"
+
+    # Benchmarks drive advance() themselves and must not hook real input
+    INSTALL_HOOKS = True
+
+    _active_hooks = ()    # handles returned by global_hooks.add_hotkey()
+    button_id = None      # id of the button whose sequence is running
+    _seq_items = None     # strings of the running sequence (tuple)
+    _seq_count = 0        # len(_seq_items)
+    _seq_index = 0        # index written by the next Ctrl+V
+    _seq_step = 1         # direction of the next move in ping-pong mode
+    _seq_mode = DEFAULT_SEQUENCE_MODE
+    _bridge = None        # ClipboardBridge used by the hook thread
+    # Guards the cursor fields (_seq_items … _seq_mode) between the hook
+    # thread and the GUI thread
+    _lock = threading.RLock()
+    _subscribers = []
+
+    @classmethod
+    def paste(cls, button_id, items, mode=None):
+        """
+        Write *items* to the clipboard, starting a sequence for two or
+        more strings.
+
+        Args:
+            button_id: Id of the pasted button.  Exposed as :attr:`button_id`
+                       while its sequence is active, so the wheel can show
+                       the sequence position on it, and matched by
+                       :meth:`cancel_for`.
+            items:     List of clipboard strings.
+            mode:      One of :data:`SEQUENCE_MODES` (default "cycle").
+
+        Raises:
+            ValueError: If *mode* is not a known sequence mode.
+        """
+        mode = mode or DEFAULT_SEQUENCE_MODE
+        if mode not in SEQUENCE_MODES:
+            raise ValueError(f"Sequence mode must be one of {SEQUENCE_MODES}")
+
+        # Always cancel any active sequential hook before doing anything else.
+        cls.cancel()
+
+        if not items:
+            return
+
+        if len(items) == 1:
+            paste_backends.clipboard().set_text(items[0])
+            return
+
+        # Sequential paste mode ------------------------------------------------
+        # Reset the sequence and write string 1 immediately.
+        with cls._lock:
+            cls.button_id = button_id
+            cls._seq_items = tuple(items)
+            cls._seq_count = len(cls._seq_items)
+            cls._seq_index = 0
+            cls._seq_step = 1
+            cls._seq_mode = mode
+        paste_backends.clipboard().set_text(items[0])
+
+        # Register the hooks.  Ctrl+V is suppressed and replayed once
+        # advance() has written the next string.  The handlers may run in a
+        # background hook thread, so clipboard writes that must happen on
+        # this (GUI) thread go through the ClipboardBridge, which hands them
+        # over and waits until the clipboard holds the string.
+        cls._bridge = ClipboardBridge.shared()
+        if not cls.INSTALL_HOOKS:
+            cls._notify()
+            return
+        try:
+            cls._active_hooks = (
+                global_hooks.add_hotkey("ctrl+v", cls.advance, suppress=True, replay=True),
+                global_hooks.add_hotkey(cls.SKIP_HOTKEY, cls.skip, suppress=True),
+                global_hooks.add_hotkey(cls.BACK_HOTKEY, cls.back, suppress=True),
+            )
+        except Exception:
+            # If keyboard hooks are unavailable (e.g. headless environment,
+            # insufficient privileges), sequential paste degrades gracefully:
+            # the clipboard already holds string 1 from the write above, and
+            # advance() still works correctly when called directly.
+            pass
+        cls._notify()
+
+    @classmethod
+    def advance(cls):
+        """
+        Write the string at the sequence cursor to the clipboard and move
+        the cursor forward.
+
+        Safe to call from any thread (including the ``keyboard`` library's
+        background hook thread): thread-safe clipboard backends are written
+        directly, others through :class:`ClipboardBridge`.  The write has
+        completed when this returns, so the hook can synthesize the paste
+        right after.
+        """
+        with cls._lock:
+            items = cls._seq_items
+            if items is None:
+                # Cancelled, possibly while this hook call was queued
+                return
+            text = items[cls._seq_index]
+            cls._move(True)
+        backend = paste_backends.clipboard()
+        if backend.thread_safe:
+            backend.set_text(text)
+        else:
+            cls._bridge.set_text(text)
+
+    @classmethod
+    def skip(cls):
+        """Move the cursor forward without pasting."""
+        with cls._lock:
+            if cls._seq_items is not None:
+                cls._move(True)
+
+    @classmethod
+    def back(cls):
+        """Move the cursor back without pasting."""
+        with cls._lock:
+            if cls._seq_items is not None:
+                cls._move(False)
+
+    @classmethod
+    def _move(cls, forward):
+        """
+        Move ``_seq_index`` one step according to ``_seq_mode``.
+        Callers hold ``_lock`` and have checked that a sequence runs.
+        """
+        count = cls._seq_count
+        index = cls._seq_index
+        mode = cls._seq_mode
+        if mode == "cycle":
+            cls._seq_index = (index + 1 if forward else index - 1) % count
+        elif mode == "stop":
+            if forward:
+                cls._seq_index = index + 1 if index + 1 < count else index
+            else:
+                cls._seq_index = index - 1 if index > 0 else index
+        elif forward:  # pingpong (a sequence has at least two strings)
+            if not 0 <= index + cls._seq_step < count:
+                # Bounce off the end; only pastes and skips turn around
+                cls._seq_step = -cls._seq_step
+            cls._seq_index = index + cls._seq_step
+        else:
+            # Going back stops at either end, as in "stop" mode
+            index -= cls._seq_step
+            if 0 <= index < count:
+                cls._seq_index = index
+
+    @classmethod
+    def position(cls):
+        """
+        Return ``(button_id, index, count)`` of the running sequence, where
+        *index* is the string written by the next Ctrl+V, or None.
+        """
+        with cls._lock:
+            if cls._seq_items is None:
+                return None
+            return cls.button_id, cls._seq_index, cls._seq_count
+
+    @classmethod
+    def cancel(cls):
+        """
+        End the running sequence and remove its hooks, if any.
+        Safe to call even when no sequence is active.
+        """
+        with cls._lock:
+            was_active = cls._seq_items is not None
+            cls.button_id = None
+            cls._seq_items = None
+            cls._seq_count = 0
+            cls._seq_index = 0
+            cls._seq_step = 1
+        if cls._active_hooks:
+            try:
+                for hook in cls._active_hooks:
+                    global_hooks.remove_hook(hook)
+            except Exception:
+                pass
+            cls._active_hooks = ()
+        if was_active:
+            cls._notify()
+
+    @classmethod
+    def cancel_for(cls, button_id):
+        """End the running sequence if it belongs to *button_id*."""
+        if cls.button_id is not None and cls.button_id == button_id:
+            cls.cancel()
+
+    # ------------------------------------------------------------------
+    # Subscribers
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def subscribe(cls, callback):
+        """
+        Call *callback()* whenever a sequence starts or ends.  Bound
+        methods are held weakly.
+        """
+        if getattr(callback, "__self__", None) is not None:
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda callback=callback: callback  # noqa: E731
+        cls._subscribers.append(ref)
+
+    @classmethod
+    def unsubscribe(cls, callback):
+        """
+        Remove *callback*.
+
+        Returns:
+            True if it was subscribed, False otherwise
+        """
+        for ref in cls._subscribers:
+            if ref() == callback:
+                cls._subscribers.remove(ref)
+                return True
+        return False
+
+    @classmethod
+    def _notify(cls):
+        for ref in list(cls._subscribers):
+            callback = ref()
+            if callback is None:
+                cls._subscribers.remove(ref)
+            else:
+                callback()
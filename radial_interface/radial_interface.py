@@ -1,16 +1,59 @@
-from PyQt5.QtWidgets import QWidget
-from PyQt5.QtGui import QPainter, QPen, QColor
-from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QWidget, QToolTip
+from PyQt5.QtGui import QPainter, QPen, QColor, QCursor, QRegion, QPixmap, QBrush
+from PyQt5.QtCore import Qt, QPoint, QRect, QTimer, pyqtSignal
 import math
+import time
 from radial_interface.radial_interface_control_button import RadialInterfaceControlButton
 from radial_interface.radial_interface_button_widget import RadialInterfaceButtonWidget
+from radial_interface.button_widget_pool import ButtonWidgetPool
+from radial_interface.paste_controller import PasteController
+from radial_interface.wheel_painter import WheelButtonRecord, paint_button
+from radial_interface.wheel_geometry import WheelGeometry
+from radial_interface.screen_geometry_cache import ScreenGeometryCache
 from radial_interface_settings.radial_interface_settings import RadialInterfaceSettings
 from radial_interface_button_settings.radial_interface_button_settings import RadialInterfaceButtonSettings
 from theme import Theme
 from pastewheel_config import PasteWheelConfig
+from config_events import (
+    BUTTON_EVENTS, BUTTON_REMOVED, BUTTON_UPDATED, CONFIG_RELOADED, THEME_CHANGED, INPUT_MODE_CHANGED,
+)
 
 
 class RadialInterface(QWidget):
+    # Emitted when an expand button is toggled on or off, in either render
+    # mode.  Signature: (button_id: str, is_on: bool)
+    expand_toggled = pyqtSignal(str, bool)
+
+    # Emitted at the end of every paintEvent; the activation daemon uses it
+    # to time trigger-to-first-paint latency.
+    painted = pyqtSignal()
+
+    # How wheel buttons are drawn:
+    #   "widgets" — one RadialInterfaceButtonWidget (QPushButton) per button.
+    #   "painter" — paintEvent draws every visible button from a list of
+    #               WheelButtonRecord and does its own hit-testing.
+    RENDER_MODES = ("widgets", "painter")
+    RENDER_MODE = "widgets"
+
+    # Overlay popup: a frameless, always-on-top, translucent window that is
+    # built once, kept hidden and shown centred on the cursor by popup_at().
+    OVERLAY = False
+
+    # Margin between the outer ring's buttons and the edge of the overlay disc
+    OVERLAY_MARGIN = 6
+
+    # Duration of the label-shrink click feedback, in milliseconds
+    CLICK_FEEDBACK_MS = 100
+
+    # How often the sequence position badge follows the paste hook thread
+    SEQUENCE_POLL_MS = 50
+
+    # Marking-menu selection: press this mouse button anywhere on the wheel,
+    # flick towards a button and release.  Strokes shorter than
+    # FLICK_MIN_DISTANCE pixels close the innermost open branch instead.
+    MARKING_BUTTON = Qt.RightButton
+    FLICK_MIN_DISTANCE = 24
+
     # Layer capacity constraints.
     # Layer 1: 8 buttons total.
     # Layer 2: 16 child buttons per Layer-1 expand button; up to 8 parents → 128 total.
@@ -19,13 +62,25 @@ class RadialInterface(QWidget):
     LAYER2_MAX_BUTTONS = 128   # 8 parents × 16 children
     LAYER3_MAX_BUTTONS = 3072  # 128 parents × 24 children
 
+    # Button fields whose change never moves a widget; edits that touch
+    # only these patch the existing widget instead of reconciling.
+    IN_PLACE_FIELDS = frozenset({"label", "tooltip", "clipboard"})
+    # Button fields whose change ends the button's running sequence
+    SEQUENCE_FIELDS = frozenset({"clipboard", "sequence_mode"})
+
     # Circle radii
     LAYER1_RADIUS = 50
     LAYER2_RADIUS = 100
     LAYER3_RADIUS = 150
 
-    def __init__(self, width=400, height=400, layer1=None, layer2=None, layer3=None):
+    def __init__(self, width=400, height=400, layer1=None, layer2=None, layer3=None,
+                 render_mode=None, overlay=None):
         super().__init__()
+        render_mode = render_mode or self.RENDER_MODE
+        if render_mode not in self.RENDER_MODES:
+            raise ValueError(f"Render mode must be one of {self.RENDER_MODES}")
+        self.render_mode = render_mode
+        self.overlay = self.OVERLAY if overlay is None else overlay
         self.width = width
         self.height = height
         self.settings_window = None
@@ -50,11 +105,72 @@ class RadialInterface(QWidget):
         self.button_widget_map = {}
 
         # Maps parent_id → list of child RadialInterfaceButtonWidget instances.
-        # Used to show/hide children when an expand button is toggled.
+        # Only parents whose children are materialized (toggled on, or
+        # prefetched on hover) have an entry.
         self.children_widgets_by_parent = {}
 
+        # Recycles Layer 2/3 widgets between branches (see _release_children)
+        self._widget_pool = ButtonWidgetPool(self, on_created=self._connect_button_widget)
+
+        # Collapsed expand button whose children were prepared on hover
+        self._prefetched_parent = None
+
+        # Open expand button per layer (both render modes).  Painter render
+        # mode state: visible button records in draw order, button_id →
+        # record, the ids shown on each ring, and the ids under the cursor /
+        # mouse press / click feedback.
+        self._records = []
+        self._record_map = {}
+        self._open_by_layer = {}
+        self._hover_id = None
+        self._pressed_id = None
+        self._feedback_id = None
+        self._ring_ids = {}
+        if render_mode == "painter":
+            self.setMouseTracking(True)
+
+        # Polar layout of the rings, for O(1) selection (see select_at)
+        self.wheel_geometry = WheelGeometry(
+            self.width / 2, self.height / 2,
+            (self.LAYER1_RADIUS, self.LAYER2_RADIUS, self.LAYER3_RADIUS),
+            RadialInterfaceButtonWidget.BUTTON_SIZE,
+        )
+
+        # Marking-menu stroke in progress: start and current position
+        self._marking_origin = None
+        self._marking_pos = None
+
+        # Cached ring background pixmap and window mask, with the
+        # (width, height, device pixel ratio) they were built for
+        self._background = None
+        self._background_key = None
+        self._mask_key = None
+
+        # Available geometry per monitor, for keeping popups on screen
+        self._screens = ScreenGeometryCache()
+
+        # perf_counter() of the last popup_at() until its first paint, and
+        # the resulting show-to-paint time in milliseconds
+        self._show_started = None
+        self.last_show_to_paint_ms = None
+
+        # Sequence position badge: the widget or record showing it and its
+        # text.  The paste hook thread only moves an index; a timer running
+        # while a sequence is active copies it to the badge.
+        self._badge_target = None
+        self._badge_text = None
+        self._sequence_timer = QTimer(self)
+        self._sequence_timer.setInterval(self.SEQUENCE_POLL_MS)
+        self._sequence_timer.timeout.connect(self._sync_sequence_badge)
+
         self.initUI()
 
+        PasteController.subscribe(self._on_sequence_changed)
+
+        # Patch the interface from config change events instead of waiting
+        # for a particular window to announce that something changed.
+        PasteWheelConfig.shared().subscribe(self._on_config_events)
+
     def _validate_layers(self):
         """Validate that layers don't exceed their capacity constraints."""
         if len(self.layer1) > self.LAYER1_MAX_BUTTONS:
@@ -124,7 +240,7 @@ class RadialInterface(QWidget):
         Read button data from PasteWheelConfig and populate self.layer1/2/3.
         Called during initUI so the layers reflect the saved configuration.
         """
-        config = PasteWheelConfig()
+        config = PasteWheelConfig.shared()
         for layer_num, layer_list in [(1, self.layer1), (2, self.layer2), (3, self.layer3)]:
             layer_buttons = config.get_buttons_by_layer(layer_num)
             if layer_buttons:
@@ -132,80 +248,179 @@ class RadialInterface(QWidget):
                 layer_list.extend(layer_buttons)
         self._validate_layers()
 
+    def _render_buttons(self):
+        """Render the wheel buttons with the active render mode."""
+        if self.render_mode == "painter":
+            self._rebuild_records()
+            self.update()
+        else:
+            self._render_button_widgets()
+
     def _render_button_widgets(self):
         """
-        Create and position RadialInterfaceButtonWidget instances.
+        Create, update and position RadialInterfaceButtonWidget instances.
 
         **Visibility rules (Rule 3):**
         Only Layer 1 buttons are visible when the interface first opens.
-        Layer 2 and Layer 3 buttons are pre-rendered but hidden; they become
-        visible only when their parent expand button is toggled on.
+        Layer 2 and Layer 3 widgets are materialized only when their parent
+        expand button is toggled on (or prefetched while it is hovered), and
+        are released to :attr:`_widget_pool` when it collapses.  Startup cost
+        therefore depends on Layer 1, not on the size of the library.
 
         **Positioning:**
         Layer 2 children are positioned as a group using the sibling count
         (children of the same parent), not the total Layer-2 count.  This
         ensures correct radial spacing regardless of how many other parents
         exist.  The same applies to Layer 3.
+
+        **Reconciliation:**
+        Re-rendering diffs the layers against ``button_widget_map``.  Existing
+        widgets are updated in place (see
+        :meth:`RadialInterfaceButtonWidget.update_data`) and only moved when
+        their slot changes; widgets are acquired only for new buttons and
+        released only for removed ones.  Expand-toggle state is kept, so
+        open branches stay open.
         """
-        # Remove any previously rendered button widgets
-        for widget in self.button_widgets:
-            widget.deleteLater()
-        self.button_widgets.clear()
-        self.button_widget_map.clear()
-        self.children_widgets_by_parent.clear()
+        previous = self.button_widget_map
+        self.button_widgets = []
+        self.button_widget_map = {}
+        self.children_widgets_by_parent = {}
 
-        config = PasteWheelConfig()
-        btn_size = RadialInterfaceButtonWidget.BUTTON_SIZE
-        half = btn_size // 2
+        config = PasteWheelConfig.shared()
 
         # ── Layer 1 (always visible) ────────────────────────────────────
         total_l1 = len(self.layer1)
         for idx, button_data in enumerate(self.layer1):
-            x, y = self._calculate_button_position(self.LAYER1_RADIUS, idx, total_l1)
-            widget = RadialInterfaceButtonWidget(button_data, parent=self)
-            widget.move(int(x) - half, int(y) - half)
-            widget.show()
-            self.button_widgets.append(widget)
-            self.button_widget_map[button_data["id"]] = widget
-            if button_data.get("button_type") == "exp":
-                widget.expand_toggled.connect(self._on_expand_toggled)
-
-        # ── Layer 2 (hidden initially; one group per Layer-1 expand parent) ─
+            self._place_button_widget(previous, button_data, self.LAYER1_RADIUS, idx, total_l1, True)
+
+        # ── Layers 2 and 3 (only branches that are open or prefetched) ──
         for l1_btn in self.layer1:
-            if l1_btn.get("button_type") != "exp":
-                continue
-            parent_id = l1_btn["id"]
-            children = config.get_child_buttons_by_parent(parent_id)
-            total = len(children)
-            child_widgets = []
-            for idx, button_data in enumerate(children):
-                x, y = self._calculate_button_position(self.LAYER2_RADIUS, idx, total)
-                widget = RadialInterfaceButtonWidget(button_data, parent=self)
-                widget.move(int(x) - half, int(y) - half)
-                widget.hide()   # Rule 3: hidden until parent is toggled on
-                self.button_widgets.append(widget)
-                self.button_widget_map[button_data["id"]] = widget
-                child_widgets.append(widget)
-                if button_data.get("button_type") == "exp":
-                    widget.expand_toggled.connect(self._on_expand_toggled)
-            self.children_widgets_by_parent[parent_id] = child_widgets
-
-        # ── Layer 3 (hidden initially; one group per Layer-2 expand parent) ─
-        l2_expand_buttons = config.get_expand_buttons_by_layer(2)
-        for l2_btn in l2_expand_buttons:
-            parent_id = l2_btn["id"]
-            children = config.get_child_buttons_by_parent(parent_id)
-            total = len(children)
-            child_widgets = []
-            for idx, button_data in enumerate(children):
-                x, y = self._calculate_button_position(self.LAYER3_RADIUS, idx, total)
-                widget = RadialInterfaceButtonWidget(button_data, parent=self)
-                widget.move(int(x) - half, int(y) - half)
-                widget.hide()   # Rule 3: hidden until parent is toggled on
-                self.button_widgets.append(widget)
-                self.button_widget_map[button_data["id"]] = widget
-                child_widgets.append(widget)
-            self.children_widgets_by_parent[parent_id] = child_widgets
+            if l1_btn.get("button_type") == "exp" and self._is_materialized(l1_btn["id"]):
+                self._place_child_widgets(previous, config, l1_btn["id"])
+        for l2_btn in config.get_expand_buttons_by_layer(2):
+            if self._is_materialized(l2_btn["id"]):
+                self._place_child_widgets(previous, config, l2_btn["id"])
+
+        if self._prefetched_parent not in self.children_widgets_by_parent:
+            self._prefetched_parent = None
+
+        # Release widgets whose buttons no longer exist or whose branch closed;
+        # only a deleted button ends its running sequence
+        for widget in previous.values():
+            if config.get_button(widget.button_id) is None:
+                PasteController.cancel_for(widget.button_id)
+            self._widget_pool.release(widget)
+
+    def _is_materialized(self, parent_id):
+        """Return True if the children of *parent_id* should have widgets."""
+        parent_widget = self.button_widget_map.get(parent_id)
+        if parent_widget is None:
+            return False
+        return parent_widget.is_toggled or parent_id == self._prefetched_parent
+
+    def _connect_button_widget(self, widget):
+        """Connect the signals of a newly created button widget."""
+        # Connected for every type: widgets are rebound to other buttons and
+        # update_data() may change the type.  Only expand buttons emit them.
+        widget.expand_toggled.connect(self._on_expand_toggled)
+        widget.expand_hovered.connect(self._on_expand_hovered)
+
+    def _place_child_widgets(self, previous, config, parent_id):
+        """
+        Materialize the children of *parent_id* on the next ring.
+
+        They are visible only while the parent widget is visible and
+        toggled on (Rule 3); otherwise they are prepared hidden.
+
+        Args:
+            previous:  button_id → widget map of widgets that may be reused.
+            config:    The shared PasteWheelConfig.
+            parent_id: ID of the parent expand button (already placed).
+
+        Returns:
+            List of the child widgets
+        """
+        parent_widget = self.button_widget_map[parent_id]
+        radius = self.LAYER2_RADIUS if parent_widget.button_layer == 1 else self.LAYER3_RADIUS
+        visible = parent_widget.is_toggled and not parent_widget.isHidden()
+        children = config.get_child_buttons_by_parent(parent_id)
+        total = len(children)
+        child_widgets = [
+            self._place_button_widget(previous, button_data, radius, idx, total, visible)
+            for idx, button_data in enumerate(children)
+        ]
+        self.children_widgets_by_parent[parent_id] = child_widgets
+        return child_widgets
+
+    def _place_button_widget(self, previous, button_data, radius, idx, total, visible):
+        """
+        Reuse (or acquire) the widget for *button_data* and put it in its slot.
+
+        Args:
+            previous: button_id → widget map of the last render; the reused
+                      widget is removed from it.
+            button_data: Button dict from config.
+            radius:  Ring radius.
+            idx:     Index among its siblings.
+            total:   Number of siblings.
+            visible: Whether the widget should be shown.
+
+        Returns:
+            The RadialInterfaceButtonWidget
+        """
+        half = RadialInterfaceButtonWidget.BUTTON_SIZE // 2
+        x, y = self._calculate_button_position(radius, idx, total)
+        position = QPoint(int(x) - half, int(y) - half)
+
+        widget = previous.pop(button_data["id"], None)
+        if widget is None:
+            widget = self._widget_pool.acquire(button_data)
+            widget.move(position)
+            widget.setVisible(visible)
+        else:
+            widget.update_data(button_data)
+            if widget.pos() != position:
+                widget.move(position)
+            if widget.isHidden() == visible:
+                widget.setVisible(visible)
+        if not visible and widget.is_toggled:
+            # A hidden expand button must not keep its branch open.
+            widget.set_toggled(False)
+
+        self.button_widgets.append(widget)
+        self.button_widget_map[button_data["id"]] = widget
+        return widget
+
+    def _materialize_children(self, parent_id):
+        """
+        Return the child widgets of *parent_id*, creating them if needed.
+
+        Args:
+            parent_id: ID of an expand button that has a widget.
+        """
+        child_widgets = self.children_widgets_by_parent.get(parent_id)
+        if child_widgets is None:
+            child_widgets = self._place_child_widgets({}, PasteWheelConfig.shared(), parent_id)
+        return child_widgets
+
+    def _release_children(self, parent_id):
+        """
+        Release the child widgets of *parent_id* (and, recursively, of any
+        expand child that is open) back to the pool.
+        """
+        child_widgets = self.children_widgets_by_parent.pop(parent_id, None)
+        if child_widgets is None:
+            return
+        if self._prefetched_parent == parent_id:
+            self._prefetched_parent = None
+        for child_widget in child_widgets:
+            if child_widget.button_type == "exp":
+                if child_widget.is_toggled:
+                    child_widget.set_toggled(False)
+                self._release_children(child_widget.button_id)
+            self.button_widget_map.pop(child_widget.button_id, None)
+            self.button_widgets.remove(child_widget)
+            self._widget_pool.release(child_widget)
 
     # ------------------------------------------------------------------
     # Expand-button toggle logic (Rules 4 & 5)
@@ -215,17 +430,18 @@ class RadialInterface(QWidget):
         """
         React to an expand button being toggled on or off.
 
-        **Rule 4** — When turned ON, this button's direct children are shown.
-                     When turned OFF, all descendants are hidden.
+        **Rule 4** — When turned ON, this button's direct children are
+                     materialized and shown.  When turned OFF, all
+                     descendants are hidden and released to the pool.
 
         **Rule 5** — When turned ON, every *other* expand button in the same
-                     layer is turned off (and its descendants hidden).
+                     layer is turned off (and its descendants released).
 
         Args:
             button_id: ID of the expand button that was toggled.
             is_on:     New toggle state (True = ON, False = OFF).
         """
-        config = PasteWheelConfig()
+        config = PasteWheelConfig.shared()
         button_data = config.get_button(button_id)
         if not button_data:
             return
@@ -238,13 +454,39 @@ class RadialInterface(QWidget):
                 if other_btn["id"] != button_id:
                     self._turn_off_expand_button(other_btn["id"])
 
+            self._open_by_layer[layer] = button_id
+
             # Rule 4: show this button's direct children
-            for child_widget in self.children_widgets_by_parent.get(button_id, []):
+            if self._prefetched_parent == button_id:
+                self._prefetched_parent = None
+            for child_widget in self._materialize_children(button_id):
                 child_widget.show()
         else:
+            if self._open_by_layer.get(layer) == button_id:
+                del self._open_by_layer[layer]
             # Rule 4: hide all descendants when turned off
             self._hide_children_recursive(button_id)
 
+        self.expand_toggled.emit(button_id, is_on)
+
+    def _on_expand_hovered(self, button_id: str):
+        """
+        Prepare the children of a collapsed expand button while it is
+        hovered, so the click that opens it only has to show them.
+
+        Only one collapsed branch is prefetched at a time.
+
+        Args:
+            button_id: ID of the hovered expand button.
+        """
+        widget = self.button_widget_map.get(button_id)
+        if widget is None or widget.is_toggled or button_id in self.children_widgets_by_parent:
+            return
+        if self._prefetched_parent is not None:
+            self._release_children(self._prefetched_parent)
+        self._prefetched_parent = button_id
+        self._materialize_children(button_id)
+
     def _turn_off_expand_button(self, button_id: str):
         """
         Programmatically turn off an expand button and hide all its descendants.
@@ -258,23 +500,380 @@ class RadialInterface(QWidget):
         widget = self.button_widget_map.get(button_id)
         if widget is not None:
             widget.set_toggled(False)
+            if self._open_by_layer.get(widget.button_layer) == button_id:
+                del self._open_by_layer[widget.button_layer]
         self._hide_children_recursive(button_id)
 
     def _hide_children_recursive(self, parent_id: str):
         """
-        Hide all children of *parent_id*.
+        Hide all children of *parent_id* and release their widgets.
 
-        For any child that is itself an expand button and currently toggled on,
-        recursively turn it off and hide its own children first.
+        Any child that is itself an expand button and currently toggled on is
+        turned off and its own children are released first.
 
         Args:
             parent_id: ID of the parent whose children should be hidden.
         """
-        for child_widget in self.children_widgets_by_parent.get(parent_id, []):
-            child_widget.hide()
-            if child_widget.button_type == "exp" and child_widget.is_toggled:
-                child_widget.set_toggled(False)
-                self._hide_children_recursive(child_widget.button_id)
+        self._release_children(parent_id)
+
+    # ------------------------------------------------------------------
+    # Selection engine (polar hit-testing and marking menu)
+    # ------------------------------------------------------------------
+
+    def _ring_groups(self):
+        """
+        Return layer → list of the button ids currently shown on that ring,
+        in layout order.  Only Layer 1 and the children of open expand
+        buttons are included, so the lists never exceed the ring capacity.
+        """
+        if self.render_mode == "painter":
+            return self._ring_ids
+        groups = {1: [button["id"] for button in self.layer1]}
+        for layer in (1, 2):
+            parent_id = self._open_by_layer.get(layer)
+            parent_widget = self.button_widget_map.get(parent_id)
+            if parent_widget is None or not parent_widget.is_toggled or parent_widget.isHidden():
+                break
+            groups[layer + 1] = [w.button_id for w in self.children_widgets_by_parent.get(parent_id, [])]
+        return groups
+
+    def select_at(self, pos, precise=True):
+        """
+        Return the id of the visible button at *pos*, from its polar angle
+        and radius alone.
+
+        Args:
+            pos:     QPoint in widget coordinates.
+            precise: If False, anywhere in the button's ring band and
+                     angular slot counts as a hit.
+
+        Returns:
+            Button id, or None
+        """
+        groups = self._ring_groups()
+        counts = {layer: len(ids) for layer, ids in groups.items()}
+        hit = self.wheel_geometry.hit(pos.x(), pos.y(), counts, precise=precise)
+        if hit is None:
+            return None
+        layer, index = hit
+        return groups[layer][index]
+
+    def _marking_layer(self, groups):
+        """Return the ring a flick selects on: the innermost open branch's."""
+        return max(groups) if groups else None
+
+    def _marking_candidate(self, pos):
+        """Return the button id a stroke from the origin to *pos* selects."""
+        groups = self._ring_groups()
+        layer = self._marking_layer(groups)
+        if layer is None:
+            return None
+        index = WheelGeometry.flick_sector(
+            pos.x() - self._marking_origin.x(), pos.y() - self._marking_origin.y(),
+            len(groups[layer]), self.FLICK_MIN_DISTANCE,
+        )
+        return None if index is None else groups[layer][index]
+
+    def begin_marking(self, pos):
+        """
+        Start a marking-menu stroke at *pos* (widget coordinates).
+
+        The stroke's direction, not its end point, selects the button on
+        the innermost shown ring, so selection works without precise
+        targeting.  Activation daemons can call this with the cursor
+        position when their trigger is pressed.
+        """
+        self._marking_origin = QPoint(pos)
+        self._marking_pos = QPoint(pos)
+        self.update()
+
+    def update_marking(self, pos):
+        """Follow the stroke to *pos* and preview the selected button."""
+        if self._marking_origin is None:
+            return
+        self._marking_pos = QPoint(pos)
+        if self.render_mode == "painter":
+            self._set_hover(self._record_map.get(self._marking_candidate(pos)))
+        self.update()
+
+    def end_marking(self, pos):
+        """
+        Finish the stroke at *pos* and fire the selected button.
+
+        A flick activates the button in its direction (pasting a clip
+        button, opening an expand button so the next flick picks among its
+        children).  A stroke shorter than FLICK_MIN_DISTANCE closes the
+        innermost open branch.
+
+        Returns:
+            The id of the activated button, or None
+        """
+        if self._marking_origin is None:
+            return None
+        button_id = self._marking_candidate(pos)
+        self._marking_origin = None
+        self._marking_pos = None
+        self.update()
+
+        if button_id is not None:
+            self._activate_button(button_id)
+            return button_id
+
+        # Tap: step back out of the innermost open branch
+        groups = self._ring_groups()
+        layer = self._marking_layer(groups)
+        if layer is not None and layer > 1:
+            self._activate_button(self._open_by_layer[layer - 1])
+        return None
+
+    def _activate_button(self, button_id):
+        """Click the button *button_id* in the active render mode."""
+        if self.render_mode == "painter":
+            record = self._record_map.get(button_id)
+            if record is not None:
+                self._activate_record(record)
+        else:
+            widget = self.button_widget_map.get(button_id)
+            if widget is not None:
+                widget.click()
+
+    def _paint_marking(self, painter):
+        """Draw the marking-menu stroke in progress."""
+        if self._marking_origin is None:
+            return
+        pen = QPen(QColor(self.colors.get("accent", "#007BFF")))
+        pen.setWidth(2)
+        painter.setPen(pen)
+        painter.drawLine(self._marking_origin, self._marking_pos)
+
+    # ------------------------------------------------------------------
+    # Painter render mode
+    # ------------------------------------------------------------------
+
+    def _rebuild_records(self):
+        """
+        Rebuild the visible button records from the config.
+
+        Layer 1 is always visible; the children of the open expand button of
+        Layer 1 (and of Layer 2, if its parent is open) follow (Rules 3 and
+        4).  Open buttons that no longer exist or are no longer expand
+        buttons are closed.
+
+        Returns:
+            The previous records, so callers can compute dirty rectangles
+        """
+        config = PasteWheelConfig.shared()
+        previous = self._records
+        records = []
+
+        total_l1 = len(self.layer1)
+        for idx, button_data in enumerate(self.layer1):
+            x, y = self._calculate_button_position(self.LAYER1_RADIUS, idx, total_l1)
+            records.append(WheelButtonRecord(button_data, x, y))
+
+        parents = records
+        for layer, radius in ((1, self.LAYER2_RADIUS), (2, self.LAYER3_RADIUS)):
+            open_id = self._open_by_layer.get(layer)
+            parent = next(
+                (r for r in parents if r.button_id == open_id and r.button_type == "exp"), None
+            )
+            if parent is None:
+                # Closing a layer closes everything below it.
+                for deeper in range(layer, 3):
+                    self._open_by_layer.pop(deeper, None)
+                break
+            parent.toggled = True
+            children = config.get_child_buttons_by_parent(open_id)
+            total = len(children)
+            parents = []
+            for idx, button_data in enumerate(children):
+                x, y = self._calculate_button_position(radius, idx, total)
+                parents.append(WheelButtonRecord(button_data, x, y))
+            records.extend(parents)
+
+        self._records = records
+        self._record_map = {record.button_id: record for record in records}
+        self._ring_ids = {}
+        for record in records:
+            self._ring_ids.setdefault(record.layer, []).append(record.button_id)
+        for attr in ("_hover_id", "_pressed_id", "_feedback_id"):
+            if getattr(self, attr) not in self._record_map:
+                setattr(self, attr, None)
+        return previous
+
+    def _hit_test(self, pos):
+        """Return the record under *pos* (a QPoint), or None."""
+        return self._record_map.get(self.select_at(pos))
+
+    def _update_records(self, *button_ids):
+        """Schedule a repaint of just the given buttons' rectangles."""
+        region = QRegion()
+        for button_id in button_ids:
+            record = self._record_map.get(button_id)
+            if record is not None:
+                region += record.rect()
+        if not region.isEmpty():
+            self.update(region)
+
+    def _toggle_record(self, record):
+        """
+        Toggle an expand button in painter mode.
+
+        Same semantics as the widget path: turning a button on closes any
+        other open button of its layer and their descendants (Rule 5) and
+        shows its children; turning it off hides all descendants (Rule 4).
+        Only rectangles of buttons that appeared, disappeared or changed
+        state are repainted.
+        """
+        is_on = not record.toggled
+        if is_on:
+            self._open_by_layer[record.layer] = record.button_id
+        else:
+            self._open_by_layer.pop(record.layer, None)
+        for deeper in range(record.layer + 1, 3):
+            self._open_by_layer.pop(deeper, None)
+
+        before = {r.button_id: r for r in self._rebuild_records()}
+        region = QRegion()
+        for button_id, old in before.items():
+            new = self._record_map.get(button_id)
+            if new is None or new.toggled != old.toggled:
+                region += old.rect()
+        for button_id, new in self._record_map.items():
+            if button_id not in before:
+                region += new.rect()
+        self.update(region)
+
+        self.expand_toggled.emit(record.button_id, is_on)
+
+    def _activate_record(self, record):
+        """Click on a painted button: toggle an expand button or paste."""
+        if record.button_type == "exp":
+            self._toggle_record(record)
+            return
+        config = PasteWheelConfig.shared()
+        button = config.get_button(record.button_id) or {}
+        PasteController.paste(
+            record.button_id, config.get_button_clipboard(record.button_id),
+            mode=button.get("sequence_mode"),
+        )
+        # Shrink the label briefly for tactile feedback
+        self._feedback_id = record.button_id
+        self._update_records(record.button_id)
+        QTimer.singleShot(self.CLICK_FEEDBACK_MS, self._end_click_feedback)
+
+    # ------------------------------------------------------------------
+    # Sequence position badge
+    # ------------------------------------------------------------------
+
+    def _on_sequence_changed(self):
+        """A paste sequence started or ended."""
+        if PasteController.position() is None:
+            self._sequence_timer.stop()
+        else:
+            self._sequence_timer.start()
+        self._sync_sequence_badge()
+
+    def _sync_sequence_badge(self):
+        """
+        Show the running sequence's next position ("3/12") on its button,
+        moving the badge when the button's widget or record was replaced.
+        """
+        position = PasteController.position()
+        target = text = None
+        if position is not None:
+            button_id, index, count = position
+            target = self.button_widget_map.get(button_id) or self._record_map.get(button_id)
+            text = f"{index + 1}/{count}"
+        if target is self._badge_target and text == self._badge_text:
+            return
+        self._set_badge(self._badge_target, None)
+        self._set_badge(target, text)
+        self._badge_target = target
+        self._badge_text = text
+
+    def _set_badge(self, target, text):
+        if target is None:
+            return
+        if isinstance(target, WheelButtonRecord):
+            target.badge = text
+            self._update_records(target.button_id)
+        else:
+            try:
+                target.set_badge(text)
+            except RuntimeError:
+                # The widget was deleted (pool overflow) since it got the badge
+                pass
+
+    def _end_click_feedback(self):
+        button_id, self._feedback_id = self._feedback_id, None
+        self._update_records(button_id)
+
+    def _set_hover(self, record, global_pos=None):
+        """Move the hover highlight (and tooltip) to *record*."""
+        button_id = record.button_id if record is not None else None
+        if button_id == self._hover_id:
+            return
+        previous, self._hover_id = self._hover_id, button_id
+        self._update_records(previous, button_id)
+        if record is None:
+            self.setCursor(QCursor(Qt.ArrowCursor))
+            QToolTip.hideText()
+            return
+        self.setCursor(QCursor(Qt.PointingHandCursor))
+        if record.tooltip and global_pos is not None:
+            QToolTip.showText(QPoint(global_pos.x() + 15, global_pos.y() - 20), record.tooltip, self)
+        else:
+            QToolTip.hideText()
+
+    def mouseMoveEvent(self, event):
+        if self._marking_origin is not None:
+            self.update_marking(event.pos())
+            return
+        if self.render_mode == "painter":
+            self._set_hover(self._hit_test(event.pos()), event.globalPos())
+        super().mouseMoveEvent(event)
+
+    def leaveEvent(self, event):
+        if self.render_mode == "painter":
+            self._set_hover(None)
+        super().leaveEvent(event)
+
+    def mousePressEvent(self, event):
+        if event.button() == self.MARKING_BUTTON:
+            self.begin_marking(event.pos())
+            return
+        if self.render_mode == "painter" and event.button() == Qt.LeftButton:
+            record = self._hit_test(event.pos())
+            if record is not None:
+                self._pressed_id = record.button_id
+                self._update_records(record.button_id)
+                return
+        super().mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == self.MARKING_BUTTON and self._marking_origin is not None:
+            self.end_marking(event.pos())
+            return
+        if self.render_mode == "painter" and event.button() == Qt.LeftButton and self._pressed_id:
+            pressed_id, self._pressed_id = self._pressed_id, None
+            self._update_records(pressed_id)
+            record = self._hit_test(event.pos())
+            if record is not None and record.button_id == pressed_id:
+                self._activate_record(record)
+            return
+        super().mouseReleaseEvent(event)
+
+    def _paint_records(self, painter, rect):
+        """Draw every visible button record intersecting *rect*."""
+        for record in self._records:
+            if not rect.intersects(record.rect()):
+                continue
+            paint_button(
+                painter, record, self.colors,
+                hovered=record.button_id == self._hover_id,
+                pressed=record.button_id in (self._pressed_id, self._feedback_id),
+            )
 
     # ------------------------------------------------------------------
     # UI initialisation
@@ -282,14 +881,18 @@ class RadialInterface(QWidget):
 
     def initUI(self):
         self.setWindowTitle('Radial Interface')
-        self.setGeometry(100, 100, self.width, self.height)
+        if self.overlay:
+            self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
+            self.setAttribute(Qt.WA_TranslucentBackground)
+            self.resize(self.width, self.height)
+        else:
+            self.setGeometry(100, 100, self.width, self.height)
 
         # Load button data from config into self.layer1/2/3
         self._load_buttons_from_config()
 
         # Apply theme background color
-        background_color = self.colors.get("background", "#FFFFFF")
-        self.setStyleSheet(f"background-color: {background_color};")
+        self._apply_window_background()
 
         # Create close button in lower-left corner
         self.close_btn = RadialInterfaceControlButton(
@@ -338,14 +941,14 @@ class RadialInterface(QWidget):
 
         # Hide the "add first button" widget when buttons already exist in config;
         # show it only when there are no buttons yet.
-        config = PasteWheelConfig()
+        config = PasteWheelConfig.shared()
         if config.has_any_buttons():
             self.add_new_btns.hide()
         else:
             self.add_new_btns.show()
 
-        # Render existing buttons as visual widgets on the radial rings
-        self._render_button_widgets()
+        # Render existing buttons on the radial rings
+        self._render_buttons()
 
         # Connect control button clicks
         self.keyboard_btn.clicked.connect(self.on_keyboard_btn_clicked)
@@ -354,8 +957,18 @@ class RadialInterface(QWidget):
         self.settings_btn.clicked.connect(self.on_settings_btn_clicked)
 
         # Set initial button visibility based on saved input mode
-        config = PasteWheelConfig()
-        input_mode = config.get_input_mode()
+        config = PasteWheelConfig.shared()
+        self._sync_input_mode_buttons(config.get_input_mode())
+
+        # Create the native overlay window and its mask now, so that
+        # popup_at() only has to move and show it.
+        if self.overlay:
+            self.winId()
+            self.windowHandle().screenChanged.connect(self._on_screen_changed)
+            self._update_mask()
+
+    def _sync_input_mode_buttons(self, input_mode):
+        """Show the control button that switches away from *input_mode*."""
         if input_mode == "mouse":
             self.keyboard_btn.show()
             self.mouse_btn.hide()
@@ -367,14 +980,14 @@ class RadialInterface(QWidget):
         """Handle keyboard button click - show mouse button."""
         self.keyboard_btn.hide()
         self.mouse_btn.show()
-        config = PasteWheelConfig()
+        config = PasteWheelConfig.shared()
         config.set_input_mode("keyboard")
 
     def on_mouse_btn_clicked(self):
         """Handle mouse button click - show keyboard button."""
         self.mouse_btn.hide()
         self.keyboard_btn.show()
-        config = PasteWheelConfig()
+        config = PasteWheelConfig.shared()
         config.set_input_mode("mouse")
 
     def on_add_new_btns_clicked(self):
@@ -390,40 +1003,169 @@ class RadialInterface(QWidget):
     def on_settings_btn_clicked(self):
         """Handle settings button click - open settings window."""
         if self.settings_window is None:
+            # Saved and deleted buttons reach the wheel through config
+            # change events (see _on_config_events).
             self.settings_window = RadialInterfaceSettings()
-            # Re-render button widgets whenever a button is saved or deleted
-            # so the radial interface always reflects the latest config data.
-            self.settings_window.buttons_changed.connect(self._on_buttons_changed)
         self.settings_window.show()
         self.settings_window.raise_()
         self.settings_window.activateWindow()
 
+    def _on_config_events(self, events):
+        """
+        Apply one coalesced burst of config change events.
+
+        Input-mode changes only swap the control buttons and theme changes
+        restyle the existing widgets; a reload does both.  Edits that leave a button in place
+        (label, tooltip, payload) patch its widget directly; anything that
+        can move buttons reconciles the widgets once per burst, however many
+        buttons changed.
+
+        Args:
+            events: List of :class:`~config_events.ConfigEvent`.
+        """
+        config = PasteWheelConfig.shared()
+        patched = []
+        reconcile = False
+        for event in events:
+            # A sequential paste in progress must not keep pasting the old
+            # strings, whichever render mode shows the button.
+            if (event.kind == BUTTON_REMOVED
+                    or (event.kind == BUTTON_UPDATED
+                        and (event.fields is None or event.fields & self.SEQUENCE_FIELDS))):
+                PasteController.cancel_for(event.button_id)
+            if event.kind == INPUT_MODE_CHANGED:
+                self._sync_input_mode_buttons(event.value)
+            elif event.kind == THEME_CHANGED:
+                self._apply_theme()
+            elif (event.kind == BUTTON_UPDATED and event.fields is not None
+                    and event.fields <= self.IN_PLACE_FIELDS
+                    and (event.button_id in self.button_widget_map
+                         or event.button_id in self._record_map)):
+                patched.append(event.button_id)
+            elif event.kind == CONFIG_RELOADED:
+                # Reloads absorb earlier theme and input-mode events, so
+                # re-apply both along with the buttons.
+                self._apply_theme()
+                self._sync_input_mode_buttons(config.get_input_mode())
+                reconcile = True
+            elif event.kind in BUTTON_EVENTS:
+                reconcile = True
+
+        if reconcile:
+            self._on_buttons_changed()
+            return
+        for button_id in patched:
+            button_data = config.get_button(button_id)
+            if button_data is None:
+                continue
+            if self.render_mode == "painter":
+                self._record_map[button_id].update_data(button_data)
+                self._update_records(button_id)
+            else:
+                self.button_widget_map[button_id].update_data(button_data)
+
+    def _apply_theme(self):
+        """Re-read the theme colors and restyle the window and its buttons."""
+        self.colors = Theme().get_colors()
+        self._apply_window_background()
+        self._background = None
+        for widget in self.button_widgets:
+            widget.refresh_theme()
+        self.update()
+
     def _on_buttons_changed(self):
         """
-        Re-render all radial interface button widgets from the current config.
+        Reconcile the radial interface button widgets with the current config.
 
-        Called whenever the settings window saves or deletes a button so that
-        the on-screen widgets always reflect the latest ``pastewheel_config.json``
-        data (correct ``button_clipboard`` lists, labels, types, etc.).
+        Called for structural button change events so that the on-screen widgets always
+        reflect the latest ``pastewheel_config.json`` data (correct
+        ``button_clipboard`` lists, labels, types, etc.).
 
         Steps:
           1. Reload ``self.layer1/2/3`` from config.
-          2. Destroy all existing button widgets and create fresh ones.
+          2. Reconcile the button widgets with them (see
+             :meth:`_render_button_widgets`).
           3. Sync the "add first button" centre widget visibility.
         """
-        self._load_buttons_from_config()
-        self._render_button_widgets()
+        config = PasteWheelConfig.shared()
+        self.layer1[:] = config.get_buttons_by_layer(1) or []
+        self.layer2[:] = config.get_buttons_by_layer(2) or []
+        self.layer3[:] = config.get_buttons_by_layer(3) or []
+        self._validate_layers()
+        self._render_buttons()
 
-        config = PasteWheelConfig()
         if config.has_any_buttons():
             self.add_new_btns.hide()
         else:
             self.add_new_btns.show()
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
+    # ------------------------------------------------------------------
+    # Overlay popup
+    # ------------------------------------------------------------------
+
+    def _apply_window_background(self):
+        """
+        Style the window background.  The overlay's background is the disc
+        drawn by :meth:`_ring_background`; everything else stays see-through.
+        """
+        if self.overlay:
+            self.setStyleSheet("background-color: transparent;")
+        else:
+            background_color = self.colors.get("background", "#FFFFFF")
+            self.setStyleSheet(f"background-color: {background_color};")
+
+    def _overlay_shapes(self):
+        """
+        Return the rectangles of the overlay's opaque ellipses: the wheel
+        disc, then the corner control buttons.
+        """
+        radius = self.LAYER3_RADIUS + RadialInterfaceButtonWidget.BUTTON_SIZE // 2 + self.OVERLAY_MARGIN
+        center_x = self.width // 2
+        center_y = self.height // 2
+        shapes = [QRect(center_x - radius, center_y - radius, 2 * radius, 2 * radius)]
+        for button in (self.close_btn, self.keyboard_btn, self.settings_btn):
+            shapes.append(button.geometry())
+        return shapes
+
+    def _update_mask(self):
+        """
+        Restrict the overlay window to the wheel disc and control buttons,
+        so clicks elsewhere reach the windows underneath.  Rebuilt only when
+        the size or device pixel ratio changes.
+        """
+        key = (self.width, self.height, self.devicePixelRatioF())
+        if key == self._mask_key:
+            return
+        region = QRegion()
+        for rect in self._overlay_shapes():
+            region = region.united(QRegion(rect, QRegion.Ellipse))
+        self.setMask(region)
+        self._mask_key = key
+
+    def _ring_background(self):
+        """
+        Return the cached pixmap holding the three ring circles (and, for
+        the overlay, the opaque disc behind them).  Rebuilt when the size,
+        device pixel ratio or theme changes.
+        """
+        ratio = self.devicePixelRatioF()
+        key = (self.width, self.height, ratio)
+        if self._background is not None and key == self._background_key:
+            return self._background
+
+        pixmap = QPixmap(int(self.width * ratio), int(self.height * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
 
+        if self.overlay:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QBrush(QColor(self.colors.get("background", "#FFFFFF"))))
+            for rect in self._overlay_shapes():
+                painter.drawEllipse(rect)
+            painter.setBrush(Qt.NoBrush)
+
         pen_color_hex = self.colors.get("foreground", "#000000")
         pen_color = QColor(pen_color_hex)
         pen = QPen(pen_color)
@@ -441,4 +1183,73 @@ class RadialInterface(QWidget):
         painter.drawEllipse(int(center_x - 100), int(center_y - 100), 200, 200)
 
         # Circle 3: 300px diameter (150px radius)
-        painter.drawEllipse(int(center_x - 150), int(center_y - 150), 300, 300)
\ No newline at end of file
+        painter.drawEllipse(int(center_x - 150), int(center_y - 150), 300, 300)
+        painter.end()
+
+        self._background = pixmap
+        self._background_key = key
+        return pixmap
+
+    def _on_screen_changed(self, screen):
+        """Moved to another monitor: its DPI may differ, rebuild the caches."""
+        self._background = None
+        if self.overlay:
+            self._update_mask()
+        self.update()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._background = None
+        if self.overlay:
+            self._update_mask()
+
+    def keyPressEvent(self, event):
+        if self.overlay and event.key() == Qt.Key_Escape:
+            self.hide()
+            return
+        super().keyPressEvent(event)
+
+    def popup_at(self, global_pos):
+        """
+        Show the wheel centred on *global_pos* (screen coordinates) and
+        give it focus.  The window is kept inside the available geometry
+        of the monitor under *global_pos*.
+
+        Only moves and shows the already-built window: no layout pass and
+        no configuration read.  The time until the following paint is
+        stored in :attr:`last_show_to_paint_ms`.
+
+        Args:
+            global_pos: QPoint, typically ``QCursor.pos()``
+        """
+        x = global_pos.x() - self.width // 2
+        y = global_pos.y() - self.height // 2
+        available = self._screens.available_geometry(global_pos)
+        if available is not None:
+            x = max(available.left(), min(x, available.right() + 1 - self.width))
+            y = max(available.top(), min(y, available.bottom() + 1 - self.height))
+
+        self._show_started = time.perf_counter()
+        self.move(x, y)
+        self.show()
+        self.raise_()
+        self.activateWindow()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Rings (and the overlay disc) come from a cached pixmap
+        painter.drawPixmap(0, 0, self._ring_background())
+
+        # Painter render mode: the buttons themselves (only the dirty area)
+        if self.render_mode == "painter":
+            self._paint_records(painter, event.rect())
+
+        self._paint_marking(painter)
+        painter.end()
+
+        if self._show_started is not None:
+            self.last_show_to_paint_ms = (time.perf_counter() - self._show_started) * 1000
+            self._show_started = None
+        self.painted.emit()
\ No newline at end of file
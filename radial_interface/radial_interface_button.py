@@ -11,7 +11,7 @@ class RadialInterfaceButton:
             button_id: The ID of the button to load from configuration
         """
         # Initialize config manager
-        config = PasteWheelConfig()
+        config = PasteWheelConfig.shared()
         
         # Get button data from configuration
         button_data = config.get_button(button_id)
@@ -23,7 +23,7 @@ class RadialInterfaceButton:
         self.id = button_data.get("id")
         self.layer = button_data.get("layer")
         self.label = button_data.get("label")
-        self.clipboard = button_data.get("clipboard")
+        self.clipboard = config.get_button_clipboard(button_id)
         self.button_type = button_data.get("button_type")
         
         # Load theme colors
@@ -54,7 +54,7 @@ class RadialInterfaceButton:
         Returns:
             RadialInterfaceButton instance
         """
-        config = PasteWheelConfig()
+        config = PasteWheelConfig.shared()
         
         button_data = {
             "id": id,
@@ -71,7 +71,7 @@ class RadialInterfaceButton:
     
     def update(self):
         """Update this button's data in configuration."""
-        config = PasteWheelConfig()
+        config = PasteWheelConfig.shared()
         
         button_data = {
             "id": self.id,
@@ -85,5 +85,5 @@ class RadialInterfaceButton:
     
     def delete(self):
         """Delete this button from configuration."""
-        config = PasteWheelConfig()
+        config = PasteWheelConfig.shared()
         config.remove_button(self.id)
@@ -1,10 +1,31 @@
-import pyperclip
-
-from PyQt5.QtWidgets import QPushButton, QToolTip, QApplication
-from PyQt5.QtGui import QCursor, QFont
-from PyQt5.QtCore import Qt, QSize, QTimer, QPoint, pyqtSignal
+from PyQt5.QtWidgets import QPushButton, QToolTip
+from PyQt5.QtGui import QCursor, QFont, QPainter, QColor
+from PyQt5.QtCore import Qt, QSize, QTimer, QPoint, QRect, pyqtSignal
 from PyQt5.QtWidgets import QGraphicsOpacityEffect
 from theme import Theme
+from pastewheel_config import PasteWheelConfig
+from radial_interface.glyph_atlas import GlyphAtlas
+from radial_interface.paste_controller import PasteController
+
+
+def paint_badge(painter, rect, text, colors):
+    """
+    Draw a small position badge (e.g. "3/12") along the bottom of *rect*.
+
+    Shared by the button widget and the painter render mode.
+    """
+    font = QFont()
+    font.setPixelSize(9)
+    painter.save()
+    painter.setFont(font)
+    width = painter.fontMetrics().horizontalAdvance(text) + 6
+    badge = QRect(rect.center().x() - width // 2, rect.bottom() - 11, width, 11)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(QColor(colors.get("background", "#FFFFFF")))
+    painter.drawRoundedRect(badge, 4, 4)
+    painter.setPen(QColor(colors.get("text", "#000000")))
+    painter.drawText(badge, Qt.AlignCenter, text)
+    painter.restore()
 
 
 class RadialInterfaceButtonWidget(QPushButton):
@@ -13,17 +34,20 @@ class RadialInterfaceButtonWidget(QPushButton):
 
     **Clipboard buttons** (``button_type == "clip"``)
         - Rendered with a light-blue background (``#29B6F6``).
-        - On click: writes the button's clipboard payload to the Windows OS
-          clipboard via ``QApplication.clipboard().setText()``, then plays a
-          brief font-shrink animation (100 ms) for tactile feedback.
+        - On click: writes the button's clipboard payload to the OS
+          clipboard via ``paste_backends.clipboard().set_text()``, then
+          plays a brief label-shrink animation (100 ms) for tactile feedback.
         - Single-string buttons always write the same string.
-        - Two-string buttons operate in *sequential paste mode*: clicking the
-          button writes string 1 to the clipboard and registers a system-wide
-          Ctrl+V hook.  Each subsequent Ctrl+V press cycles through the strings
-          (string 1 → string 2 → string 1 → …) so the user can paste multiple
-          times from a single button click.  ``_seq_index`` tracks which string
-          will be written on the next Ctrl+V.  The hook is removed whenever any
-          button is clicked.
+        - Buttons with two or more strings operate in *sequential paste
+          mode*: clicking the button writes string 1 to the clipboard and
+          registers a system-wide Ctrl+V hook.  Each subsequent Ctrl+V press
+          pastes the next string, in the order given by the button's
+          ``sequence_mode`` (cycle, stop at the end, or ping-pong), so the
+          user can paste a whole runbook from a single button click.  The
+          sequence is run by
+          :class:`~radial_interface.paste_controller.PasteController`; the
+          hook is removed whenever any button is clicked.  While it runs,
+          the button shows the position of the next paste as a badge.
         - External clipboard operations (e.g. the user copying text from a
           document) freely overwrite PasteWheel's content — the clipboard is
           never locked or monitored.
@@ -38,19 +62,16 @@ class RadialInterfaceButtonWidget(QPushButton):
           changes so that :class:`RadialInterface` can react (Rule 4 / Rule 5).
     """
 
-    # ------------------------------------------------------------------
-    # Class-level sequential-paste hook tracking.
-    # Only one two-string button can be in sequential mode at a time.
-    # ------------------------------------------------------------------
-    _active_hook = None          # keyboard hotkey handle returned by kb.add_hotkey()
-    _active_seq_widget = None    # the RadialInterfaceButtonWidget that owns the hook
-
     BUTTON_SIZE = 36
 
     # Emitted when an expand-type button is toggled on or off.
     # Signature: (button_id: str, is_on: bool)
     expand_toggled = pyqtSignal(str, bool)
 
+    # Emitted when the cursor enters an expand-type button, so its children
+    # can be prepared before the click.  Signature: (button_id: str)
+    expand_hovered = pyqtSignal(str)
+
     def __init__(self, button_data: dict, parent=None):
         """
         Args:
@@ -60,10 +81,11 @@ class RadialInterfaceButtonWidget(QPushButton):
         """
         super().__init__(parent)
 
+        # The config dict this widget was last synced with (see update_data)
+        self.button_data = button_data
         self.button_id = button_data.get("id", "")
         self.button_layer = button_data.get("layer", 1)
         self.button_label = button_data.get("label", "")
-        self.button_clipboard = button_data.get("clipboard", [])
         self.button_type = button_data.get("button_type", "clip")
         self.tooltip_text = button_data.get("tooltip", "")
 
@@ -72,11 +94,6 @@ class RadialInterfaceButtonWidget(QPushButton):
         # False → button is OFF (children are hidden)
         self.is_toggled = False
 
-        # Sequential clipboard index — only meaningful for clipboard buttons
-        # with two strings.  Tracks which string will be written on the next
-        # Ctrl+V press (0 = string 1, 1 = string 2).  Reset to 0 on each click.
-        self._seq_index = 0
-
         # Get theme colors
         theme = Theme()
         self.colors = theme.get_colors()
@@ -90,9 +107,24 @@ class RadialInterfaceButtonWidget(QPushButton):
         self._click_timer.timeout.connect(self._restore_font_size)
 
         self._base_font_size = 16  # px, for emoji rendering
+        self._label_px = self._base_font_size  # current label size (shrinks on click)
+
+        # Sequence position badge text (e.g. "3/12"), or None
+        self.badge = None
 
         self._init_ui()
 
+    @property
+    def button_clipboard(self):
+        """
+        Clipboard strings of this button.
+
+        Payloads are not kept on the widget: large strings live in the blob
+        store (or the SQLite backend) and are read back on every access, so
+        call this once per click.
+        """
+        return PasteWheelConfig.shared().get_button_clipboard(self.button_id)
+
     # ------------------------------------------------------------------
     # Setup
     # ------------------------------------------------------------------
@@ -102,13 +134,10 @@ class RadialInterfaceButtonWidget(QPushButton):
         size = self.BUTTON_SIZE
         self.setFixedSize(size, size)
 
-        # Display the label (emoji or text) as button text
-        self.setText(self.button_label)
-
-        # Font sized to fill the button
-        font = QFont()
-        font.setPixelSize(self._base_font_size)
-        self.setFont(font)
+        # The label (emoji or text) is drawn from the shared GlyphAtlas in
+        # paintEvent rather than set as button text, so it is shaped once
+        # per process instead of on every repaint.
+        self.setAccessibleName(self.button_label)
 
         # Tooltip
         if self.tooltip_text:
@@ -180,11 +209,106 @@ class RadialInterfaceButtonWidget(QPushButton):
         self.is_toggled = state
         self._apply_style()
 
+    def update_data(self, button_data: dict):
+        """
+        Sync the widget with a new version of its button's config dict.
+
+        Only what changed is touched: the label text, the tooltip, and the
+        stylesheet when the button type changed.  The toggle state is kept
+        unless the button stopped being an expand button.
+
+        Args:
+            button_data: Updated dict for the same button id.
+        """
+        previous = self.button_data
+        self.button_data = button_data
+        if button_data is previous:
+            return
+        self.button_layer = button_data.get("layer", 1)
+
+        label = button_data.get("label", "")
+        if label != self.button_label:
+            self.button_label = label
+            self.setAccessibleName(label)
+            self.update()
+
+        tooltip = button_data.get("tooltip", "")
+        if tooltip != self.tooltip_text:
+            self.tooltip_text = tooltip
+            self.setToolTip(tooltip)
+
+        button_type = button_data.get("button_type", "clip")
+        if button_type != self.button_type:
+            self.button_type = button_type
+            if button_type != "exp":
+                self.is_toggled = False
+            self._apply_style()
+
+        # A sequential paste in progress must not keep pasting the old strings.
+        if (button_data.get("clipboard") != previous.get("clipboard")
+                or button_data.get("sequence_mode") != previous.get("sequence_mode")):
+            PasteController.cancel_for(self.button_id)
+
+    def rebind(self, button_data: dict):
+        """
+        Turn this widget into the widget of a different button.
+
+        Used by :class:`~radial_interface.button_widget_pool.ButtonWidgetPool`
+        to recycle widgets.  Toggle and hover state are reset; a running
+        sequence belongs to the button id, not the widget, and is kept.
+
+        Args:
+            button_data: Dict of the button to show.
+        """
+        self.button_data = button_data
+        self.button_id = button_data.get("id", "")
+        self.button_layer = button_data.get("layer", 1)
+        self.button_label = button_data.get("label", "")
+        self.button_type = button_data.get("button_type", "clip")
+        self.tooltip_text = button_data.get("tooltip", "")
+        self.is_toggled = False
+        self.colors = Theme().get_colors()
+
+        self.setAccessibleName(self.button_label)
+        self.setToolTip(self.tooltip_text)
+        self._click_timer.stop()
+        self._restore_font_size()
+        self._opacity_effect.setOpacity(1.0)
+        self.badge = None
+        self._apply_style()
+
+    def set_badge(self, text):
+        """Show *text* as the sequence position badge (None hides it)."""
+        if text != self.badge:
+            self.badge = text
+            self.update()
+
+    def refresh_theme(self):
+        """Re-read the theme colors and restyle the button."""
+        self.colors = Theme().get_colors()
+        self._apply_style()
+
     # ------------------------------------------------------------------
     # Events
     # ------------------------------------------------------------------
 
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.button_label or self.badge:
+            painter = QPainter(self)
+            painter.setRenderHint(QPainter.Antialiasing)
+            if self.button_label:
+                GlyphAtlas.shared().draw(
+                    painter, self.rect(), self.button_label, self._label_px,
+                    self.colors.get("text", "#000000"),
+                )
+            if self.badge:
+                paint_badge(painter, self.rect(), self.badge, self.colors)
+            painter.end()
+
     def enterEvent(self, event):
+        if self.button_type == "exp":
+            self.expand_hovered.emit(self.button_id)
         self._opacity_effect.setOpacity(0.75)
         self.setCursor(QCursor(Qt.PointingHandCursor))
         if self.tooltip_text:
@@ -205,7 +329,7 @@ class RadialInterfaceButtonWidget(QPushButton):
 
         * Expand buttons: toggle ON/OFF state and emit ``expand_toggled``.
         * Clipboard buttons: write clipboard data to the OS clipboard, then
-          play a brief font-shrink animation for tactile feedback.
+          play a brief label-shrink animation for tactile feedback.
         """
         if self.button_type == "exp":
             self.is_toggled = not self.is_toggled
@@ -214,111 +338,22 @@ class RadialInterfaceButtonWidget(QPushButton):
         else:
             # Write to the OS clipboard before the animation
             self._write_to_clipboard()
-            # Shrink font briefly for tactile feedback
-            shrunk_size = int(self._base_font_size * 0.75)
-            font = self.font()
-            font.setPixelSize(shrunk_size)
-            self.setFont(font)
+            # Shrink the label briefly for tactile feedback
+            self._label_px = int(self._base_font_size * 0.75)
+            self.update()
             self._click_timer.start(100)
 
     def _write_to_clipboard(self):
         """
-        Write the button's clipboard payload to the Windows clipboard and,
-        for two-string buttons, register a system-wide Ctrl+V hook that cycles
-        through the strings on each paste.
-
-        * 0 items  → no-op.
-        * 1 item   → always writes that single string (no hook needed).
-        * 2 items  → sequential paste mode:
-                       1. Remove any previously registered sequential hook.
-                       2. Reset ``_seq_index`` to 0.
-                       3. Write string 1 to the clipboard immediately so the
-                          very first Ctrl+V pastes string 1.
-                       4. Register a suppressing Ctrl+V hotkey via the
-                          ``keyboard`` library (imported lazily to avoid
-                          blocking on module load in headless environments).
-                          Each time the hotkey fires it calls
-                          ``_advance_seq_clipboard()`` (which writes the
-                          current string via pyperclip and advances the index)
-                          then simulates the actual paste via
-                          ``kb.press_and_release('ctrl+v')``.
-                     The hook is removed whenever any button is clicked (by the
-                     next call to ``_write_to_clipboard``).
-        """
-        # Always cancel any active sequential hook before doing anything else.
-        RadialInterfaceButtonWidget._remove_active_hook()
-
-        if not self.button_clipboard:
-            return
-
-        if len(self.button_clipboard) == 1:
-            QApplication.clipboard().setText(self.button_clipboard[0])
-        else:
-            # Sequential paste mode ----------------------------------------
-            # Reset sequence and write string 1 immediately.
-            self._seq_index = 0
-            QApplication.clipboard().setText(self.button_clipboard[0])
-
-            # Register the Ctrl+V hook.  The keyboard library is imported
-            # lazily here so that merely importing this module does not
-            # install a global hook (which would block in headless / test
-            # environments).  The handler runs in a background thread, so
-            # clipboard writes use pyperclip (thread-safe) rather than
-            # QApplication.clipboard().
-            try:
-                import keyboard as kb  # noqa: PLC0415
-                RadialInterfaceButtonWidget._active_seq_widget = self
-
-                def _seq_handler():
-                    widget = RadialInterfaceButtonWidget._active_seq_widget
-                    if widget is None:
-                        return
-                    widget._advance_seq_clipboard()
-                    kb.press_and_release("ctrl+v")
-
-                RadialInterfaceButtonWidget._active_hook = kb.add_hotkey(
-                    "ctrl+v", _seq_handler, suppress=True
-                )
-            except Exception:
-                # If keyboard hooks are unavailable (e.g. headless environment,
-                # insufficient privileges), sequential paste degrades gracefully:
-                # the clipboard already holds string 1 from the write above, and
-                # _advance_seq_clipboard() still works correctly when called
-                # directly (e.g. in unit tests).
-                pass
-
-    def _advance_seq_clipboard(self):
-        """
-        Write ``button_clipboard[_seq_index]`` to the clipboard and advance
-        the index (0 → 1 → 0 → …).
-
-        Uses ``pyperclip.copy()`` so it is safe to call from any thread
-        (including the ``keyboard`` library's background hook thread).
-
-        This method is also called directly in unit tests to simulate
-        sequential Ctrl+V presses without needing real key events.
-        """
-        if len(self.button_clipboard) < 2:
-            return
-        pyperclip.copy(self.button_clipboard[self._seq_index])
-        self._seq_index = 1 - self._seq_index
-
-    @classmethod
-    def _remove_active_hook(cls):
-        """
-        Remove the currently registered sequential Ctrl+V hook, if any.
-        Safe to call even when no hook is active.
+        Write the button's clipboard payload to the OS clipboard through
+        :meth:`PasteController.paste`, which also starts sequential paste
+        mode for sequences of two or more strings.
         """
-        if cls._active_hook is not None:
-            try:
-                import keyboard as kb  # noqa: PLC0415
-                kb.remove_hotkey(cls._active_hook)
-            except Exception:
-                pass
-            cls._active_hook = None
-            cls._active_seq_widget = None
+        PasteController.paste(
+            self.button_id, self.button_clipboard, mode=self.button_data.get("sequence_mode"),
+        )
 
     def _restore_font_size(self):
-        font = self.font()
-        font.setPixelSize(self._base_font_size)
-        self.setFont(font)
\ No newline at end of file
+        if self._label_px != self._base_font_size:
+            self._label_px = self._base_font_size
+            self.update()
\ No newline at end of file
@@ -0,0 +1,55 @@
+from PyQt5.QtGui import QGuiApplication
+
+
+class ScreenGeometryCache:
+    """
+    Per-monitor cache of available screen geometry.
+
+    Looking up the screen under the cursor and its work area goes through
+    the platform on every call; popping the wheel up only needs the answer
+    to change when a monitor is added, removed, resized or rescaled, so
+    the rectangles are kept here and dropped on those signals.
+    """
+
+    def __init__(self):
+        self._geometry = {}   # screen name → QRect (available geometry)
+        self._watched = set()
+        app = QGuiApplication.instance()
+        if app is not None:
+            app.screenAdded.connect(self._on_screen_added)
+            app.screenRemoved.connect(self._on_screen_removed)
+
+    def available_geometry(self, global_pos):
+        """
+        Return the available geometry (QRect) of the screen containing
+        *global_pos*, or of the primary screen if none does.  Returns None
+        when there is no screen at all.
+        """
+        screen = QGuiApplication.screenAt(global_pos) or QGuiApplication.primaryScreen()
+        if screen is None:
+            return None
+        name = screen.name()
+        geometry = self._geometry.get(name)
+        if geometry is None:
+            geometry = screen.availableGeometry()
+            self._geometry[name] = geometry
+            if name not in self._watched:
+                self._watched.add(name)
+                screen.availableGeometryChanged.connect(self._on_screens_changed)
+                screen.logicalDotsPerInchChanged.connect(self._on_screens_changed)
+        return geometry
+
+    def clear(self):
+        """Forget every cached rectangle."""
+        self._geometry.clear()
+
+    def _on_screens_changed(self, *args):
+        self.clear()
+
+    def _on_screen_added(self, screen):
+        self.clear()
+
+    def _on_screen_removed(self, screen):
+        # A later screen with the same name is a new object to connect to
+        self._watched.discard(screen.name())
+        self.clear()
@@ -0,0 +1,116 @@
+import math
+
+
+class WheelGeometry:
+    """
+    Polar geometry of the radial wheel.
+
+    Buttons of one group (the Layer-1 buttons, or the children of one
+    expand button) sit on a ring at equal angles: button *i* of *n* is at
+    ``360 / n * i`` degrees, measured from the positive x axis towards the
+    positive (downward) y axis, exactly as
+    :meth:`RadialInterface._calculate_button_position` places them.
+
+    Inverting that mapping turns a cursor position into (ring, sector)
+    with a constant amount of arithmetic, however many buttons exist.
+
+    Args:
+        center_x:    Wheel centre x in widget coordinates.
+        center_y:    Wheel centre y in widget coordinates.
+        ring_radii:  Radius of each ring, indexed by layer - 1.
+        button_size: Button diameter in pixels.
+    """
+
+    def __init__(self, center_x, center_y, ring_radii, button_size):
+        self.center_x = center_x
+        self.center_y = center_y
+        self.ring_radii = tuple(ring_radii)
+        self.button_size = button_size
+
+    def polar(self, x, y):
+        """
+        Return (radius, angle_degrees) of (x, y) around the wheel centre.
+        The angle is in [0, 360) with the same orientation as the layout.
+        """
+        dx = x - self.center_x
+        dy = y - self.center_y
+        return math.hypot(dx, dy), math.degrees(math.atan2(dy, dx)) % 360
+
+    def ring_at(self, radius):
+        """
+        Return the layer (1-based) whose ring passes within half a button
+        of *radius*, or None.
+        """
+        half = self.button_size / 2
+        for index, ring_radius in enumerate(self.ring_radii):
+            if abs(radius - ring_radius) <= half:
+                return index + 1
+        return None
+
+    @staticmethod
+    def sector_at(angle, count):
+        """
+        Return the index of the button whose angular slot contains *angle*.
+
+        Args:
+            angle: Angle in degrees (any range).
+            count: Number of buttons in the group (sibling count).
+
+        Returns:
+            Button index in [0, count), or None if count is 0
+        """
+        if count <= 0:
+            return None
+        step = 360 / count
+        return int(round((angle % 360) / step)) % count
+
+    def button_center(self, layer, index, count):
+        """Return the (x, y) centre of button *index* of *count* on *layer*."""
+        radius = self.ring_radii[layer - 1]
+        angle = math.radians(360 / count * index)
+        return (
+            self.center_x + radius * math.cos(angle),
+            self.center_y + radius * math.sin(angle),
+        )
+
+    def hit(self, x, y, counts, precise=True):
+        """
+        Map a position to the button under it.
+
+        Args:
+            x, y:    Position in widget coordinates.
+            counts:  Mapping of layer → number of visible buttons on that ring.
+            precise: If True, the position must lie on the button's disc;
+                     otherwise anywhere in its ring band and angular slot.
+
+        Returns:
+            Tuple of (layer, index), or None
+        """
+        radius, angle = self.polar(x, y)
+        layer = self.ring_at(radius)
+        if layer is None:
+            return None
+        count = counts.get(layer, 0)
+        index = self.sector_at(angle, count)
+        if index is None:
+            return None
+        if precise:
+            bx, by = self.button_center(layer, index, count)
+            if math.hypot(x - bx, y - by) > self.button_size / 2:
+                return None
+        return layer, index
+
+    @staticmethod
+    def flick_sector(dx, dy, count, min_distance):
+        """
+        Map a flick (a stroke of (dx, dy) pixels) to a sector.
+
+        Only the direction matters, so the user does not have to hit the
+        button.  Strokes shorter than *min_distance* select nothing.
+
+        Returns:
+            Button index in [0, count), or None
+        """
+        if math.hypot(dx, dy) < min_distance:
+            return None
+        return WheelGeometry.sector_at(math.degrees(math.atan2(dy, dx)), count)
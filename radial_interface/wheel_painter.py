@@ -0,0 +1,103 @@
+from PyQt5.QtGui import QColor, QPen, QBrush
+from PyQt5.QtCore import QRect
+
+from radial_interface.glyph_atlas import GlyphAtlas
+from radial_interface.radial_interface_button_widget import RadialInterfaceButtonWidget, paint_badge
+
+
+# Type-specific background / hover colors, matching
+# RadialInterfaceButtonWidget._apply_style (Material Design palette).
+TYPE_COLORS = {
+    "clip": ("#29B6F6", "#0288D1"),   # Light Blue 400 / 700
+    "exp": ("#FFA726", "#FB8C00"),    # Orange 400 / 600
+}
+
+# Opacity of a hovered button (the widget path's QGraphicsOpacityEffect)
+HOVER_OPACITY = 0.75
+
+
+class WheelButtonRecord:
+    """
+    Compact description of one button drawn by the painter render mode.
+
+    Holds only what painting and hit-testing need; the payload stays in
+    the configuration until the button is clicked.
+    """
+
+    __slots__ = (
+        "button_id", "layer", "parent_id", "label", "tooltip", "button_type",
+        "cx", "cy", "toggled", "badge",
+    )
+
+    # Same footprint as a RadialInterfaceButtonWidget
+    SIZE = RadialInterfaceButtonWidget.BUTTON_SIZE
+
+    def __init__(self, button_data, cx, cy, toggled=False):
+        self.button_id = button_data.get("id", "")
+        self.layer = button_data.get("layer", 1)
+        self.parent_id = button_data.get("parent_id")
+        self.cx = cx
+        self.cy = cy
+        self.toggled = toggled
+        self.badge = None   # sequence position text, e.g. "3/12"
+        self.update_data(button_data)
+
+    def update_data(self, button_data):
+        """Copy the displayed fields from a button dict."""
+        self.label = button_data.get("label", "")
+        self.tooltip = button_data.get("tooltip", "")
+        self.button_type = button_data.get("button_type", "clip")
+
+    def rect(self):
+        """Bounding rectangle, including the 2px toggled border."""
+        half = self.SIZE // 2
+        return QRect(int(self.cx) - half - 2, int(self.cy) - half - 2, self.SIZE + 4, self.SIZE + 4)
+
+    def contains(self, x, y):
+        """Return True if (x, y) lies on the button's disc."""
+        radius = self.SIZE / 2
+        dx = x - self.cx
+        dy = y - self.cy
+        return dx * dx + dy * dy <= radius * radius
+
+
+def paint_button(painter, record, colors, hovered=False, pressed=False, font_px=16):
+    """
+    Draw one wheel button the way RadialInterfaceButtonWidget looks.
+
+    Args:
+        painter: Active QPainter on the wheel.
+        record:  :class:`WheelButtonRecord` to draw.
+        colors:  Theme color dict.
+        hovered: Draw the hover color and opacity.
+        pressed: Draw the shrunk click-feedback label.
+        font_px: Label font pixel size.
+
+    The label is drawn from the shared :class:`GlyphAtlas`.
+    """
+    bg_color, hover_color = TYPE_COLORS.get(record.button_type, TYPE_COLORS["exp"])
+    if record.button_type == "exp" and record.toggled:
+        pen = QPen(QColor(colors.get("accent", "#007BFF")))
+        pen.setWidth(2)
+    else:
+        pen = QPen(QColor(colors.get("border", "#CCCCCC")))
+        pen.setWidth(1)
+
+    painter.save()
+    if hovered:
+        painter.setOpacity(HOVER_OPACITY)
+    painter.setPen(pen)
+    painter.setBrush(QBrush(QColor(hover_color if hovered else bg_color)))
+    size = record.SIZE
+    left = int(record.cx) - size // 2
+    top = int(record.cy) - size // 2
+    painter.drawEllipse(left, top, size, size)
+
+    if record.label:
+        GlyphAtlas.shared().draw(
+            painter, QRect(left, top, size, size), record.label,
+            int(font_px * 0.75) if pressed else font_px, colors.get("text", "#000000"),
+        )
+    if record.badge:
+        paint_badge(painter, QRect(left, top, size, size), record.badge, colors)
+    painter.restore()
@@ -0,0 +1,144 @@
+from array import array
+from collections.abc import Mapping
+
+from emoji_catalog_file import CATEGORY_IDS, MappedEmojiCatalog, category_index
+from pastewheel_config import PasteWheelConfig
+from radial_interface_button_settings.emoji_symbol_picker.emoji_search import EmojiSearchIndex
+
+
+class EmojiCatalog:
+    """
+    Read-only emoji table built once from the emoji data.
+
+    Everything the picker shows is computed here a single time: the
+    emojized glyph, the description (as given, and lowercased for search),
+    the category and a sort key.  Entries are stored in parallel arrays
+    grouped by category, so each category is one contiguous slice, and
+    sorted by colon code inside each category.  ``ranks[i]`` is entry *i*'s
+    position in the overall colon-code order, and ``order`` lists all
+    entries in that order (the order search results are shown in).
+
+    Models hold index sequences into the catalog (a ``range`` for a
+    category) instead of copies of the data.
+
+    Entries whose category is missing or unknown are stored after every
+    known category and only found by search.
+
+    When the emoji data is a :class:`~emoji_catalog_file.MappedEmojiCatalog`
+    (the binary catalog) its columns are used as they are: nothing is
+    decoded or emojized up front.
+
+    Attributes:
+        codes:              Colon codes, e.g. ":1st_place_medal:".
+        glyphs:             Emojized strings.
+        descriptions:       Descriptions as given (tooltips).
+        descriptions_lower: Lowercased descriptions (search).
+        categories:         array('B') of indexes into
+                            :data:`~emoji_catalog_file.CATEGORY_IDS`
+                            (:data:`~emoji_catalog_file.OTHER_CATEGORY`
+                            for unknown categories).
+        ranks:              array('I') of overall sort positions.
+        order:              array('I') of entry indexes in overall sort order.
+
+    With the binary catalog the columns are views into the file with the
+    same indexing.
+    """
+
+    _shared_instance = None
+    _fonts = {}
+
+    def __init__(self, emoji_data):
+        """
+        Args:
+            emoji_data: Mapping of colon code → {"description", "category"},
+                        or a MappedEmojiCatalog.
+        """
+        self._descriptions_lower = None
+        self._search_index = None
+
+        if isinstance(emoji_data, MappedEmojiCatalog):
+            self.codes = emoji_data.codes
+            self.glyphs = emoji_data.glyphs
+            self.descriptions = emoji_data.descriptions
+            self.categories = emoji_data.categories
+            self.order = emoji_data.order
+            self.ranks = emoji_data.ranks
+        else:
+            import emoji as emoji_lib  # noqa: PLC0415
+
+            items = sorted(
+                emoji_data.items(),
+                key=lambda item: (category_index(item[1].get("category")), item[0]),
+            )
+
+            self.codes = [code for code, _ in items]
+            self.glyphs = [emoji_lib.emojize(code, language='alias') for code in self.codes]
+            self.descriptions = [info.get("description", "") for _, info in items]
+            self.categories = array('B', (category_index(info.get("category")) for _, info in items))
+
+            self.order = array('I', sorted(range(len(self.codes)), key=self.codes.__getitem__))
+            self.ranks = array('I', bytes(4 * len(self.codes)))
+            for rank, index in enumerate(self.order):
+                self.ranks[index] = rank
+
+        # Entries are grouped by category, so each bucket ends after the
+        # last occurrence of its index.
+        categories = bytes(self.categories)
+        self._slices = {}
+        start = 0
+        for i, cat_id in enumerate(CATEGORY_IDS + ("other",)):
+            stop = max(start, categories.rfind(bytes((i,))) + 1)
+            self._slices[cat_id] = range(start, stop)
+            start = stop
+
+    @classmethod
+    def shared(cls):
+        """Return the process-wide catalog, building it on first use."""
+        if cls._shared_instance is None:
+            emoji_data = PasteWheelConfig.get_all_emojis()
+            if not isinstance(emoji_data, Mapping):
+                emoji_data = {}
+            cls._shared_instance = cls(emoji_data)
+        return cls._shared_instance
+
+    @classmethod
+    def font(cls, pixel_size):
+        """Return the shared glyph QFont of *pixel_size* (created on first use)."""
+        font = cls._fonts.get(pixel_size)
+        if font is None:
+            from PyQt5.QtGui import QFont  # noqa: PLC0415
+            font = QFont()
+            font.setPixelSize(pixel_size)
+            cls._fonts[pixel_size] = font
+        return font
+
+    def __len__(self):
+        return len(self.codes)
+
+    @property
+    def descriptions_lower(self):
+        """Lowercased descriptions (built on first use)."""
+        if self._descriptions_lower is None:
+            self._descriptions_lower = [description.lower() for description in self.descriptions]
+        return self._descriptions_lower
+
+    def category_slice(self, category_id):
+        """
+        Return the entry indexes of *category_id* as a ``range``
+        (empty for unknown ids).
+        """
+        return self._slices.get(category_id, range(0))
+
+    def search_index(self):
+        """Return the catalog's EmojiSearchIndex, building it on first use."""
+        if self._search_index is None:
+            self._search_index = EmojiSearchIndex(self)
+        return self._search_index
+
+    def search(self, text):
+        """
+        Return the indexes of entries whose shortcode or description
+        contains *text* (case-insensitive), best matches first (see
+        EmojiSearchIndex).
+        """
+        return self.search_index().search(text)
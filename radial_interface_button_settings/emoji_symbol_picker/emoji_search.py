@@ -0,0 +1,156 @@
+import re
+from array import array
+
+# Runs of anything but letters and digits separate words, in entry texts
+# and in queries alike (":thumbs_up:" → "thumbs up").
+_SEPARATORS = re.compile(r"[\W_]+")
+
+# Number of recent queries whose matches are kept for narrowing
+HISTORY_SIZE = 32
+
+
+def normalize(text):
+    """Lowercase *text* and reduce it to single-space separated words."""
+    return _SEPARATORS.sub(" ", text.lower()).strip()
+
+
+def _aliases(catalog):
+    """
+    Yield ``(index, alias codes)`` for the catalog entries that have
+    aliases in the ``emoji`` package (nothing if it is not installed).
+    """
+    try:
+        import emoji as emoji_lib  # noqa: PLC0415
+    except ImportError:
+        return
+    emoji_data = emoji_lib.EMOJI_DATA
+    for index in catalog.order:
+        aliases = emoji_data.get(catalog.glyphs[index], {}).get("alias")
+        if aliases:
+            yield index, aliases
+
+
+class EmojiSearchIndex:
+    """
+    Ranked substring search over an EmojiCatalog's shortcodes and
+    descriptions.
+
+    Each entry's searchable text is its shortcode words followed by its
+    description words, normalized and prefixed with a space, so a word
+    prefix match is a substring match of " " + term.  An inverted index
+    maps every substring of up to three characters (1- to 3-grams) of the
+    texts to the entries containing it, in overall sort order.
+
+    A query is split into terms; an entry matches when it contains every
+    term.  The candidates are the shortest posting list of the terms'
+    trigrams (or of a term itself, if it is shorter; or, when the query
+    extends an earlier one, that query's matches), and only those are
+    checked: against posting sets for needles of up to three characters,
+    by substring search in the texts otherwise.  Results are ranked
+
+    1. exact shortcode, primary or alias (":thumbs_up:" for "thumbs up",
+       ":+1:" for "+1" or ":+1:"),
+    2. every term is the start of a word,
+    3. other substring matches,
+
+    and by sort order inside each rank.
+
+    Args:
+        catalog: EmojiCatalog to index.
+    """
+
+    def __init__(self, catalog):
+        self._order = catalog.order
+        self._texts = [None] * len(catalog)
+        self._shortcodes = {}
+        postings = {}
+        for index in catalog.order:
+            code = normalize(catalog.codes[index])
+            self._add_shortcode(catalog.codes[index], index)
+            text = f" {code} {normalize(catalog.descriptions_lower[index])}"
+            self._texts[index] = text
+            grams = {text[i:i + n] for n in (1, 2, 3) for i in range(len(text) - n + 1)}
+            for gram in grams:
+                postings.setdefault(gram, []).append(index)
+        self._postings = {gram: array('I', entries) for gram, entries in postings.items()}
+        self._history = {}
+
+        # Aliases rank after every primary code of the same spelling
+        for index, aliases in _aliases(catalog):
+            for alias in aliases:
+                self._add_shortcode(alias, index)
+
+    def _add_shortcode(self, code, index):
+        """
+        Map *code* to entry *index*, both as written (lowercased, without
+        colons, so "+1" keeps its sign) and normalized, unless taken.
+        """
+        raw = code.lower().strip(":")
+        self._shortcodes.setdefault(raw, index)
+        self._shortcodes.setdefault(normalize(raw), index)
+
+    def search(self, text):
+        """
+        Return the indexes of entries matching *text*, best first.
+
+        Args:
+            text: Query; words may be separated by spaces or punctuation.
+
+        Returns:
+            List of catalog entry indexes (empty for a blank query)
+        """
+        query = normalize(text)
+        if not query:
+            return []
+        matches = self._matches(query)
+
+        prefixed = matches
+        for term in query.split(" "):
+            prefixed = self._filter(prefixed, " " + term)
+        exact = self._shortcodes.get(text.strip().lower().strip(":"))
+        if exact is None:
+            exact = self._shortcodes.get(query)
+        if exact is not None:
+            prefixed = [exact] + [index for index in prefixed if index != exact]
+        if len(prefixed) == len(matches):
+            return list(prefixed)
+        ranked = set(prefixed)
+        return prefixed + [index for index in matches if index not in ranked]
+
+    def _matches(self, query):
+        """Return the entries containing every term of *query*, in sort order."""
+        matches = self._history.get(query)
+        if matches is not None:
+            return matches
+
+        terms = query.split(" ")
+        candidates = self._order
+        for previous, previous_matches in self._history.items():
+            # Every match of a longer query is a match of its prefix
+            if query.startswith(previous) and len(previous_matches) < len(candidates):
+                candidates = previous_matches
+        for term in terms:
+            for i in range(max(len(term) - 2, 1)):
+                posting = self._postings.get(term[i:i + 3], ())
+                if len(posting) < len(candidates):
+                    candidates = posting
+
+        matches = candidates
+        for term in terms:
+            matches = self._filter(matches, term)
+        matches = list(matches)
+        if len(self._history) >= HISTORY_SIZE:
+            del self._history[next(iter(self._history))]
+        self._history[query] = matches
+        return matches
+
+    def _filter(self, entries, needle):
+        """Return the *entries* whose text contains *needle*, keeping their order."""
+        if len(needle) <= 3:
+            posting = self._postings.get(needle, ())
+            if posting is entries:
+                return entries
+            contained = set(posting)
+            return [index for index in entries if index in contained]
+        texts = self._texts
+        return [index for index in entries if needle in texts[index]]
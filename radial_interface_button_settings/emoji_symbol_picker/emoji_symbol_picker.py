@@ -1,71 +1,174 @@
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-                             QScrollArea, QTableView, QAbstractItemView, QLineEdit)
-from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
-from PyQt5.QtGui import QColor, QFont
-import emoji as emoji_lib  # type: ignore
+import bisect
+
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QTableView,
+                             QAbstractItemView, QHeaderView, QLineEdit, QStyle, QStyledItemDelegate)
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QSize, QTimer, pyqtSignal
+from PyQt5.QtGui import QColor
 
 # Local imports (assuming they are in the correct path)
 from theme import Theme
 from radial_interface_button_settings.emoji_symbol_picker.esp_label import EspLabel
 from radial_interface_button_settings.emoji_symbol_picker.esp_btn import EspBtn
-from pastewheel_config import PasteWheelConfig
+from radial_interface.glyph_atlas import GlyphAtlas
+from radial_interface_button_settings.emoji_symbol_picker.emoji_catalog import EmojiCatalog
 
 
 # Constants
 EMOJI_CELL_WIDTH = 80       # Width of each emoji cell in pixels
 EMOJI_CELL_HEIGHT = 48      # Height of each emoji cell in pixels
 EMOJI_FONT_SIZE = 30        # Font size for emoji display in pixels
-EMOJI_CELL_PADDING = 0      # Padding inside each emoji cell in pixels
 EMOJI_TABLE_PADDING = 8     # Padding around the entire table in pixels
 EMOJI_COLUMN_COUNT = 4      # Number of columns in the emoji grid
+SEARCH_DEBOUNCE_MS = 120    # Typing pause before the search runs in milliseconds
 
 # Data Model Class
-class EmojiTableModel(QAbstractTableModel):
+class EmojiGridModel(QAbstractTableModel):
     """
-    Table model for displaying emoji data in a grid.
-    Optimized to display emojis in a multi-column grid.
+    Table model for the single emoji grid.
+
+    Lays out *sections* — a title and a sequence of catalog entry indexes
+    each — as one header row followed by rows of EMOJI_COLUMN_COUNT emojis.
+    Filtering by category or search replaces the sections; the model only
+    holds index sequences into the shared EmojiCatalog (a ``range`` for a
+    category), so resetting it costs the number of sections, not emojis.
     """
+
+    # True for the cells of a section header row
+    HeaderRole = Qt.UserRole + 1
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.emoji_list = []
+        self.catalog = EmojiCatalog.shared()
+        self._sections = []
+        self._header_rows = []   # row of each section's header, ascending
         self._row_count = 0
 
-    def set_emoji_data(self, emoji_data: dict):
-        """Sets the emoji data for the model and updates the layout."""
+    def set_sections(self, sections):
+        """
+        Sets the sections shown by the model and updates the layout.
+
+        Args:
+            sections: List of (title, entry indexes) tuples.
+        """
         self.beginResetModel()
-        self.emoji_list = sorted(emoji_data.items(), key=lambda item: item[0])
-        self._row_count = (len(self.emoji_list) + EMOJI_COLUMN_COUNT - 1) // EMOJI_COLUMN_COUNT
+        self._sections = list(sections)
+        self._header_rows = []
+        row = 0
+        for _, entries in self._sections:
+            self._header_rows.append(row)
+            row += 1 + (len(entries) + EMOJI_COLUMN_COUNT - 1) // EMOJI_COLUMN_COUNT
+        self._row_count = row
         self.endResetModel()
 
+    def header_rows(self):
+        """Returns the rows holding section headers."""
+        return list(self._header_rows)
+
+    def section_title(self, row):
+        """Returns the title of the section *row* belongs to, or None."""
+        section = bisect.bisect_right(self._header_rows, row) - 1
+        if section < 0 or row >= self._row_count:
+            return None
+        return self._sections[section][0]
+
+    def entry_at(self, index):
+        """Returns the catalog entry shown at *index*, or None for headers and empty cells."""
+        if not index.isValid():
+            return None
+        row = index.row()
+        section = bisect.bisect_right(self._header_rows, row) - 1
+        if section < 0:
+            return None
+        offset = row - self._header_rows[section]
+        if offset == 0:
+            return None
+        entries = self._sections[section][1]
+        position = (offset - 1) * EMOJI_COLUMN_COUNT + index.column()
+        return entries[position] if position < len(entries) else None
+
+    def glyph_at(self, index):
+        """Returns the emojized glyph shown at *index*, or None."""
+        entry = self.entry_at(index)
+        return None if entry is None else self.catalog.glyphs[entry]
+
     def rowCount(self, parent=QModelIndex()):
         return self._row_count
 
     def columnCount(self, parent=QModelIndex()):
         return EMOJI_COLUMN_COUNT
 
+    def flags(self, index):
+        if self.entry_at(index) is None:
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
     def data(self, index, role=Qt.DisplayRole):
         if not index.isValid():
             return None
 
-        emoji_index = (index.row() * EMOJI_COLUMN_COUNT) + index.column()
-        if emoji_index >= len(self.emoji_list):
+        if index.row() in self._header_rows:
+            if role == self.HeaderRole:
+                return True
+            if role == Qt.DisplayRole and index.column() == 0:
+                return f"----- {self.section_title(index.row())} -----"
             return None
 
-        code, info = self.emoji_list[emoji_index]
+        entry = self.entry_at(index)
+        if entry is None:
+            return None
 
         if role == Qt.DisplayRole:
-            return emoji_lib.emojize(code, language='alias')
+            return self.catalog.glyphs[entry]
         if role == Qt.ToolTipRole:
-            return info.get("description", "")
+            return self.catalog.descriptions[entry]
         if role == Qt.TextAlignmentRole:
             return Qt.AlignCenter
         if role == Qt.FontRole:
-            font = QFont()
-            font.setPixelSize(EMOJI_FONT_SIZE)
-            return font
-            
+            return EmojiCatalog.font(EMOJI_FONT_SIZE)
+
         return None
 
+
+class EmojiGridDelegate(QStyledItemDelegate):
+    """
+    Paints the emoji grid: section headers across the row, and emoji
+    cells with theme hover and selection backgrounds.  Glyphs are blitted
+    from the shared GlyphAtlas instead of being shaped on every paint.
+    """
+
+    def __init__(self, colors, parent=None):
+        super().__init__(parent)
+        self.header_background = QColor(colors.get("section_background", "#F8F9FA"))
+        self.header_text = QColor(colors.get("text", "#000000"))
+        self.text = QColor(colors.get("table_text", "#000000"))
+        self.selection_background = QColor(colors.get("table_selection_background", "#007BFF"))
+        self.selection_text = QColor(colors.get("table_selection_text", "#FFFFFF"))
+        self.hover_background = QColor(colors.get("table_hover_background", "#E8F4F8"))
+
+    def paint(self, painter, option, index):
+        model = index.model()
+        painter.save()
+        if model.data(index, EmojiGridModel.HeaderRole):
+            painter.fillRect(option.rect, self.header_background)
+            painter.setPen(self.header_text)
+            painter.drawText(option.rect, Qt.AlignCenter, model.data(index, Qt.DisplayRole) or "")
+        else:
+            glyph = model.data(index, Qt.DisplayRole)
+            if glyph is not None:
+                selected = bool(option.state & QStyle.State_Selected)
+                if selected:
+                    painter.fillRect(option.rect, self.selection_background)
+                elif option.state & QStyle.State_MouseOver:
+                    painter.fillRect(option.rect, self.hover_background)
+                GlyphAtlas.shared().draw(
+                    painter, option.rect, glyph, EMOJI_FONT_SIZE,
+                    self.selection_text if selected else self.text,
+                )
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        return QSize(EMOJI_CELL_WIDTH, EMOJI_CELL_HEIGHT)
+
 # Main Widget Class
 class EmojiSymbolPicker(QWidget):
     """
@@ -73,8 +176,13 @@ class EmojiSymbolPicker(QWidget):
     """
     class _EmojiSymbolSelection(QWidget):
         """
-        A scrollable widget for displaying categorized emoji results.
-        Manages global selection state across all its internal table views.
+        A single virtualized grid of categorized emoji results.
+
+        One QTableView shows every category (or the search results) as
+        header rows followed by emoji rows.  Rows have a fixed height, so
+        the view lays out and paints only the rows in the viewport; a
+        sticky label at the top names the section being scrolled through.
+        There is one selection model for the whole grid.
         """
         CATEGORIES = {
             "smiley": "Smileys", "nature": "Nature", "food": "Food/Drink",
@@ -87,20 +195,10 @@ class EmojiSymbolPicker(QWidget):
             self.picker_instance = picker_instance  # Store reference to EmojiSymbolPicker
             self.theme = Theme()
             self.colors = self.theme.get_colors()
-            
-            self.all_table_views = []
-            self.category_widgets = {} # Stores {'label': QLabel, 'model': QTableModel, 'table': QTableView}
-
-            # --- Search-specific components ---
-            self.search_model = EmojiTableModel()
-            self.search_results_label = EspLabel("----- Search Results -----", display_alignment="center", bordered=False)
-            self.search_table_view = self._create_table_view(self.search_model)
-            
-            # --- Container for categories ---
-            self.categories_container = QWidget()
-            self.categories_layout = QVBoxLayout(self.categories_container)
-            self.categories_layout.setSpacing(10)
-            self.categories_layout.setContentsMargins(0,0,0,0)
+
+            self.model = EmojiGridModel()
+            self.table_view = self._create_table_view(self.model)
+            self.sticky_header = self._create_sticky_header()
 
             self._fully_populated = False
             self._init_ui()  # Init UI first
@@ -112,158 +210,82 @@ class EmojiSymbolPicker(QWidget):
             self._populate_models_if_needed()
 
         def _populate_models_if_needed(self):
-            """Populates models with emoji data only if they haven't been already."""
+            """Populates the grid with emoji data only if it hasn't been already."""
             if self._fully_populated:
                 return
 
-            self._populate_models()
-            self.show_categories() # Show all categories by default after populating.
+            self.show_categories() # Show all categories by default.
             self._fully_populated = True
+            # Build the search index once the picker is on screen, not on the first keystroke
+            QTimer.singleShot(0, EmojiCatalog.shared().search_index)
 
         def filter_by_search(self, search_text: str):
-            """Filters the view to show only emojis matching the search text."""
+            """Filters the view to show only emojis matching the search text, best matches first."""
             if not search_text:
                 # If search is cleared, show the categories again
                 self.show_categories()
                 return
 
-            all_emojis = PasteWheelConfig.get_all_emojis()
-            
-            # Filter based on description (case-insensitive)
-            filtered_data = {
-                code: info for code, info in all_emojis.items()
-                if search_text.lower() in info.get("description", "").lower()
-            }
-            
-            self.search_model.set_emoji_data(filtered_data)
-            
-            # Hide categories and show search results
-            self.categories_container.hide()
-            self.search_results_label.show()
-            self.search_table_view.show()
-            
-            # Adjust height of search table
-            new_height = self.search_model.rowCount() * EMOJI_CELL_HEIGHT + EMOJI_TABLE_PADDING
-            self.search_table_view.setFixedHeight(new_height)
+            # Filter based on shortcode and description (case-insensitive)
+            self._show_sections([("Search Results", EmojiCatalog.shared().search(search_text))])
 
         def show_categories(self, category_id_to_show: str = None):
-            """Shows all or a specific category, and hides the search results."""
-            # Hide search results first
-            self.search_results_label.hide()
-            self.search_table_view.hide()
-            
-            # Show the category container
-            self.categories_container.show()
-            
-            # Update visibility of individual categories within the container
-            self.update_category_visibility(category_id_to_show)
-
-        def update_category_visibility(self, visible_category_id: str = None):
-            """Shows one or all categories within the categories container."""
-            for cat_id, widgets in self.category_widgets.items():
-                is_visible = (visible_category_id is None) or (cat_id == visible_category_id)
-                widgets['label'].setVisible(is_visible)
-                widgets['table'].setVisible(is_visible)
+            """Shows all categories, or only *category_id_to_show*."""
+            catalog = EmojiCatalog.shared()
+            sections = []
+            for cat_id, cat_name in self.CATEGORIES.items():
+                if category_id_to_show is None or cat_id == category_id_to_show:
+                    entries = catalog.category_slice(cat_id)
+                    if entries or category_id_to_show is not None:
+                        sections.append((cat_name, entries))
+            self._show_sections(sections)
+
+        def _show_sections(self, sections):
+            """Replaces the grid's sections and scrolls back to the top."""
+            self.model.set_sections(sections)
+            self.table_view.clearSpans()
+            for row in self.model.header_rows():
+                self.table_view.setSpan(row, 0, 1, EMOJI_COLUMN_COUNT)
+            self.table_view.scrollToTop()
+            self._update_sticky_header()
 
         def _init_ui(self):
-            scroll_area = QScrollArea()
-            scroll_area.setWidgetResizable(True)
-            scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-            scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-
-            content_widget = QWidget()
-            content_layout = QVBoxLayout(content_widget)
-            content_layout.setSpacing(10)
-
-            # Add the category container to the layout
-            content_layout.addWidget(self.categories_container)
-            
-            # This is now handled in _populate_models, which is called later.
-
-            # Add search results components to the main layout, but hide them initially
-            content_layout.addWidget(self.search_results_label)
-            content_layout.addWidget(self.search_table_view)
-            self.search_results_label.hide()
-            self.search_table_view.hide()
-
-            scroll_area.setWidget(content_widget)
-
             main_layout = QVBoxLayout(self)
             main_layout.setContentsMargins(0, 0, 0, 0)
-            main_layout.addWidget(scroll_area)
-
-        def _populate_models(self):
-            """Populates the models and creates the necessary widgets."""
-            all_emojis = PasteWheelConfig.get_all_emojis()
-            if not isinstance(all_emojis, dict):
-                all_emojis = {}
-
-            categorized_data = {cat_id: {} for cat_id in self.CATEGORIES}
-            for code, info in all_emojis.items():
-                category = (info.get("category") or "").strip().lower()
-                if category in categorized_data:
-                    categorized_data[category][code] = info
-
-            for cat_id, cat_name in self.CATEGORIES.items():
-                header_label = EspLabel(f"----- {cat_name} -----", display_alignment="center", bordered=False)
-                model = EmojiTableModel()
-                model.set_emoji_data(categorized_data.get(cat_id, {}))
-                
-                table_view = self._create_table_view(model)
-                self.all_table_views.append(table_view)
-
-                # Store all widgets for this category
-                self.category_widgets[cat_id] = {'label': header_label, 'model': model, 'table': table_view}
+            main_layout.addWidget(self.table_view, 0, Qt.AlignHCenter)
 
-                # Add them to the layout
-                self.categories_layout.addWidget(header_label)
-                self.categories_layout.addWidget(table_view)
-
-                # Initially hide them
-                header_label.hide()
-                table_view.hide()
-
-        def _create_table_view(self, model: EmojiTableModel) -> QTableView:
+        def _create_table_view(self, model: EmojiGridModel) -> QTableView:
             table_view = QTableView()
             table_view.setModel(model)
+            table_view.setItemDelegate(EmojiGridDelegate(self.colors, table_view))
 
             # --- Configuration ---
-            table_view.setGridStyle(Qt.DotLine)
+            table_view.setShowGrid(False)
             table_view.setSelectionMode(QAbstractItemView.SingleSelection)
             table_view.setSelectionBehavior(QAbstractItemView.SelectItems)
             table_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
             table_view.setAlternatingRowColors(False)
+            table_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
             table_view.verticalHeader().setVisible(False)
             table_view.horizontalHeader().setVisible(False)
             table_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-            
+            table_view.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+            table_view.setMouseTracking(True)
+            table_view.viewport().setAttribute(Qt.WA_Hover)
+
             # --- Sizing ---
+            # Fixed row heights let the view skip measuring rows outside the viewport
+            table_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
             table_view.verticalHeader().setDefaultSectionSize(EMOJI_CELL_HEIGHT)
+            table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Fixed)
             table_view.horizontalHeader().setDefaultSectionSize(EMOJI_CELL_WIDTH)
-            total_width = EMOJI_COLUMN_COUNT * EMOJI_CELL_WIDTH + EMOJI_TABLE_PADDING
-            total_height = model.rowCount() * EMOJI_CELL_HEIGHT + EMOJI_TABLE_PADDING
-            table_view.setFixedSize(total_width, total_height)
-            
-            # --- Event Handling for Global Selection ---
-            def custom_mouse_press_event(event):
-                index = table_view.indexAt(event.pos())
-                if index.isValid():
-                    self._clear_all_selections()
-                    table_view.selectionModel().select(index, table_view.selectionModel().Select)
-
-                    # Emit signal with selected emoji
-                    emoji_index = (index.row() * EMOJI_COLUMN_COUNT) + index.column()
-                    if emoji_index < len(model.emoji_list):
-                        code, info = model.emoji_list[emoji_index]
-                        emoji_symbol = emoji_lib.emojize(code, language='alias')
-                        # Emit the signal from the picker instance
-                        self.picker_instance.emoji_selected.emit(emoji_symbol)
-
-                    event.accept()
-                else:
-                    # Call original method if not handled
-                    super(QTableView, table_view).mousePressEvent(event)
-            table_view.mousePressEvent = custom_mouse_press_event
+            total_width = (EMOJI_COLUMN_COUNT * EMOJI_CELL_WIDTH + EMOJI_TABLE_PADDING
+                           + table_view.verticalScrollBar().sizeHint().width())
+            table_view.setFixedWidth(total_width)
+
+            # --- Selection ---
+            table_view.pressed.connect(self._on_cell_pressed)
+            table_view.verticalScrollBar().valueChanged.connect(self._update_sticky_header)
 
             # --- Styling ---
             table_style = f"""
@@ -271,21 +293,55 @@ class EmojiSymbolPicker(QWidget):
                     background-color: {self.colors.get("table_background", "#FFFFFF")};
                     border: 1px solid {self.colors.get("table_border", "#E0E0E0")};
                     border-radius: 4px;
-                    gridline-color: {self.colors.get("table_gridline", "#F0F0F0")};
                     color: {self.colors.get("table_text", "#000000")};
-                    selection-background-color: {self.colors.get("table_selection_background", "#007BFF")};
-                    selection-color: {self.colors.get("table_selection_text", "#FFFFFF")};
                 }}
-                QTableView::item {{ padding: {EMOJI_CELL_PADDING}px; }}
-                QTableView::item:hover {{ background-color: {self.colors.get("table_hover_background", "#E8F4F8")}; }}
             """
             table_view.setStyleSheet(table_style)
             return table_view
 
+        def _create_sticky_header(self) -> QLabel:
+            """Creates the label pinned over the top row of the grid."""
+            label = QLabel(self.table_view)
+            label.setAlignment(Qt.AlignCenter)
+            label.setAttribute(Qt.WA_TransparentForMouseEvents)
+            label.setStyleSheet(f"""
+                QLabel {{
+                    background-color: {self.colors.get("section_background", "#F8F9FA")};
+                    color: {self.colors.get("text", "#000000")};
+                    border: none;
+                    border-radius: 0px;
+                }}
+            """)
+            label.hide()
+            return label
+
+        def _update_sticky_header(self, *_):
+            """Shows the title of the section at the top of the viewport, unless its header row is there."""
+            view = self.table_view
+            row = view.rowAt(0)
+            title = self.model.section_title(row) if row >= 0 else None
+            if title is None or (row in self.model.header_rows() and view.rowViewportPosition(row) == 0):
+                self.sticky_header.hide()
+                return
+            viewport = view.viewport().geometry()
+            self.sticky_header.setGeometry(viewport.x(), viewport.y(), viewport.width(), EMOJI_CELL_HEIGHT)
+            self.sticky_header.setText(f"----- {title} -----")
+            self.sticky_header.show()
+            self.sticky_header.raise_()
+
+        def _on_cell_pressed(self, index):
+            """Emits the pressed emoji from the picker instance."""
+            emoji_symbol = self.model.glyph_at(index)
+            if emoji_symbol is not None:
+                self.picker_instance.emoji_selected.emit(emoji_symbol)
+
+        def resizeEvent(self, event):
+            super().resizeEvent(event)
+            self._update_sticky_header()
+
         def _clear_all_selections(self):
-            """Clear selections in all managed table views."""
-            for table_view in self.all_table_views:
-                table_view.selectionModel().clear()
+            """Clear the grid's selection."""
+            self.table_view.selectionModel().clear()
 
         def _apply_styling(self):
             background_color = self.colors.get("section_background", "#F8F9FA")
@@ -346,6 +402,12 @@ class EmojiSymbolPicker(QWidget):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Enter keyword...")
         self.search_input.textChanged.connect(self._on_search_text_changed)
+
+        # Searches run once typing pauses
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._run_search)
         
         search_layout.addWidget(self.search_prompt_label)
         search_layout.addWidget(self.search_input)
@@ -417,8 +479,15 @@ class EmojiSymbolPicker(QWidget):
             for button in self.category_buttons.values():
                 if button.isChecked():
                     button.setChecked(False)
-        
-        self.emoji_selection_area.filter_by_search(text)
+            self._search_timer.start()
+        else:
+            # Clearing the search shows the categories right away
+            self._search_timer.stop()
+            self.emoji_selection_area.filter_by_search(text)
+
+    def _run_search(self):
+        """Runs the debounced search for the current search text."""
+        self.emoji_selection_area.filter_by_search(self.search_input.text())
 
     def clear_selection(self):
         """Clear the emoji selection in all table views."""
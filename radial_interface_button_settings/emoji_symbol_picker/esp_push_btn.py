@@ -120,7 +120,7 @@ class EspPushBtn(QPushButton):
 
             # Import here to avoid circular dependencies
             from pastewheel_config import PasteWheelConfig
-            config = PasteWheelConfig()
+            config = PasteWheelConfig.shared()
 
             # If we have an emoji code and parent selection reference, implement exclusive checking
             if hasattr(self, 'emoji_code') and self.parent_selection is not None:
@@ -10,7 +10,7 @@ from radial_interface_button_settings.ribs_button import RibsButton
 from radial_interface_button_settings.ribs_label import RibsLabel
 from radial_interface_button_settings.ribs_checkbox import RibsCheckbox
 from radial_interface_button_settings.ribs_radio_btn import RibsRadioBtn
-from radial_interface_button_settings.ribs_clipboard_editor import RibsClipboardEditor
+from radial_interface_button_settings.ribs_sequence_editor import RibsSequenceEditor, ROW_HEIGHT
 from radial_interface_button_settings.ribs_tooltip_editor import RibsTooltipEditor
 from radial_interface_button_settings.emoji_symbol_picker.emoji_symbol_picker import EmojiSymbolPicker
 
@@ -109,7 +109,6 @@ class RadialInterfaceButtonSettings(QWidget):
 
         # Create clipboard section at the top
         self.clipboard_section = QWidget(self)
-        self.clipboard_section.setFixedHeight(140)  # Increased height to accommodate all new widgets
         section_bg = self.colors.get("section_background", "#F0F0F0")
         self.clipboard_section.setStyleSheet(f"""
             QWidget {{
@@ -122,24 +121,13 @@ class RadialInterfaceButtonSettings(QWidget):
         self.clipboard_label = RibsLabel("Clipboard Features", "display", self.clipboard_section)
         self.clipboard_label.setAlignment(Qt.AlignCenter)  # Center the text
 
-        # Create additional widgets for clipboard section
-        self.add_seq_1_clipboard = RibsLabel("Add clipboard data:", "display", self.clipboard_section)
-        self.edit_seq_1_clipboard = RibsButton("Edit Clipboard", self.clipboard_section)
+        # Create the list of clipboard strings and the sequence mode selector
+        self.sequence_editor = RibsSequenceEditor(self.clipboard_section)
+        self.sequence_editor.changed.connect(self._on_sequence_changed)
 
-        # Create checkbox row widgets
-        self.seq_2_checkbox_label = RibsLabel("Enable sequential clipboard? ⓘ", "display", self.clipboard_section,
-                                             display_tooltip="Store two things in clipboard. Paste them sequentially.")
-        self.seq_2_checkbox = RibsCheckbox("", False, self.clipboard_section)  # Empty text, unchecked by default
-        # Connect checkbox to control button clickability
-        self.seq_2_checkbox.stateChanged.connect(self._on_seq_2_checkbox_changed)
-
-        # Create sequential clipboard row widgets
-        self.add_seq_2_clipboard = RibsLabel("Add sequential clipboard data:", "display", self.clipboard_section)
-        self.edit_seq_2_clipboard = RibsButton("Edit clipboard", clickable=False, parent=self.clipboard_section)
-
-        # Create updated_icon QLabel with SVG (for seq1)
-        self.updated_icon_seq1 = QLabel()
-        self.updated_icon_seq1.setFixedHeight(30)  # Match height of edit buttons
+        # Create updated_icon QLabel with SVG (for tooltip)
+        self.updated_icon_tooltip = QLabel()
+        self.updated_icon_tooltip.setFixedHeight(30)  # Match height of edit buttons
         renderer = QSvgRenderer("assets/updated.svg")
         size = QSize(30, 30)
         pixmap = QPixmap(size)
@@ -147,81 +135,24 @@ class RadialInterfaceButtonSettings(QWidget):
         painter = QPainter(pixmap)
         renderer.render(painter, QRectF(0, 0, size.width(), size.height()))
         painter.end()
-        self.updated_icon_seq1.setPixmap(pixmap)
-
-        # Create updated_icon for seq2
-        self.updated_icon_seq2 = QLabel()
-        self.updated_icon_seq2.setFixedHeight(30)
-        pixmap2 = QPixmap(size)
-        pixmap2.fill(Qt.transparent)
-        painter2 = QPainter(pixmap2)
-        renderer.render(painter2, QRectF(0, 0, size.width(), size.height()))
-        painter2.end()
-        self.updated_icon_seq2.setPixmap(pixmap2)
-
-        # Create updated_icon for tooltip
-        self.updated_icon_tooltip = QLabel()
-        self.updated_icon_tooltip.setFixedHeight(30)
-        pixmap3 = QPixmap(size)
-        pixmap3.fill(Qt.transparent)
-        painter3 = QPainter(pixmap3)
-        renderer.render(painter3, QRectF(0, 0, size.width(), size.height()))
-        painter3.end()
-        self.updated_icon_tooltip.setPixmap(pixmap3)
-
-        # Initially hide the icons since no data is saved yet
-        self.updated_icon_seq1.hide()
-        self.updated_icon_seq2.hide()
+        self.updated_icon_tooltip.setPixmap(pixmap)
+
+        # Initially hide the icon since no data is saved yet
         self.updated_icon_tooltip.hide()
 
         # Layout for the clipboard section
         section_layout = QVBoxLayout(self.clipboard_section)
         section_layout.addWidget(self.clipboard_label, alignment=Qt.AlignCenter)
-
-        # Horizontal layout for the label and button (first row)
-        controls_layout = QHBoxLayout()
-        controls_layout.addWidget(self.add_seq_1_clipboard)
-        controls_layout.addStretch()  # Push to the right
-        controls_layout.addWidget(self.updated_icon_seq1)
-        controls_layout.addWidget(self.edit_seq_1_clipboard)
-        section_layout.addLayout(controls_layout)
-
-        # Horizontal layout for the checkbox label and checkbox (second row)
-        checkbox_layout = QHBoxLayout()
-        checkbox_layout.addWidget(self.seq_2_checkbox_label)
-        checkbox_layout.addStretch()  # Push checkbox to the right
-        checkbox_layout.addWidget(self.seq_2_checkbox)
-        section_layout.addLayout(checkbox_layout)
-
-        # Horizontal layout for sequential clipboard widgets (third row)
-        sequential_layout = QHBoxLayout()
-        sequential_layout.addWidget(self.add_seq_2_clipboard)
-        sequential_layout.addStretch()  # Push to the right
-        sequential_layout.addWidget(self.updated_icon_seq2)
-        sequential_layout.addWidget(self.edit_seq_2_clipboard)
-        section_layout.addLayout(sequential_layout)
+        section_layout.addWidget(self.sequence_editor)
+        self._update_clipboard_section_height()
 
         # Add clipboard section to main layout at the top
         layout.addWidget(self.clipboard_section)
 
-        # Instantiate the clipboard editors
-        self.seq_1_clipboard_editor = RibsClipboardEditor(parent=self)
-        self.seq_2_clipboard_editor = RibsClipboardEditor(parent=self, window_title="Sequence 2 Clipboard Editor")
-
-        # Create instance variables for temporary data storage from clipboard editors and tooltip editor
-        self.seq_1_data = None
-        self.seq_2_data = None
+        # Create instance variables for temporary data storage from tooltip editor
         self.tooltip_data = None
         self.label_data = None
 
-        # Connect clipboard editors data_saved signals to store data
-        self.seq_1_clipboard_editor.data_saved.connect(self._on_seq_1_data_saved)
-        self.seq_2_clipboard_editor.data_saved.connect(self._on_seq_2_data_saved)
-
-        # Connect button click signals to open clipboard editors
-        self.edit_seq_1_clipboard.clicked.connect(self._on_edit_seq_1_clipboard_clicked)
-        self.edit_seq_2_clipboard.clicked.connect(self._on_edit_seq_2_clipboard_clicked)
-
         # Create button label section underneath clipboard_section
         self.btn_label_section = QWidget(self)
         # Start with smaller height since emoji widgets are initially hidden
@@ -426,13 +357,17 @@ class RadialInterfaceButtonSettings(QWidget):
         self.raise_()
         self.activateWindow()
 
-    def _on_seq_2_checkbox_changed(self, state):
+    def _on_sequence_changed(self):
         """
-        Handle seq_2_checkbox state changes to control edit_seq_2_clipboard clickability.
+        Handle sequence_editor changes: resize the clipboard section to its
+        rows and refresh the save button.
         """
-        # state ==  2 means checked (Qt.CheckState.Checked), state == 0 means unchecked
-        is_checked = state == 2  # 2 is Qt.CheckState.Checked value
-        self.edit_seq_2_clipboard.set_clickable(is_checked)
+        self._update_clipboard_section_height()
+        self._update_save_button_clickability()
+
+    def _update_clipboard_section_height(self):
+        """Fit clipboard_section to the title, one row per string and the controls row."""
+        self.clipboard_section.setFixedHeight(70 + ROW_HEIGHT * (self.sequence_editor.row_count() + 1))
 
     def _on_char_radio_toggled(self, checked):
         """
@@ -510,9 +445,7 @@ class RadialInterfaceButtonSettings(QWidget):
             # Clipboard radio was just checked - ensure expand is unchecked
             self.rib_radio_select_expand.setChecked(False)
             # Enable clipboard widgets
-            self.edit_seq_1_clipboard.set_clickable(True)
-            self.seq_2_checkbox.set_clickable(True)
-            self.edit_seq_2_clipboard.set_clickable(False)
+            self.sequence_editor.set_clickable(True)
         self._update_save_button_clickability()
 
     def _on_expand_radio_toggled(self, checked):
@@ -524,33 +457,11 @@ class RadialInterfaceButtonSettings(QWidget):
             # Expand radio was just checked - ensure clipboard is unchecked
             self.rib_radio_select_clipboard.setChecked(False)
             # Disable clipboard widgets
-            self.edit_seq_1_clipboard.set_clickable(False)
-            self.seq_2_checkbox.set_clickable(False)
-            self.edit_seq_2_clipboard.set_clickable(False)
+            self.sequence_editor.set_clickable(False)
             # Clear clipboard data when switching to expand mode
-            self.seq_1_data = None
-            self.seq_2_data = None
-            # Hide updated icons as data is cleared
-            self.updated_icon_seq1.hide()
-            self.updated_icon_seq2.hide()
+            self.sequence_editor.clear()
         self._update_save_button_clickability()
 
-    def _on_edit_seq_1_clipboard_clicked(self):
-        """
-        Handle edit_seq_1_clipboard button click to open seq_1_clipboard_editor.
-        """
-        self.seq_1_clipboard_editor.show()
-        self.seq_1_clipboard_editor.raise_()
-        self.seq_1_clipboard_editor.activateWindow()
-
-    def _on_edit_seq_2_clipboard_clicked(self):
-        """
-        Handle edit_seq_2_clipboard button click to open seq_2_clipboard_editor.
-        """
-        self.seq_2_clipboard_editor.show()
-        self.seq_2_clipboard_editor.raise_()
-        self.seq_2_clipboard_editor.activateWindow()
-
     def _on_emoji_selected(self, emoji_symbol: str):
         """
         Handle emoji selection from the emoji picker.
@@ -576,30 +487,6 @@ class RadialInterfaceButtonSettings(QWidget):
         self.emoji_symbol_picker.raise_()
         self.emoji_symbol_picker.activateWindow()
 
-    def _on_seq_1_data_saved(self, data):
-        """
-        Store data temporarily in seq_1_data when seq_1_clipboard_editor saves.
-        Show/hide updated_icon_seq1 based on data presence.
-        """
-        self.seq_1_data = data
-        if data:
-            self.updated_icon_seq1.show()
-        else:
-            self.updated_icon_seq1.hide()
-        self._update_save_button_clickability()
-
-    def _on_seq_2_data_saved(self, data):
-        """
-        Store data temporarily in seq_2_data when seq_2_clipboard_editor saves.
-        Show/hide updated_icon_seq2 based on data presence.
-        """
-        self.seq_2_data = data
-        if data:
-            self.updated_icon_seq2.show()
-        else:
-            self.updated_icon_seq2.hide()
-        self._update_save_button_clickability()
-
     def _on_tooltip_saved(self, data):
         """
         Store data temporarily in tooltip_data when rib_tooltip_editor saves.
@@ -622,10 +509,12 @@ class RadialInterfaceButtonSettings(QWidget):
 
         Clipboard data is stored as a list:
           - ["seq1 content"]               → single clipboard item
-          - ["seq1 content", "seq2 content"] → sequential clipboard (two items)
+          - ["seq1 content", "seq2 content", ...] → sequential clipboard
           - []                             → expand-type button (no clipboard data)
+
+        Sequential clipboard buttons also store the selected ``sequence_mode``.
         """
-        config = PasteWheelConfig()
+        config = PasteWheelConfig.shared()
 
         # Determine button type
         is_clipboard = self.rib_radio_select_clipboard.isChecked()
@@ -667,11 +556,7 @@ class RadialInterfaceButtonSettings(QWidget):
 
         # Build clipboard list
         if is_clipboard:
-            clipboard = [self.seq_1_data]
-            if (self.seq_2_checkbox.isChecked()
-                    and self.seq_2_data is not None
-                    and self.seq_2_data.strip() != ""):
-                clipboard.append(self.seq_2_data)
+            clipboard = self.sequence_editor.items()
         else:
             clipboard = []
 
@@ -687,6 +572,9 @@ class RadialInterfaceButtonSettings(QWidget):
         # Include parent_id for layer 2/3 child buttons
         if self.parent_id is not None:
             button_data["parent_id"] = self.parent_id
+        # Sequence mode only matters with more than one string
+        if len(clipboard) > 1:
+            button_data["sequence_mode"] = self.sequence_editor.mode()
 
         # Persist to pastewheel_config.json
         config.add_button(button_data)
@@ -694,12 +582,9 @@ class RadialInterfaceButtonSettings(QWidget):
             DebugLogger.log(f"Button saved: {button_data}")
 
         # Reset temporary state and hide update icons
-        self.seq_1_data = None
-        self.seq_2_data = None
+        self.sequence_editor.clear()
         self.tooltip_data = None
         self.label_data = None
-        self.updated_icon_seq1.hide()
-        self.updated_icon_seq2.hide()
         self.updated_icon_tooltip.hide()
 
         # Notify listeners (e.g. ButtonTab) that a button was saved so they
@@ -713,12 +598,9 @@ class RadialInterfaceButtonSettings(QWidget):
         """
         Clear temporary data when the window is closed and hide icons.
         """
-        self.seq_1_data = None
-        self.seq_2_data = None
+        self.sequence_editor.clear()
         self.tooltip_data = None
         self.label_data = None
-        self.updated_icon_seq1.hide()
-        self.updated_icon_seq2.hide()
         self.updated_icon_tooltip.hide()
         super().closeEvent(event)
 
@@ -750,7 +632,7 @@ class RadialInterfaceButtonSettings(QWidget):
         if not self.button_id:
             return
 
-        config = PasteWheelConfig()
+        config = PasteWheelConfig.shared()
         button_data = config.get_button(self.button_id)
         if button_data is None:
             return
@@ -773,23 +655,9 @@ class RadialInterfaceButtonSettings(QWidget):
             self.label_data = label
 
         # ── Clipboard data ───────────────────────────────────────────────
-        clipboard = button_data.get("clipboard", [])
+        clipboard = PasteWheelConfig.shared().get_button_clipboard(button_data.get("id"))
         if clipboard and button_type == "clip":
-            seq1 = clipboard[0] if len(clipboard) > 0 else None
-            seq2 = clipboard[1] if len(clipboard) > 1 else None
-
-            if seq1:
-                self.seq_1_data = seq1
-                self.seq_1_clipboard_editor.ribs_clipboard_input.setPlainText(seq1)
-                self.updated_icon_seq1.show()
-
-            if seq2:
-                self.seq_2_data = seq2
-                self.seq_2_clipboard_editor.ribs_clipboard_input.setPlainText(seq2)
-                # Checking the checkbox enables the seq-2 edit button via
-                # _on_seq_2_checkbox_changed.
-                self.seq_2_checkbox.setChecked(True)
-                self.updated_icon_seq2.show()
+            self.sequence_editor.set_items(clipboard, button_data.get("sequence_mode"))
 
         # ── Tooltip ──────────────────────────────────────────────────────
         tooltip = button_data.get("tooltip", "")
@@ -830,17 +698,17 @@ class RadialInterfaceButtonSettings(QWidget):
     def _update_save_button_clickability(self):
         """
         Update the save button's clickability based on current state.
-        Requires label_data to have value; for clipboard mode also requires seq_1 or seq_2 data.
+        Requires label_data to have value; for clipboard mode also requires at least one string.
         """
         label_has_value = self.label_data is not None and self.label_data.strip() != ""
         is_clipboard = self.rib_radio_select_clipboard.isChecked()
-        seq_has_value = (self.seq_1_data is not None and self.seq_1_data.strip() != "") or (self.seq_2_data is not None and self.seq_2_data.strip() != "")
+        seq_has_value = bool(self.sequence_editor.items())
 
         # label_data is ALWAYS required
         if not label_has_value:
             self.save_button.set_clickable(False)
         elif is_clipboard:
-            # In clipboard mode, also need seq_1_data and/or seq_2_data
+            # In clipboard mode, also need at least one clipboard string
             self.save_button.set_clickable(seq_has_value)
         else:  # expand mode
             # In expand mode, label_data is sufficient
@@ -0,0 +1,223 @@
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox
+from PyQt5.QtCore import Qt, pyqtSignal, QSize, QRectF
+from PyQt5.QtSvg import QSvgRenderer
+from PyQt5.QtGui import QPixmap, QPainter
+from theme import Theme
+from radial_interface.paste_controller import SEQUENCE_MODES, DEFAULT_SEQUENCE_MODE
+from radial_interface_button_settings.ribs_button import RibsButton
+from radial_interface_button_settings.ribs_label import RibsLabel
+from radial_interface_button_settings.ribs_clipboard_editor import RibsClipboardEditor
+
+# Height of one string row, used to size the surrounding section
+ROW_HEIGHT = 36
+
+
+class RibsSequenceEditor(QWidget):
+    """
+    Editable list of the strings a clipboard button pastes, plus its
+    sequence mode.
+
+    Each string has its own row (label, updated icon, edit and remove
+    buttons) and its own RibsClipboardEditor window.  "Add string" appends
+    an empty row; rows whose editor was never saved are not part of
+    :meth:`items`.  The mode selector is only clickable while there is
+    more than one string.
+    """
+
+    # Emitted whenever a string, the row count or the mode changes
+    changed = pyqtSignal()
+
+    def __init__(self, parent=None):
+        """
+        Initialize the RibsSequenceEditor.
+
+        Args:
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        self.clickable = True
+        self._rows = []   # dicts: widget, label, icon, edit_btn, remove_btn, editor, data
+
+        # Get theme colors
+        theme = Theme()
+        self.colors = theme.get_colors()
+
+        # Render the updated icon once; every row shows a copy of it
+        renderer = QSvgRenderer("assets/updated.svg")
+        size = QSize(30, 30)
+        self._updated_pixmap = QPixmap(size)
+        self._updated_pixmap.fill(Qt.transparent)
+        painter = QPainter(self._updated_pixmap)
+        renderer.render(painter, QRectF(0, 0, size.width(), size.height()))
+        painter.end()
+
+        self.initUI()
+
+    def initUI(self):
+        """Initialize the RibsSequenceEditor UI."""
+        self.layout = QVBoxLayout(self)
+        self.layout.setContentsMargins(0, 0, 0, 0)
+
+        # One row per string
+        self.rows_layout = QVBoxLayout()
+        self.layout.addLayout(self.rows_layout)
+
+        # Add-string and sequence-mode row
+        controls_layout = QHBoxLayout()
+        self.add_string_btn = RibsButton("Add string", self)
+        self.add_string_btn.clicked.connect(self._on_add_string_clicked)
+        self.mode_label = RibsLabel("Sequence mode ⓘ", "display", self,
+                                    display_tooltip="cycle: 1 → 2 → … → last → 1"
+                                    "\nstop: 1 → 2 → … → last, then keeps pasting the last"
+                                    "\npingpong: 1 → 2 → … → last → … → 2 → 1")
+        self.mode_selector = QComboBox(self)
+        self.mode_selector.addItems(SEQUENCE_MODES)
+        self.mode_selector.setCurrentText(DEFAULT_SEQUENCE_MODE)
+        self.mode_selector.currentTextChanged.connect(lambda _: self.changed.emit())
+        controls_layout.addWidget(self.add_string_btn)
+        controls_layout.addStretch()
+        controls_layout.addWidget(self.mode_label)
+        controls_layout.addWidget(self.mode_selector)
+        self.layout.addLayout(controls_layout)
+
+        self._add_row()
+
+    def row_count(self):
+        """Return the number of string rows (saved or not)."""
+        return len(self._rows)
+
+    def items(self):
+        """Return the saved, non-blank strings in row order."""
+        return [row["data"] for row in self._rows if row["data"] and row["data"].strip()]
+
+    def mode(self):
+        """Return the selected sequence mode."""
+        return self.mode_selector.currentText()
+
+    def set_items(self, strings, mode=None):
+        """
+        Replace every row with one row per string of *strings*.
+
+        Args:
+            strings: Strings to edit (an empty list leaves one empty row).
+            mode:    Sequence mode to select (default: DEFAULT_SEQUENCE_MODE).
+        """
+        self._remove_all_rows()
+        for text in strings:
+            row = self._add_row()
+            row["editor"].ribs_clipboard_input.setPlainText(text)
+            self._set_row_data(row, text)
+        if not self._rows:
+            self._add_row()
+        self.mode_selector.setCurrentText(mode if mode in SEQUENCE_MODES else DEFAULT_SEQUENCE_MODE)
+        self._update_clickability()
+        self.changed.emit()
+
+    def clear(self):
+        """Drop every string and reset the mode."""
+        self.set_items([])
+
+    def set_clickable(self, clickable):
+        """
+        Dynamically set the clickability of every row and control.
+
+        Args:
+            clickable: Boolean indicating if the editor should be clickable
+        """
+        self.clickable = clickable
+        self._update_clickability()
+
+    def _add_row(self):
+        """Append an empty string row and return it."""
+        row = {"data": None}
+        row["widget"] = QWidget(self)
+        row["widget"].setFixedHeight(ROW_HEIGHT)
+        row_layout = QHBoxLayout(row["widget"])
+        row_layout.setContentsMargins(0, 0, 0, 0)
+
+        row["label"] = RibsLabel("", "display", row["widget"])
+        row["icon"] = QLabel(row["widget"])
+        row["icon"].setFixedHeight(30)  # Match height of edit buttons
+        row["icon"].setPixmap(self._updated_pixmap)
+        row["icon"].hide()
+        row["edit_btn"] = RibsButton("Edit", parent=row["widget"])
+        row["remove_btn"] = RibsButton("✕", parent=row["widget"])
+        row["editor"] = RibsClipboardEditor(parent=self)
+
+        row_layout.addWidget(row["label"])
+        row_layout.addStretch()  # Push to the right
+        row_layout.addWidget(row["icon"])
+        row_layout.addWidget(row["edit_btn"])
+        row_layout.addWidget(row["remove_btn"])
+
+        row["editor"].data_saved.connect(lambda data, row=row: self._on_row_data_saved(row, data))
+        row["edit_btn"].clicked.connect(lambda _, row=row: self._on_row_edit_clicked(row))
+        row["remove_btn"].clicked.connect(lambda _, row=row: self._on_row_remove_clicked(row))
+
+        self._rows.append(row)
+        self.rows_layout.addWidget(row["widget"])
+        self._renumber_rows()
+        self._update_clickability()
+        return row
+
+    def _remove_row(self, row):
+        """Remove *row* and close its editor."""
+        self._rows.remove(row)
+        self.rows_layout.removeWidget(row["widget"])
+        row["editor"].close()
+        row["editor"].deleteLater()
+        row["widget"].deleteLater()
+
+    def _remove_all_rows(self):
+        for row in list(self._rows):
+            self._remove_row(row)
+
+    def _renumber_rows(self):
+        """Relabel the rows after one was added or removed."""
+        for number, row in enumerate(self._rows, start=1):
+            row["label"].widget.setText(f"String {number}:")
+            row["editor"].setWindowTitle(f"String {number} Clipboard Editor")
+
+    def _set_row_data(self, row, data):
+        """Store *data* in *row* and show/hide its updated icon."""
+        row["data"] = data
+        if data:
+            row["icon"].show()
+        else:
+            row["icon"].hide()
+
+    def _update_clickability(self):
+        """Sync the row buttons and the mode selector with the current state."""
+        for row in self._rows:
+            row["edit_btn"].set_clickable(self.clickable)
+            # The last row cannot be removed; it is cleared instead
+            row["remove_btn"].set_clickable(self.clickable and len(self._rows) > 1)
+        self.add_string_btn.set_clickable(self.clickable)
+        self.mode_selector.setEnabled(self.clickable and len(self._rows) > 1)
+
+    def _on_add_string_clicked(self):
+        """Append a row and open its editor."""
+        self._on_row_edit_clicked(self._add_row())
+        self.changed.emit()
+
+    def _on_row_edit_clicked(self, row):
+        """Open the clipboard editor of *row*."""
+        row["editor"].show()
+        row["editor"].raise_()
+        row["editor"].activateWindow()
+
+    def _on_row_remove_clicked(self, row):
+        """Remove *row* (kept as an empty row when it is the only one)."""
+        if len(self._rows) > 1:
+            self._remove_row(row)
+            self._renumber_rows()
+            self._update_clickability()
+        else:
+            row["editor"].ribs_clipboard_input.clear()
+            self._set_row_data(row, None)
+        self.changed.emit()
+
+    def _on_row_data_saved(self, row, data):
+        """Store the text saved in *row*'s editor."""
+        self._set_row_data(row, data)
+        self.changed.emit()
@@ -108,7 +108,7 @@ class RadialInterfaceSettings(QWidget):
         # Get config to determine layer unlock conditions:
         # Layer 2 unlocks when Layer 1 has at least one expand-type button.
         # Layer 3 unlocks when Layer 2 has at least one expand-type button.
-        config = PasteWheelConfig()
+        config = PasteWheelConfig.shared()
         layer_2_unlocked = config.has_expand_button_in_layer(1)
         layer_3_unlocked = config.has_expand_button_in_layer(2)
 
@@ -209,7 +209,7 @@ class RadialInterfaceSettings(QWidget):
             messages (e.g. "No expand buttons found") are replaced with
             current data.
         """
-        config = PasteWheelConfig()
+        config = PasteWheelConfig.shared()
         layer_2_unlocked = config.has_expand_button_in_layer(1)
         layer_3_unlocked = config.has_expand_button_in_layer(2)
 
@@ -18,7 +18,7 @@ CLIPBOARD_ICON_PATH = "assets/clipboard_icon.svg"
 EXPAND_ICON_PATH    = "assets/expand_icon.svg"
 
 # Maximum number of buttons allowed per layer (per-parent for layers 2 and 3)
-LAYER_MAX_BUTTONS = {1: 8, 2: 16, 3: 24}
+LAYER_MAX_BUTTONS = PasteWheelConfig.LAYER_MAX_BUTTONS
 
 # 8 accent colors for the 8 possible parent expand buttons — one palette per theme.
 # Light mode: medium-dark, readable on white/light backgrounds.
@@ -245,7 +245,7 @@ class ButtonTab(QWidget):
 
     def _populate_layer1(self):
         """Populate the Layer 1 tab (original behaviour)."""
-        config = PasteWheelConfig()
+        config = PasteWheelConfig.shared()
         layer_buttons = config.get_buttons_by_layer(1) or []
         max_buttons = LAYER_MAX_BUTTONS.get(1, 8)
 
@@ -274,7 +274,7 @@ class ButtonTab(QWidget):
         Populate a Layer 2 or Layer 3 tab with color-coded sections,
         one section per expand button in the parent layer.
         """
-        config = PasteWheelConfig()
+        config = PasteWheelConfig.shared()
         parent_layer = self.layer - 1
         expand_buttons = config.get_expand_buttons_by_layer(parent_layer)
         max_children = LAYER_MAX_BUTTONS.get(self.layer, 16)
@@ -404,7 +404,8 @@ class ButtonTab(QWidget):
     def on_delete_button_clicked(self, button_id):
         """
         Handle a Delete button click event.
-        Removes the button from pastewheel_config.json and refreshes the tab.
+        Removes the button (and, for expand buttons, all of its descendants)
+        from pastewheel_config.json in a single write and refreshes the tab.
         Also notifies the parent settings window to re-evaluate layer lock states
         (e.g. deleting a Layer-1 expand button should lock the Layer-2 tab).
 
@@ -413,10 +414,10 @@ class ButtonTab(QWidget):
         """
         if DEBUG:
             DebugLogger.log(f"on_delete_button_clicked called for button_id={button_id}")
-        config = PasteWheelConfig()
-        removed = config.remove_button(button_id)
+        config = PasteWheelConfig.shared()
+        removed = config.remove_button_tree(button_id)
         if DEBUG:
-            DebugLogger.log(f"remove_button({button_id}) returned {removed}")
+            DebugLogger.log(f"remove_button_tree({button_id}) removed {removed} button(s)")
         self._refresh()
         # Re-evaluate tab lock states in the parent settings window so that
         # removing an expand button locks the dependent layer tab immediately.
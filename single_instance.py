@@ -0,0 +1,270 @@
+"""
+Single-instance guard for PasteWheel over a local socket.
+
+The first PasteWheel process listens on a per-user QLocalServer.  Later
+launches connect to it, forward their command and exit without building a
+QApplication or importing the widget modules, so relaunching from a hotkey
+tool or a shortcut costs a few milliseconds instead of a cold start, and
+only one process ever writes the configuration.
+
+Protocol: newline-delimited JSON.  Each request is an object with a
+``"command"`` key plus command-specific arguments; the server answers every
+request, in order, with one object of the form ``{"ok": true, ...}`` or
+``{"ok": false, "error": "..."}``.  Several requests may be written on one
+connection without waiting for their replies.
+"""
+import getpass
+import json
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtNetwork import QAbstractSocket, QLocalServer, QLocalSocket
+from debug_logger import DebugLogger
+
+# Set to True to enable debug logging to debug.txt
+DEBUG = False
+
+
+def server_name():
+    """Return the local socket name, unique per user."""
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = "default"
+    return f"pastewheel-{user}"
+
+
+def encode_message(message):
+    """Serialize one protocol message to a JSON line."""
+    return (json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def decode_message(line):
+    """
+    Parse one protocol line.
+
+    Raises:
+        ValueError: If the line is not a JSON object.
+    """
+    message = json.loads(line.decode("utf-8"))
+    if not isinstance(message, dict):
+        raise ValueError("Message must be a JSON object")
+    return message
+
+
+class InstanceClient:
+    """
+    Blocking client for a running PasteWheel instance.
+
+    Args:
+        name:       Local socket name (defaults to :func:`server_name`).
+        timeout_ms: Timeout for connecting and for each reply.
+    """
+
+    def __init__(self, name=None, timeout_ms=1000):
+        self.name = name or server_name()
+        self.timeout_ms = timeout_ms
+        self._socket = None
+        self._buffer = b""
+
+    def connect(self, timeout_ms=None):
+        """
+        Connect to the running instance.
+
+        Returns:
+            True if an instance accepted the connection, False otherwise
+        """
+        self._socket = QLocalSocket()
+        self._socket.connectToServer(self.name)
+        if self._socket.waitForConnected(self.timeout_ms if timeout_ms is None else timeout_ms):
+            return True
+        self._socket = None
+        return False
+
+    def close(self):
+        if self._socket is not None:
+            self._socket.disconnectFromServer()
+            self._socket = None
+
+    def send(self, message):
+        """Write one request without waiting for its reply."""
+        self._socket.write(encode_message(message))
+
+    def receive(self):
+        """
+        Wait for the next reply.
+
+        Raises:
+            IOError: If the instance does not answer within the timeout.
+        """
+        while b"\n" not in self._buffer:
+            self._socket.flush()
+            if not self._socket.waitForReadyRead(self.timeout_ms):
+                raise IOError("No reply from the running PasteWheel instance")
+            self._buffer += bytes(self._socket.readAll())
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return decode_message(line)
+
+    def request(self, message):
+        """Send one request and return its reply."""
+        self.send(message)
+        return self.receive()
+
+    def request_many(self, messages):
+        """
+        Pipeline several requests: write them all, then read the replies.
+
+        Returns:
+            List of replies, in request order
+        """
+        for message in messages:
+            self.send(message)
+        return [self.receive() for _ in messages]
+
+
+# Returned by send_command() when an instance accepted the connection but
+# did not answer: it is running (busy), so no second instance may start.
+NO_REPLY = "no-reply"
+
+
+def send_command(command, timeout_ms=250, attempts=4, **arguments):
+    """
+    Forward *command* to a running instance, if there is one.
+
+    An instance that accepts the connection but is too busy to answer
+    within *timeout_ms* is asked again, waiting twice as long each time.
+
+    Args:
+        command:    Command name (e.g. "show", "settings", "reload").
+        timeout_ms: How long to wait for a connection and the first reply.
+        attempts:   How often to send the command to a busy instance.
+        **arguments: Extra request fields.
+
+    Returns:
+        The reply dict, None if no instance is running, or :data:`NO_REPLY`
+        if an instance is running but never answered
+    """
+    for attempt in range(attempts):
+        client = InstanceClient(timeout_ms=timeout_ms << attempt)
+        if not client.connect(timeout_ms):
+            return None
+        try:
+            return client.request(dict(arguments, command=command))
+        except IOError:
+            pass
+        finally:
+            client.close()
+    return NO_REPLY
+
+
+def instance_running(name=None, timeout_ms=250):
+    """Return True if an instance accepts connections on *name*."""
+    client = InstanceClient(name, timeout_ms)
+    if client.connect():
+        client.close()
+        return True
+    return False
+
+
+class SingleInstanceServer(QObject):
+    """
+    Listens for commands from later launches.
+
+    Register a handler per command with :meth:`register`.  A handler is
+    called on the GUI thread with the request dict and may return a dict
+    of extra reply fields; raising ValueError or KeyError reports the
+    error to the client.
+
+    Args:
+        name:   Local socket name (defaults to :func:`server_name`).
+        parent: Optional QObject parent.
+    """
+
+    # Emitted after a command was handled: (command, request)
+    command_received = pyqtSignal(str, dict)
+
+    def __init__(self, name=None, parent=None):
+        super().__init__(parent)
+        self.name = name or server_name()
+        self._handlers = {}
+        self._buffers = {}
+        self._server = QLocalServer(self)
+        self._server.newConnection.connect(self._on_new_connection)
+
+    def register(self, command, handler):
+        """Call *handler(request)* for requests naming *command*."""
+        self._handlers[command] = handler
+
+    def listen(self):
+        """
+        Start listening.
+
+        The socket is taken first, so of two simultaneous launches only one
+        can win.  Only if the name is in use and nothing answers on it (a
+        socket left behind by a crashed instance) is it removed and the
+        listen retried once; a socket that accepts connections belongs to a
+        live instance and is left alone.
+
+        Returns:
+            True if the server is listening, False otherwise
+        """
+        if self._server.listen(self.name):
+            return True
+        if (self._server.serverError() == QAbstractSocket.AddressInUseError
+                and not instance_running(self.name)):
+            QLocalServer.removeServer(self.name)
+            if self._server.listen(self.name):
+                return True
+        if DEBUG:
+            DebugLogger.log(f"Cannot listen on {self.name}: {self._server.errorString()}")
+        return False
+
+    def close(self):
+        self._server.close()
+
+    def _on_new_connection(self):
+        while self._server.hasPendingConnections():
+            socket = self._server.nextPendingConnection()
+            self._buffers[socket] = b""
+            socket.readyRead.connect(lambda s=socket: self._on_ready_read(s))
+            socket.disconnected.connect(lambda s=socket: self._on_disconnected(s))
+            # Data may have arrived before readyRead was connected
+            if socket.bytesAvailable():
+                self._on_ready_read(socket)
+
+    def _on_disconnected(self, socket):
+        self._buffers.pop(socket, None)
+        socket.deleteLater()
+
+    def _on_ready_read(self, socket):
+        if socket not in self._buffers:
+            return
+        buffer = self._buffers[socket] + bytes(socket.readAll())
+        *lines, self._buffers[socket] = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                socket.write(encode_message(self._handle(line)))
+        socket.flush()
+
+    def _handle(self, line):
+        """Dispatch one request line and return the reply dict."""
+        command = None
+        try:
+            request = decode_message(line)
+            command = request.get("command")
+            handler = self._handlers.get(command)
+            if handler is None:
+                raise ValueError(f"Unknown command: {command!r}")
+            reply = {"ok": True}
+            reply.update(handler(request) or {})
+        except (ValueError, KeyError) as e:
+            # KeyError's str() quotes its message
+            return {"ok": False, "error": str(e.args[0]) if e.args else type(e).__name__}
+        except (Exception, SystemExit) as e:
+            # An exception escaping the readyRead slot would abort the
+            # resident instance; report it to the client instead.
+            if DEBUG:
+                DebugLogger.log(f"Instance command {command!r} failed: {e!r}")
+            return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        if DEBUG:
+            DebugLogger.log(f"Handled instance command {command!r}")
+        self.command_received.emit(command, request)
+        return reply
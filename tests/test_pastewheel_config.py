@@ -0,0 +1,42 @@
+import json
+import time
+
+import pytest
+
+from pastewheel_config import PasteWheelConfig
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    path = tmp_path / "pastewheel_config.json"
+    path.write_text(json.dumps({"theme": "light", "buttons": []}), encoding="utf-8")
+    monkeypatch.setattr(PasteWheelConfig, "CONFIG_FILE", str(path))
+    monkeypatch.setattr(PasteWheelConfig, "STAT_CHECK_INTERVAL", 0.2)
+    monkeypatch.setattr(PasteWheelConfig, "disk_reads", 0)
+    monkeypatch.setattr(PasteWheelConfig, "_shared_instance", None)
+    return path
+
+
+def test_shared_reads_the_file_once(config_file):
+    config = PasteWheelConfig.shared()
+    for _ in range(100):
+        assert PasteWheelConfig.shared() is config
+    time.sleep(PasteWheelConfig.STAT_CHECK_INTERVAL * 2)
+    assert PasteWheelConfig.shared() is config
+    assert PasteWheelConfig.disk_reads == 1
+
+
+def test_shared_picks_up_a_foreign_write(config_file):
+    config = PasteWheelConfig.shared()
+    assert PasteWheelConfig.shared() is config
+    assert config.get("theme") == "light"
+
+    config_file.write_text(json.dumps({"theme": "dark", "buttons": []}) + "\n", encoding="utf-8")
+    # Within the stat interval the change is not noticed yet
+    PasteWheelConfig.shared()
+    assert PasteWheelConfig.disk_reads == 1
+
+    time.sleep(PasteWheelConfig.STAT_CHECK_INTERVAL * 2)
+    assert PasteWheelConfig.shared() is config
+    assert PasteWheelConfig.disk_reads == 2
+    assert config.get("theme") == "dark"
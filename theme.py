@@ -1,9 +1,10 @@
 from pastewheel_config import PasteWheelConfig
+from config_events import THEME_CHANGED, CONFIG_RELOADED
 
 
 class Theme:
     # Initialize config manager
-    _config = PasteWheelConfig()
+    _config = PasteWheelConfig.shared()
     MODE = _config.get_theme()  # Class variable for theme mode - loaded from config
     
     def __init__(self):
@@ -78,3 +79,13 @@ class Theme:
     def get_mode(cls):
         """Return the current theme mode."""
         return cls.MODE
+
+
+def _track_theme(events):
+    """Keep Theme.MODE in step with the configuration's theme setting."""
+    for event in events:
+        if event.kind in (THEME_CHANGED, CONFIG_RELOADED):
+            Theme.MODE = Theme._config.get_theme()
+
+
+Theme._config.subscribe(_track_theme)